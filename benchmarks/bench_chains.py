@@ -0,0 +1,31 @@
+"""Times the construction of attribute chains of depth 1 to 10.
+
+Usage: python benchmarks/bench_chains.py
+"""
+from __future__ import print_function
+import timeit
+
+import symboldict as sd
+
+SETUP = "from symboldict import symbol"
+
+def chain(depth):
+    return 'symbol.' + '.'.join('a{}'.format(i) for i in range(depth))
+
+def main(number=100000, repeat=5):
+    print('{:>5} {:>12} {:>12}'.format('depth', 'no cache', 'cached'))
+    for depth in range(1, 11):
+        stmt = chain(depth)
+        times = []
+        for size in (0, 1024):
+            old = sd.set_child_cache(size)
+            try:
+                best = min(timeit.repeat(stmt, SETUP, number=number,
+                                         repeat=repeat))
+            finally:
+                sd.set_child_cache(old)
+            times.append(best / number * 1e9)
+        print('{:>5} {:>9.0f} ns {:>9.0f} ns'.format(depth, *times))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""Compares attribute reads on a SymbolDict and on its frozen snapshot.
+
+Usage: python benchmarks/bench_freeze.py
+"""
+from __future__ import print_function
+import timeit
+
+SETUP = """
+import symboldict as sd
+sy = sd.SymbolDict(isfile='os.path.isfile', join='os.path.join',
+                   Telnet='telnetlib.Telnet', dumps='json.dumps')
+sy.isfile # warm-up, the value is cached in sy.__dict__
+fz = sy.freeze()
+def miss(obj):
+    try:
+        obj.spam
+    except AttributeError:
+        pass
+"""
+
+CASES = [
+    ('SymbolDict hit', 'sy.isfile'),
+    ('frozen hit', 'fz.isfile'),
+    ('SymbolDict miss', 'miss(sy)'),
+    ('frozen miss', 'miss(fz)'),
+]
+
+def main(number=1000000, repeat=5):
+    for name, stmt in CASES:
+        best = min(timeit.repeat(stmt, SETUP, number=number, repeat=repeat))
+        print('{:<16} {:8.1f} ns'.format(name, best / number * 1e9))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Measures the memory used per Symbol with and without path segments.
+
+Usage: python benchmarks/bench_memory.py [count]
+
+The symbols are built from a registry of dotted paths sharing their
+module and attribute names, like the entries of a large SymbolDict.
+Four states are measured:
+
+- baseline: a Symbol with the layout of the versions before the path
+  segments, with the slots ``_path``, ``_has`` and ``_val`` only.
+- path only: the Symbol as built by ``SymbolDict.update()``, before
+  it is resolved or indexed. It adds the slots ``_parts``, ``_stamp``
+  and ``__weakref__`` to the baseline, and replaces ``_has`` and ``_val``
+  by the single slot ``_state``.
+- interned segments: the Symbol after its segments were computed by a
+  resolution or a path index.
+- plain segments: the same tuples built from non-interned strings,
+  showing the memory saved by sharing the segments.
+
+With CPython 3.11 on 64 bits, the results are 152, 168, 249 and 529
+bytes per Symbol, and the baseline class measures the same as the Symbol
+of the baseline commit. The segments are thus a net cost over the
+baseline: 16 bytes for an unresolved Symbol, and 97 bytes for a resolved
+one, mostly for its tuple. A Symbol holding a value also holds its
+``(epoch, value)`` state tuple, 56 more bytes which are not measured
+here. Interning only keeps the cost of the segments far below the one
+of splitting the paths without sharing the strings.
+"""
+from __future__ import print_function
+import gc
+import sys
+import tracemalloc
+
+import symboldict as sd
+
+class BaselineSymbol(object):
+    """The layout of Symbol before the path segments."""
+    __slots__ = ("_path", "_has", "_val")
+
+    def __init__(self, *parts):
+        self._path = '.'.join(str(x) for x in parts if x)
+        self._has = False
+        self._val = False
+
+def paths(count):
+    for i in range(count):
+        yield 'app{}.handlers.mod{}.Handler{}.method{}'.format(
+            i % 10, i % 300, i % 3000, i % 7)
+
+def measure(count, prepare, cls=sd.Symbol):
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    symbols = [cls(p) for p in paths(count)]
+    prepare(symbols)
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return size / count
+
+def nothing(symbols):
+    pass
+
+def interned(symbols):
+    for s in symbols:
+        sd._segments(s)
+
+def plain(symbols):
+    for s in symbols:
+        sd._storparts(s, tuple(sd._readpath(s).split('.')))
+
+def main(count=200000):
+    # the list holding the symbols costs 8 bytes per symbol in each case
+    base = measure(count, nothing, BaselineSymbol)
+    print('{:<18} {:7.1f} bytes/Symbol'.format('baseline', base))
+    for name, prepare in [('path only', nothing),
+                          ('interned segments', interned),
+                          ('plain segments', plain)]:
+        size = measure(count, prepare)
+        print('{:<18} {:7.1f} bytes/Symbol {:+7.1f} vs baseline'.format(
+            name, size, size - base))
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,54 @@
+"""Measures the bulk loading of large registries with SymbolDict.update().
+
+The streaming update is compared with the former implementation, which
+copied the input in a temporary dict and a list of (key, Symbol) pairs.
+
+Usage: python benchmarks/bench_update.py [size ...]
+"""
+from __future__ import print_function
+import sys
+import time
+import tracemalloc
+
+import symboldict as sd
+
+def legacy_update(sy, *args, **kwargs):
+    d = dict()
+    d.update(*args, **kwargs)
+    if sy.strict:
+        if len(d) < len(sd._reserved):
+            b = any(k in sd._reserved for k in d.keys())
+        else:
+            b = any(k in d for k in sd._reserved)
+        if b:
+            raise TypeError('Invalid key for strict SymbolDict')
+    dict.update(sy, [(k, sd.Symbol(v)) for (k, v) in d.items()])
+
+def entries(n):
+    return (('key{}'.format(i), 'pkg.mod{}.attr'.format(i)) for i in range(n))
+
+def measure(update, n):
+    sy = sd.SymbolDict()
+    start = time.perf_counter()
+    update(sy, entries(n))
+    elapsed = time.perf_counter() - start
+    del sy
+    sy = sd.SymbolDict()
+    tracemalloc.start()
+    update(sy, entries(n))
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, peak
+
+def main(sizes):
+    print('{:>9} {:<10} {:>9} {:>10} {:>10} {:>6}'.format(
+        'entries', 'update', 'time (s)', 'final MB', 'peak MB', 'ratio'))
+    for n in sizes:
+        for name, update in [('legacy', legacy_update),
+                             ('streaming', sd.SymbolDict.update)]:
+            elapsed, size, peak = measure(update, n)
+            print('{:>9} {:<10} {:>9.3f} {:>10.1f} {:>10.1f} {:>6.2f}'.format(
+                n, name, elapsed, size / 1e6, peak / 1e6, peak / size))
+
+if __name__ == '__main__':
+    main([int(x) for x in sys.argv[1:]] or [10000, 100000, 1000000])
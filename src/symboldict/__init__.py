@@ -4,11 +4,18 @@
 from __future__ import (absolute_import, division,
                         print_function, unicode_literals)
 
+from collections import OrderedDict
 import functools
 from importlib import import_module
+import os
 import sys
+import threading
+import time
+from . import _hamt
 from .version import __version__
 import warnings
+import weakref
+_ModuleType = type(sys)
 
 def deprecated(func):
     '''This is a decorator which can be used to mark functions
@@ -29,10 +36,11 @@ class VoidValueError(ValueError): pass
 
 if sys.version_info < (3, 4):
     Enum = object
-    _isrule = (0, 1, 2, 3).__contains__
+    _isrule = lambda x: (x in (0, 1, 2, 3, 4, 5)
+                         or isinstance(x, (RetryAfter, ExpireAfter)))
 else:
     from enum import Enum
-    _isrule = lambda x: isinstance(x, Rule)
+    _isrule = lambda x: isinstance(x, (Rule, RetryAfter, ExpireAfter))
 
 class Rule(Enum):
     """Enumerated rules for :meth:`SymbolControl.getvalue()`.
@@ -44,16 +52,81 @@ class Rule(Enum):
         Rule.TRY_LOAD_ONCE
         Rule.TRY_LOAD_EACH
         Rule.FORCE_RELOAD
+        Rule.LAZY_IMPORT
+        Rule.REVALIDATE
     """
     DONT_LOAD = 0
     TRY_LOAD_ONCE = 1
     TRY_LOAD_EACH = 2
     FORCE_RELOAD = 3
+    LAZY_IMPORT = 4
+    REVALIDATE = 5
+
+class RetryAfter(object):
+    """RetryAfter(seconds) -> new rule for :meth:`SymbolControl.getvalue()`
+    
+    Args:
+        seconds(float): the time during which a failed search is not retried.
+    
+    This rule behaves like ``Rule.TRY_LOAD_EACH``, except that after
+    a failed search, the symbol's value is not searched again before
+    the given number of seconds. During this time, the calls fail
+    immediately with a :class:`VoidValueError` whose ``__cause__`` is the
+    exception of the failed search. It is useful to probe optional
+    dependencies repeatedly without importing missing modules each time.
+    
+    Example:
+        >>> retry = RetryAfter(60)
+        >>> s = Symbol('spam.ham')
+        >>> s().hasvalue(retry) # searches the value
+        False
+        >>> s().hasvalue(retry) # doesn't search again
+        False
+    """
+    __slots__ = ('seconds',)
+    
+    def __init__(self, seconds):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+        self.seconds = float(seconds)
+        
+    def __repr__(self):
+        return 'RetryAfter({!r})'.format(self.seconds)
+
+class ExpireAfter(object):
+    """ExpireAfter(seconds) -> new rule for :meth:`SymbolControl.getvalue()`
+    
+    Args:
+        seconds(float): the time during which the result of a search is kept.
+    
+    With this rule, the value of a symbol, or the failure of its search,
+    is kept for the given number of seconds. After this time, the value
+    is searched again from the start without using :data:`resolution_cache`,
+    so that attributes rebound in their module are seen. It is useful
+    for configuration-like attributes that change at runtime.
+    
+    Example:
+        >>> ttl = ExpireAfter(30)
+        >>> s = Symbol('logging.root')
+        >>> s().getvalue(ttl) # searches the value
+        <RootLogger root (WARNING)>
+        >>> s().getvalue(ttl) # doesn't search before 30 seconds
+        <RootLogger root (WARNING)>
+    """
+    __slots__ = ('seconds',)
     
+    def __init__(self, seconds):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+        self.seconds = float(seconds)
+        
+    def __repr__(self):
+        return 'ExpireAfter({!r})'.format(self.seconds)
+
 _DONT = Rule.DONT_LOAD
 _EACH = Rule.TRY_LOAD_EACH
 _FORCE = Rule.FORCE_RELOAD
+_LAZY = Rule.LAZY_IMPORT
 _ONCE = Rule.TRY_LOAD_ONCE
+_REVAL = Rule.REVALIDATE
 
 _DOT = str('.')
 
@@ -86,16 +159,30 @@ class Symbol(object):
     indicated python object by importing modules or accessing attributes.
     This is the role of the :meth:`SymbolControl.getvalue` or
     :meth:`SymbolDict.__getattr__` methods.
+    
+    When interning is enabled by :func:`set_interning()`, constructing
+    a Symbol with the path of a living instance returns that instance,
+    together with the value it may have already loaded.
+    
+    Besides its path, a Symbol stores the tuple of the path's segments,
+    computed when the symbol is first resolved or indexed, and inherited
+    by the symbols created by attribute access. The segments are
+    interned strings shared by all the symbols.
     """
-    __slots__ = ("_path", "_has", "_val")
+    __slots__ = ("_path", "_parts", "_state", "_stamp", "__weakref__")
 
-    def __init__(self, *parts):
-        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+    def __new__(cls, *parts):
         parts = [str(x) for x in parts]
         s = _DOT.join(x for x in parts if x)
-        _storpath(self, s)
-        _storhas(self, False)
-        _storval(self, False) # no failed load
+        if _interning and cls is Symbol:
+            self = _interned.get(s)
+            if self is None:
+                self = _internsymbol(s, _newsymbol(cls, s))
+            return self
+        return _newsymbol(cls, s)
+
+    def __init__(self, *parts):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
 
     def __getattribute__(self, attr):
         """Overridden attribute access creates a new :class:`Symbol`.
@@ -107,7 +194,30 @@ class Symbol(object):
             >>> Symbol('spam').eggs
             Symbol('spam.eggs')
         """
-        return Symbol(Symbol._path.__get__(self), attr)
+        if not attr:
+            return Symbol(_readpath(self))
+        key = (_readpath(self), attr)
+        child = _children.get(key)
+        if child is not None:
+            return child
+        attr = _intern(attr)
+        path = key[0] + _DOT + attr if key[0] else attr
+        if _interning:
+            child = _interned.get(path)
+            if child is not None:
+                return child
+        parts = _readparts(self)
+        if parts is not None and _DOT in attr:
+            parts = None # split lazily by _segments()
+        child = _newsymbol(Symbol, path,
+                           None if parts is None else parts + (attr,))
+        if _interning:
+            return _internsymbol(path, child)
+        if _maxchildren:
+            if len(_children) >= _maxchildren:
+                _children.clear() # like the re module's cache
+            _children[key] = child
+        return child
 
     def __call__(self):
         """Calling a :class:`Symbol` instance wraps it into a :class:`SymbolControl` object.
@@ -208,14 +318,130 @@ class Symbol(object):
 
 _readpath = Symbol._path.__get__
 _storpath = Symbol._path.__set__
-_readhas = Symbol._has.__get__
-_storhas = Symbol._has.__set__
-_readval = Symbol._val.__get__
-_storval = Symbol._val.__set__
+_readparts = Symbol._parts.__get__
+_storparts = Symbol._parts.__set__
+_readstate = Symbol._state.__get__
+_storstate = Symbol._state.__set__
+
+# The state of a symbol is the tuple (epoch, value), stored and read in
+# one step so that concurrent readers and writers need no lock. The epoch
+# is the one of the value, or 0 if there is none, see bump_epoch(). The
+# value is then a _Failure, or False if the symbol was never searched.
+_NOSTATE = (0, False)
+_readstamp = Symbol._stamp.__get__
+_storstamp = Symbol._stamp.__set__
 
 def _cid(obj):
     return id(type(obj)) # cannot use .__class__
 
+def _newsymbol(cls, path, parts=None):
+    self = object.__new__(cls)
+    _storpath(self, path)
+    _storparts(self, parts) # see _segments()
+    _storstate(self, _NOSTATE)
+    _storstamp(self, None)
+    return self
+
+try:
+    from sys import intern as _intern
+except ImportError: # python 2
+    _intern = intern
+
+def _segments(symb):
+    """Returns the tuple of the interned segments of a symbol's path."""
+    parts = _readparts(symb)
+    if parts is None:
+        path = _readpath(symb)
+        parts = tuple([_intern(x) for x in path.split(_DOT)]) if path else ()
+        _storparts(symb, parts)
+    return parts
+
+_epoch = 1 # see bump_epoch()
+_epoch_lock = threading.Lock()
+
+_interning = False
+_interned = weakref.WeakValueDictionary()
+_interned_lock = threading.Lock()
+
+def _internsymbol(path, symb):
+    """Interns a new symbol, or returns the one interned by another thread."""
+    with _interned_lock:
+        other = _interned.get(path)
+        if other is not None:
+            return other
+        _interned[path] = symb
+        return symb
+
+def set_interning(flag=True):
+    """Enables or disables the interning of :class:`Symbol` instances.
+    
+    Args:
+        flag(bool): True to enable interning, False to disable it.
+        
+    Returns:
+        bool: the previous interning state.
+        
+    While interning is enabled, ``Symbol(*parts)`` returns the living
+    instance having the same path if there is one. The value found by
+    one of the instances is then shared by every part of the program
+    which builds this path. The table of interned instances only holds
+    weak references, so that unused symbols are freed as usual.
+    Disabling interning does not drop the instances already interned.
+    
+    Example:
+        >>> set_interning(True)
+        False
+        >>> Symbol('os.path.isfile') is symbol.os.path.isfile
+        True
+    """
+    global _interning
+    old, _interning = _interning, bool(flag)
+    _children.clear() # the cached children are not interned
+    return old
+
+_children = {} # (parent path, attr) -> Symbol, see Symbol.__getattribute__
+_maxchildren = 0
+
+def set_child_cache(maxsize):
+    """Sets the size of the cache of the symbols created by attribute access.
+    
+    Args:
+        maxsize(int): the maximum number of cached symbols. The cache
+            is disabled if this number is 0.
+        
+    Returns:
+        int: the previous size.
+    
+    The cache is disabled by default. When enabled, attribute access on a
+    :class:`Symbol` returns the child symbol stored in this cache for the
+    same parent path and attribute, so that chains such as
+    ``symbol.os.path.isfile`` built repeatedly in hot code return the same
+    instances, together with the value they may have already loaded. This
+    shares the values, and the failed searches, of these symbols across
+    the whole process: a symbol that failed to load keeps failing under
+    ``Rule.TRY_LOAD_ONCE`` until :func:`bump_epoch()` is called, even after
+    the missing module is installed. The cache holds strong references and
+    is cleared when it is full. Setting the size clears the cache. The
+    cache is not used while interning is enabled by :func:`set_interning()`,
+    because the interned symbols are already shared, and must be released
+    when unused.
+    
+    Example:
+        >>> symbol.os.path.isfile is symbol.os.path.isfile
+        False
+        >>> set_child_cache(1024)
+        0
+        >>> symbol.os.path.isfile is symbol.os.path.isfile
+        True
+    """
+    global _maxchildren
+    maxsize = int(maxsize)
+    if maxsize < 0:
+        raise ValueError(('Invalid child cache size', maxsize))
+    old, _maxchildren = _maxchildren, maxsize
+    _children.clear()
+    return old
+
 symbol = Symbol()
 """An instance of :class:`Symbol` with empty path.
 
@@ -225,12 +451,167 @@ Example:
     >>> symbol.spam.ham
     Symbol('spam.ham')
 """
+_segments(symbol) # the symbols built from symbol inherit their segments
+
+_MISSING = object()
+
+class ResolutionCache(object):
+    """ResolutionCache(maxsize=0) -> new ResolutionCache instance
+    
+    Args:
+        maxsize(int): the maximum number of paths kept in the cache.
+            A cache with maxsize 0 is disabled.
+    
+    A mapping from dot-separated paths to the python objects that they
+    reference, shared by all the :class:`Symbol` instances. When a symbol
+    needs to load its value, the cache is consulted before any import
+    or attribute access, so that the same path is searched only once
+    in the process. The least recently used paths are evicted when the
+    cache is full.
+    
+    The objects found for the module-rooted prefixes of a path
+    (``'os'`` and ``'os.path'`` for ``'os.path.isfile'``) are stored
+    as well, so that symbols with a common prefix, such as ``'os.path.isdir'``,
+    only need the attribute accesses beyond the longest cached prefix.
+    
+    The module-level instance :data:`resolution_cache` is the cache used by
+    :meth:`SymbolControl.getvalue()`, :meth:`SymbolDict.getvalue()` and
+    :meth:`SymbolDict.__getattr__()`. It is disabled by default.
+    
+    Example:
+        >>> resolution_cache.resize(1024)
+        >>> a, b = Symbol('os.path.isfile'), Symbol('os.path.isfile')
+        >>> a().getvalue() is b().getvalue()
+        True
+        >>> resolution_cache.info()
+        {'hits': 1, 'misses': 1, 'size': 3, 'maxsize': 1024}
+    """
+    def __init__(self, maxsize=0):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+        self._lock = threading.RLock()
+        self._data = OrderedDict()
+        self.maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.resize(maxsize)
+    
+    def resize(self, maxsize):
+        """Sets the maximum number of paths kept in the cache.
+        
+        Args:
+            maxsize(int): the new size bound. The least recently used
+                paths are evicted if the cache is too large. A value of 0
+                disables the cache.
+        """
+        maxsize = int(maxsize)
+        if maxsize < 0:
+            raise ValueError(('Invalid cache size', maxsize))
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+            
+    def get(self, path, default=None):
+        """Returns the cached value for a path or default.
+        
+        Args:
+            path(str): a dot-separated path
+            default(any): the value returned if the path is not cached
+        
+        Hits and misses are counted only while the cache is enabled.
+        """
+        if not self.maxsize:
+            return default
+        with self._lock:
+            try:
+                v = self._data.pop(path)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data[path] = v
+            self.hits += 1
+            return v
+    
+    def put(self, path, value):
+        """Stores the value of a path, evicting the least recently used path if needed."""
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data.pop(path, None)
+            self._data[path] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def invalidate(self, path=None, prefix=None):
+        """Removes paths from the cache.
+        
+        Args:
+            path(str): a path to remove from the cache.
+            prefix(str): a module path. Every cached path equal to
+                prefix or starting with ``prefix + '.'`` is removed.
+        
+        If neither argument is given, the whole cache is cleared.
+        The values already loaded by :class:`Symbol` instances are not
+        affected; use ``Rule.FORCE_RELOAD`` to refresh them.
+        
+        Example:
+            >>> resolution_cache.invalidate('os.path.isfile')
+            >>> resolution_cache.invalidate(prefix='os')
+            >>> resolution_cache.invalidate()
+        """
+        with self._lock:
+            if path is None and prefix is None:
+                self._data.clear()
+                return
+            if path is not None:
+                self._data.pop(path, None)
+            if prefix is not None:
+                start = prefix + _DOT
+                for k in [k for k in self._data
+                          if k == prefix or k.startswith(start)]:
+                    del self._data[k]
+
+    def _longest_prefix(self, parts):
+        """Returns (i, value) for the longest proper prefix of parts in the cache.
+        
+        Returns (0, None) if there is no such prefix. Hits and misses
+        are not counted.
+        """
+        if not self.maxsize:
+            return 0, None
+        accs = [parts[0]]
+        for attr in parts[1:-1]:
+            accs.append(accs[-1] + _DOT + attr)
+        data = self._data
+        with self._lock:
+            for i in range(len(accs), 0, -1):
+                v = data.get(accs[i-1], _MISSING)
+                if v is not _MISSING:
+                    data[accs[i-1]] = data.pop(accs[i-1])
+                    return i, v
+        return 0, None
+
+    def info(self):
+        """Returns a dictionary with the cache's hits, misses, size and maxsize."""
+        with self._lock:
+            return dict(hits=self.hits, misses=self.misses,
+                        size=len(self._data), maxsize=self.maxsize)
+    
+    def __len__(self):
+        return len(self._data)
 
-def _getvalue(symb, rule):
+    def __contains__(self, path):
+        return path in self._data
+
+resolution_cache = ResolutionCache()
+"""The process-wide :class:`ResolutionCache` consulted when symbols load their value."""
+
+def _getvalue(symb, rule, cache=resolution_cache):
     """Attempts to return the python object referenced symbolically by this instance.
     
     Args:
         rule(Rule): a rule specifying how to obtain the object's value.
+        cache(ResolutionCache): the cache consulted before searching the value.
         
     Returns:
         any: a python object referenced by this instance,
@@ -249,205 +630,1717 @@ def _getvalue(symb, rule):
     #    EACH    ?        Rtn       ?
     #    DONT    Exc      Rtn       Exc
     #    RELO    ?        ?         ?
-    if _readhas(symb):
+    #    EXPI    ?        Rtn/?     Exc/?    (? after expiry)
+    #    REVA    ?        Rtn/?     ?        (? if owner changed)
+    has, v = _readstate(symb)
+    epoch = _epoch
+    if has == epoch: # values of older epochs are void
         if rule is _ONCE:
-            return _readval(symb)
-        elif rule is _DONT or rule is _EACH:
-            return _readval(symb)
-        # else fetch
-    elif (rule is _ONCE and _readval(symb)) or (rule is _DONT):
+            return v
+        elif (rule is _DONT or rule is _EACH or rule is _LAZY
+                or type(rule) is RetryAfter):
+            return v
+        elif rule is _REVAL:
+            stamp = _readstamp(symb)
+            if stamp is not None and stamp.isvalid():
+                return stamp.value
+        elif type(rule) is ExpireAfter:
+            stamp = _readstamp(symb)
+            if stamp is not None and _clock() - stamp.time < rule.seconds:
+                return stamp.value
+        # else fetch (values loaded by other rules have no stamp)
+    elif type(v) is _Failure and v.epoch == epoch:
+        if (rule is _ONCE or rule is _DONT or rule is _LAZY
+                or (type(rule) in (RetryAfter, ExpireAfter)
+                and _clock() - v.time < rule.seconds)):
+            raise v.voiderror()
+    elif rule is _DONT:
         raise VoidValueError
     # else fetch
     # fetch starts here
     if not _isrule(rule): # check only when load is needed
         raise TypeError(('Need symboldict.Rule,', type(rule), 'found'))
+    path = _readpath(symb)
+    me = _get_ident()
+    with _flights_lock:
+        flight = _flights.get(path)
+        if flight is None or flight.owner == me:
+            flight = _flights[path] = _Flight(me)
+            event = None
+        else:
+            event = flight.event
+            if event is None:
+                event = flight.event = threading.Event()
+    if event is not None:
+        # another thread is searching this path, wait for its result.
+        # The wait is bounded because the other thread may be waiting for
+        # an import lock held by this thread.
+        if event.wait(_flight_timeout):
+            if flight.error is not None:
+                _setfailure(symb, flight.error)
+                raise flight.error
+            if flight.found:
+                _setvalue(symb, flight.value, rule)
+                return flight.value
+        # no result, search in this thread without sharing the search
+        flight = _Flight(me)
+    # these rules search again from the start, ignoring the cache
+    fresh = rule is _FORCE or rule is _REVAL or type(rule) is ExpireAfter
     try:
-        #... procedure -> v
-        # we try to load
-        L = _readpath(symb).split('.')
-        acc = L[0]
+        if not fresh:
+            v = cache.get(path, _MISSING)
+            if v is not _MISSING:
+                _setvalue(symb, v, rule)
+                flight.value, flight.found = v, True
+                stats = _stats if _stats_enabled else None
+                if stats is not None:
+                    stats.record(path, None, True)
+                return v
+        stats = _stats if _stats_enabled else None
+        start = _timer() if stats is not None else None
         try:
-            # may raise ValueError if s is empty string
-            v = import_module(acc)
-        except ImportError:
-            # this section may raise AttributeError for example
-            if acc in __builtins__:
-                v = __builtins__[acc]
-            else:
-                raise
-            for attr in L[1:]:
-                v = getattr(v, attr)
+            v = _resolve(path, cache, not fresh,
+                         _lazy_import if rule is _LAZY else None,
+                         _segments(symb))
+        except Exception as exc:
+            if stats is not None:
+                stats.record(path, start, False)
+            _setfailure(symb, exc)
+            flight.error = exc
+            if rule is _FORCE:
+                cache.invalidate(path)
+            raise
         else:
-            for attr in L[1:]:
-                acc = acc + _DOT + attr
-                try:
-                    v = getattr(v, attr)
-                except AttributeError:
-                    v = import_module(acc)
-    except Exception:
-        _storhas(symb, False)
-        _storval(symb, True) # FETCH FAILED
-        raise
-    else:
-        _storhas(symb, True)
-        _storval(symb, v)
-        return v
+            _setvalue(symb, v, rule)
+            if stats is not None:
+                stats.record(path, start, True)
+            flight.value, flight.found = v, True
+            cache.put(path, v)
+            return v
+    finally:
+        with _flights_lock:
+            if _flights.get(path) is flight:
+                del _flights[path]
+            event = flight.event
+        if event is not None:
+            event.set()
 
-class SymbolControl(object):
-    """SymbolControl(symb) -> new SymbolControl instance
+try:
+    from threading import get_ident as _get_ident
+except ImportError: # python 2
+    from thread import get_ident as _get_ident
+
+class _Flight(object):
+    """The search of a path by one thread, awaited by the other threads.
     
-    Args:
-        symb(Symbol): a symbol referenced by the SymbolControl object
-        
-    This is a class of lightweight wrappers around :class:`Symbol` instances
-    used to bypass the overriding of the dot operator in this class.
-    SymbolControl objects are returned by the :meth:`Symbol.__call__()`
-    method. Their main purpose is to hold methods to manipulate Symbols.
+    The event is created by the first waiting thread. A flight ending
+    without value nor error, for example on KeyboardInterrupt, lets the
+    waiting threads search the path themselves.
+    """
+    __slots__ = ('owner', 'event', 'value', 'found', 'error')
     
-    Example:
-        >>> s = Symbol('os.path.isfile')
-        >>> s()
-        <symboldict.SymbolControl object ...>
-        >>> s().hasvalue()
-        True
-        >>> s().path()
-        'os.path.isfile'
-        >>> s().getvalue()
-        <function isfile ...>
+    def __init__(self, owner):
+        self.owner = owner
+        self.event = None
+        self.value = None
+        self.found = False
+        self.error = None
 
-    """
-    __slots__ = ('__symb',)
+_flights = {}
+_flights_lock = threading.Lock()
+_flight_timeout = 1.0 # seconds waited before searching without the leader
 
-    def __init__(self, symb):
-        """x.__init__(...) initializes x; see help(type(x)) for signature"""
-        self.__symb = symb
+_timer = getattr(time, 'perf_counter', time.time)
 
-    def hasvalue(self, rule=Rule.TRY_LOAD_ONCE):
-        """Returns a boolean indicating if a value is available for the python object referenced symbolically by this instance.
+class _Stats(object):
+    """Per-path statistics of the calls to _getvalue()."""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.data = {} # path -> [calls, loads, failures, cache_hits, total, last]
         
-        Args:
-            rule(Rule): a rule specifying how to obtain the object's value.
-                It defaults to ``Rule.TRY_LOAD_ONCE``.
-                
-        Returns:
-            bool: a boolean indicating if a value is available for this instance.
+    def call(self, path):
+        with self.lock:
+            try:
+                self.data[path][0] += 1
+            except KeyError:
+                self.data[path] = [1, 0, 0, 0, 0.0, 0.0]
 
-        This method returns True if the corresponding call to :meth:`getvalue()`
-        would succeed, and returns False if the call to :meth:`getvalue()` would
-        fail. In any case, it does not raise an exception.
-        
-        The rule argument has the same meaning as in :meth:`Symbol.getvalue()`.
+    def record(self, path, start, success):
+        """Records a search which started at time start, or a resolution cache hit if start is None."""
+        if start is not None:
+            elapsed = _timer() - start
+        with self.lock:
+            rec = self.data.setdefault(path, [0, 0, 0, 0, 0.0, 0.0])
+            if start is None:
+                rec[3] += 1
+                return
+            rec[1] += 1
+            if not success:
+                rec[2] += 1
+            rec[4] += elapsed
+            rec[5] = elapsed
+                
+    def snapshot(self, paths=None):
+        with self.lock:
+            items = list(self.data.items()) if paths is None else [
+                (p, self.data[p]) for p in paths if p in self.data]
+            return dict((p, _statdict(rec)) for p, rec in items)
         
-        Example:
-            >>> a = Symbol('wave.Error')
-            >>> a().hasvalue()
-            True
-            >>> b = Symbol('spam.ham')
-            >>> b().hasvalue()
-            False
-        """
-        try:
-            _getvalue(self.__symb, rule)
-        except Exception:
-            return False
-        else:
-            return True
+def _statdict(rec):
+    calls, loads, failures, cache_hits, total, last = rec
+    return dict(calls=calls, hits=max(calls - loads, 0), loads=loads,
+                failures=failures, cache_hits=cache_hits,
+                total_time=total, last_time=last)
 
-    def getvalue(self, rule=Rule.TRY_LOAD_ONCE):
-        """Attempts to return the python object referenced symbolically by this instance.
-        
-        Args:
-            rule(Rule): a rule specifying how to obtain the object's value.
-                It defaults to ``Rule.TRY_LOAD_ONCE``.
-            
-        Returns:
-            any: a python object referenced by this instance,
-                if such a value can be found.
-        
-        Raises:
-            Exception
-                met while trying to
-                obtain the value when it does not exist.
-        
-        This method tries to obtain a value by importing modules and taking
-        attributes according to the dotted path of the contained :class:`Symbol`
-        instance. In this path, the word before the first dot can be the
-        name of an importable module or that of a builtin python object
-        in the `__builtins__` dictionnary.
-        
-        If the object can not be  found, an exception is raised.
-        
-        Example:
-            >>> a = Symbol('wave.Error')
-            >>> a().getvalue()
-            <class 'wave.Error'>
-            
-        The `rule` parameter can be used to specify the policy
-        with respect to value search. The possible values are
-        
-        - ``Rule.TRY_LOAD_ONCE`` (default rule) The value
-            is searched once and stored in the ``Symbol`` instance. Subsequent
-            calls to ``getvalue()`` return the same value without trying
-            to reload the symbol. If the first search fails, subsequent
-            calls will fail without attempting to search the value.
-            This rule handles most lazy import cases because symbol values
-            in imported modules usually don't vary. For example there is
-            no need to search the symbol ``Symbol('telnetlib.Telnet')``
-            more than once. This is a per-instance policy, which means that
-            a different instance with the same path will trigger a second search.
-            
-        - ``Rule.DONT_LOAD`` With this rule, there is no attempt to get
-            the symbol's value through imports or attribute accesses. It
-            means that the call will succeed only if a value was previously
-            found by a call to ``getvalue()`` or ``hasvalue()`` with a different
-            rule.
-            
-        - ``Rule.FORCE_RELOAD`` With this rule, an attempt is made to load
-            the symbol through imports and attribute access. It can be used
-            to handle cases where a variable changes in an imported module.
-            There is no attempt to reload imported modules.
-            
-        - ``Rule.TRY_LOAD_EACH`` With this rule, an attempt is made to load
-            the symbol's value only if the previous attempts failed
-            to obtain a value.
-        
-        """
-        return _getvalue(self.__symb, rule)
+_stats = None # the statistics collected so far, see stats()
+_stats_enabled = False
+_plain_getvalue = _getvalue
+
+def _counted_getvalue(symb, rule, cache=resolution_cache):
+    stats = _stats
+    if stats is not None:
+        stats.call(_readpath(symb))
+    return _plain_getvalue(symb, rule, cache)
+
+def set_stats(flag=True):
+    """Enables or disables the collection of loading statistics.
     
-    def path(self):
-        """Returns the path of the referenced :class:`Symbol` instance.
+    Args:
+        flag(bool): True to enable the statistics, False to disable them.
         
-        Example:
-            >>> s = Symbol('socket.socket')
-            >>> s().path()
-            'socket.socket'
-        """
-        return _readpath(self.__symb)
+    Returns:
+        bool: the previous state.
     
-    def symbol(self):
-        """Returns the referenced :class:`Symbol` instance.
-        
-        Example:
-            >>> s = Symbol('socket.socket')
-            >>> s().symbol() is s
-            True
-        """
-        return self.__symb
+    While the statistics are disabled, the functions loading the symbols
+    are not instrumented at all. Disabling the statistics keeps the
+    data collected so far, which is discarded by ``stats(reset=True)``.
     
-_dictga = dict.__getitem__
+    Example:
+        >>> set_stats(True)
+        False
+        >>> sy = SymbolDict(Telnet='telnetlib.Telnet')
+        >>> sy.Telnet
+        <class 'telnetlib.Telnet'>
+        >>> sy.stats()['Telnet']['loads']
+        1
+    """
+    global _stats, _stats_enabled, _getvalue
+    old = _stats_enabled
+    if flag:
+        if _stats is None:
+            _stats = _Stats()
+        _stats_enabled = True
+        _getvalue = _counted_getvalue
+    else:
+        _stats_enabled = False
+        _getvalue = _plain_getvalue
+    return old
 
-class BaseSymbolDict(dict):
-    __slots__ = ('_strict',)
+def stats(reset=False):
+    """Returns a snapshot of the loading statistics collected by :func:`set_stats()`.
     
-    def __new__(cls, *args, **kwargs):
+    Args:
+        reset(bool): if True, the statistics collected so far are discarded.
+    
+    Returns:
+        dict: a dictionary mapping the paths of the symbols to dictionaries
+            with the following items
+            
+            - ``calls`` the number of requests for the symbol's value,
+              for example through :meth:`SymbolControl.getvalue()` or the
+              first attribute access in a :class:`SymbolDict` (later
+              attribute accesses don't call any function).
+            - ``hits`` the number of calls answered without a search
+            - ``loads`` the number of searches by import and attribute access
+            - ``failures`` the number of failed searches
+            - ``cache_hits`` the number of values taken from :data:`resolution_cache`
+            - ``total_time`` the cumulated duration of the searches in seconds
+            - ``last_time`` the duration of the last search in seconds
+    """
+    global _stats
+    if _stats is None:
+        return {}
+    result = _stats.snapshot()
+    if reset:
+        _stats = _Stats() if _stats_enabled else None
+    return result
+
+def _process_start():
+    """Returns the start time of the process, or the current time if unknown."""
+    try:
+        with open('/proc/self/stat') as f:
+            fields = f.read().rpartition(')')[2].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return time.time() - uptime + float(fields[19]) / os.sysconf(str('SC_CLK_TCK'))
+    except Exception:
+        return time.time()
+
+class _Recorder(object):
+    """The first uses of the symbols' paths in the current process."""
+    
+    def __init__(self, manifest):
+        self.lock = threading.Lock()
+        self.manifest = manifest
+        self.start = _process_start()
+        self.entries = OrderedDict() # path -> time since process start
+
+    def record(self, path):
+        if path not in self.entries:
+            t = time.time() - self.start
+            with self.lock:
+                self.entries.setdefault(path, t)
+
+    def snapshot(self):
+        with self.lock:
+            return [dict(path=p, order=i, time=t)
+                    for i, (p, t) in enumerate(self.entries.items())]
+
+_recorder = None
+
+def start_recording(manifest=None):
+    """Starts recording the symbols used through :class:`SymbolDict` instances.
+    
+    Args:
+        manifest(str): the name of a file where the manifest of the
+            recorded symbols is written at exit, or None.
+    
+    While recording, the first successful access to each path by
+    :meth:`SymbolDict.__getattr__()` or :meth:`SymbolDict.getvalue()` is
+    logged with its order and its time in seconds since the start
+    of the process. Starting again discards the previous records.
+    The manifest can be used in the next run of the program by
+    :meth:`SymbolDict.preload_from_manifest()`.
+    
+    Example:
+        >>> start_recording('worker.manifest.json')
+    """
+    global _recorder
+    _recorder = _Recorder(manifest)
+    if manifest is not None:
+        _register_atexit()
+
+def stop_recording():
+    """Stops recording the symbols used and returns the records.
+    
+    Returns:
+        list: a list of dictionaries with keys ``'path'``, ``'order'`` and
+            ``'time'``, sorted by order of first use. The manifest
+            is not written at exit.
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return [] if recorder is None else recorder.snapshot()
+
+def write_manifest(manifest):
+    """Writes the manifest of the symbols recorded so far.
+    
+    Args:
+        manifest(str): the name of the file to write.
+    
+    Raises:
+        RuntimeError: if :func:`start_recording()` was not called.
+    """
+    import json
+    if _recorder is None:
+        raise RuntimeError('Symbols are not being recorded')
+    data = dict(version=1, symbols=_recorder.snapshot())
+    with open(manifest, 'w') as f:
+        json.dump(data, f, indent=1)
+
+def read_manifest(manifest):
+    """Reads a manifest file written by :func:`write_manifest()`.
+    
+    Returns:
+        list: the list of records, as returned by :func:`stop_recording()`.
+    """
+    import json
+    with open(manifest) as f:
+        data = json.load(f)
+    if data.get('version') != 1:
+        raise ValueError(('Unsupported manifest version', data.get('version')))
+    return sorted(data['symbols'], key=lambda entry: entry['order'])
+
+_atexit_registered = False
+
+def _register_atexit():
+    global _atexit_registered
+    if not _atexit_registered:
+        import atexit
+        atexit.register(_write_manifest_at_exit)
+        _atexit_registered = True
+
+def _write_manifest_at_exit():
+    recorder = _recorder
+    if recorder is not None and recorder.manifest is not None:
+        write_manifest(recorder.manifest)
+
+def _setvalue(symb, v, rule=None):
+    # only these rules use the stamp, which costs a scan of sys.modules
+    if rule is _REVAL or type(rule) is ExpireAfter:
+        _storstamp(symb, _Stamp(_segments(symb), v))
+    else:
+        _storstamp(symb, None)
+    _storstate(symb, (_epoch, v))
+
+def _clearvalue(symb):
+    _storstate(symb, _NOSTATE)
+    _storstamp(symb, None)
+
+def _setfailure(symb, exc):
+    _storstate(symb, (0, _Failure(exc))) # FETCH FAILED
+
+def _hasvalue(symb):
+    return _readstate(symb)[0] == _epoch
+
+def _isfailed(symb):
+    has, v = _readstate(symb)
+    return has != _epoch and type(v) is _Failure and v.epoch == _epoch
+
+_clock = getattr(time, 'monotonic', time.time)
+
+class _Stamp(object):
+    """The value of a symbol with the time and the owner module of its search.
+    
+    The owner is the module of the longest prefix of the path found in
+    sys.modules, referenced weakly. The object bound to the next segment
+    of the path in the owner's namespace is recorded too.
+    """
+    __slots__ = ('value', 'time', 'name', 'module', 'attr', 'binding')
+    
+    def __init__(self, L, value):
+        self.value = value
+        self.time = _clock()
+        self.name = self.module = self.attr = self.binding = None
+        modules = sys.modules
+        for i in range(len(L), 0, -1):
+            name = _DOT.join(L[:i])
+            module = modules.get(name)
+            if module is not None:
+                self.name, self.module = name, _ref(module)
+                # a path ending at a lazily loaded module must not load it
+                namespace = getattr(module, '__dict__', None) if i < len(L)\
+                    else None
+                if namespace is not None:
+                    self.attr = L[i]
+                    self.binding = namespace.get(L[i], _MISSING)
+                break
+                
+    def isvalid(self):
+        """Tells if the owner module and its binding are unchanged."""
+        module = self.module
+        if module is None:
+            return True
+        module = module()
+        if module is None or sys.modules.get(self.name) is not module:
+            return False
+        attr = self.attr
+        return attr is None or module.__dict__.get(attr, _MISSING) is self.binding
+
+def _modspec(module):
+    """Returns the __spec__ of a module without loading a lazy module."""
+    try:
+        return object.__getattribute__(module, '__dict__').get('__spec__')
+    except (AttributeError, TypeError):
+        return None
+
+def _ref(obj):
+    """Returns a weak reference to obj, or a strong one if it is not possible."""
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return lambda: obj
+
+_seen = {} # module name -> (weak reference, __spec__)
+_symboldicts = weakref.WeakValueDictionary() # id -> SymbolDict
+
+def _see(name, module):
+    """Records a module imported or traversed by a search.
+    
+    A search meeting a module that replaced a recorded one invalidates
+    the values taken from the replaced module.
+    """
+    entry = _seen.get(name)
+    if entry is not None and entry[0]() is module:
+        return
+    _seen[name] = (_ref(module), _modspec(module))
+    if entry is not None:
+        _invalidate_modules([name])
+
+def _living_symbols():
+    """Generates the symbols of the living SymbolDicts, the interned symbols
+    and the cached children."""
+    for sd in list(_symboldicts.values()):
+        for symb in list(dict.values(sd)):
+            yield symb
+    for symb in list(_interned.values()):
+        yield symb
+    for symb in list(_children.values()):
+        yield symb
+
+def _invalidate_modules(names):
+    """Forgets the values taken from stale modules.
+    
+    The module of a value is the longest prefix of the symbol's path
+    among the modules recorded by the searches.
+    """
+    names = frozenset(names)
+    cleared = {}
+    epoch = _epoch
+    for symb in _living_symbols():
+        if _readstate(symb)[0] != epoch or id(symb) in cleared:
+            continue
+        parts = _segments(symb)
+        for i in range(len(parts), 0, -1):
+            name = _DOT.join(parts[:i])
+            if name in names:
+                _clearvalue(symb)
+                cleared[id(symb)] = symb
+                break
+            if name in _seen:
+                break
+    for name in names:
+        resolution_cache.invalidate(prefix=name)
+    _uncache(cleared)
+
+def _uncache(cleared):
+    """Discards the attributes cached by the SymbolDicts for cleared symbols."""
+    if not cleared:
+        return
+    for sd in list(_symboldicts.values()):
+        d = sd.__dict__
+        for key in list(d):
+            symb = dict.get(sd, key)
+            if cleared.get(id(symb)) is symb:
+                d.pop(key, None)
+
+def check_modules():
+    """Invalidates the values taken from modules reloaded or replaced in sys.modules.
+    
+    Returns:
+        list: the sorted names of the modules found reloaded or replaced.
+    
+    The searches record weakly the modules that they import or traverse.
+    This function finds the recorded modules which are not in
+    ``sys.modules`` anymore, which were replaced by another object, or
+    which were reloaded by :func:`importlib.reload()`, which gives them
+    a new ``__spec__``. The value of a symbol comes from the module of
+    the longest prefix of its path among the recorded modules. The
+    symbols whose value comes from a stale module return to the void
+    state, so that their next access searches them again, and the
+    attributes cached by the :class:`SymbolDict` instances for these
+    symbols are removed. Other symbols are not affected.
+    
+    The symbols concerned are those of the living :class:`SymbolDict`
+    instances, the interned symbols and the symbols of the cache of
+    :func:`set_child_cache()`. Other symbols can use ``Rule.REVALIDATE``.
+    When no module changed, the cost of the check is proportional to the
+    number of recorded modules. Otherwise, it is proportional to the
+    number of symbols concerned, and to the number of attributes cached
+    by the SymbolDicts.
+    
+    A search meeting a module which replaced a recorded module has
+    the same effect for this module.
+    
+    Example:
+        >>> import importlib, wave
+        >>> sy = SymbolDict(Error='wave.Error')
+        >>> old = sy.Error
+        >>> wave = importlib.reload(wave)
+        >>> check_modules()
+        ['wave']
+        >>> sy.Error is old
+        False
+    """
+    stale = []
+    for name, entry in list(_seen.items()):
+        module = entry[0]()
+        if (module is None or sys.modules.get(name) is not module
+                or _modspec(module) is not entry[1]):
+            if _seen.get(name) is entry:
+                del _seen[name]
+            stale.append(name)
+    if stale:
+        _invalidate_modules(stale)
+    return sorted(stale)
+
+def bump_epoch():
+    """Invalidates the values and failures of all the symbols at once.
+    
+    Returns:
+        int: the new epoch.
+    
+    Every symbol stamps the value or failure found by a search with the
+    current epoch, an integer incremented by this function. A value of an
+    older epoch is treated as if the symbol had never been searched, so
+    that the symbols are searched again lazily, at their next access.
+    The symbols themselves are not visited, and checking the epoch on the
+    read path is a single integer comparison.
+    
+    The :data:`resolution_cache` is cleared, and so are the attributes
+    cached by the living :class:`SymbolDict` instances, because reading
+    these attributes does not run any code that could check the epoch.
+    The cost of the call is thus proportional to the number of living
+    SymbolDict instances and of the attributes they cache.
+    
+    Example:
+        >>> sy = SymbolDict(isfile='os.path.isfile')
+        >>> sy.isfile
+        <function isfile ...>
+        >>> bump_epoch()
+        2
+        >>> 'isfile' in sy.__dict__
+        False
+        >>> sy['isfile']().hasvalue(Rule.DONT_LOAD)
+        False
+    """
+    global _epoch
+    with _epoch_lock:
+        _epoch += 1
+        epoch = _epoch
+    resolution_cache.invalidate()
+    for sd in list(_symboldicts.values()):
+        sd.__dict__.clear()
+    return epoch
+
+def _sourcefile(module):
+    """Returns the python source file of a module, or None."""
+    try:
+        path = object.__getattribute__(module, '__dict__').get('__file__')
+    except (AttributeError, TypeError):
+        return None
+    if not path:
+        return None
+    if path.endswith(('.pyc', '.pyo')):
+        path = path[:-1]
+    return path if path.endswith('.py') else None
+
+def _reload_order(modules):
+    """Sorts module names so that modules come after the modules they use.
+    
+    A module uses the modules referenced by its namespace, directly or
+    through the ``__module__`` of its objects, and a package uses its
+    submodules. Modules in an import cycle come in name order.
+    """
+    deps = {}
+    for name, module in modules.items():
+        used = set()
+        for obj in list(vars(module).values()):
+            dep = getattr(obj, '__name__', None) if isinstance(
+                obj, type(sys)) else getattr(obj, '__module__', None)
+            if dep in modules and dep != name:
+                used.add(dep)
+        used.update(x for x in modules if x.startswith(name + _DOT))
+        deps[name] = used
+    order = []
+    while deps:
+        ready = sorted(x for x, used in deps.items() if not used) or [min(deps)]
+        for name in ready:
+            del deps[name]
+            order.append(name)
+        for used in deps.values():
+            used.difference_update(ready)
+    return order
+
+class Watcher(object):
+    """Watcher(interval=1.0, on_reload=None) -> new Watcher instance
+    
+    Args:
+        interval(float): the time in seconds between two polls of the
+            source files by the thread started by :meth:`start()`.
+        on_reload(callable): a function called with the report of each
+            poll which found changed files, see :meth:`poll()`.
+    
+    A watcher reloads the modules whose python source file was modified,
+    then refreshes the symbols taking their value from these modules,
+    as :func:`check_modules()` does. The watched modules are the modules
+    imported or traversed by the searches of symbols, the modules given to
+    :meth:`watch()`, and the modules already reloaded by the watcher.
+    Changes are detected by polling the files' modification time and
+    size, without any external service.
+    
+    Example:
+        >>> w = Watcher(interval=0.5)
+        >>> w.start()
+        >>> # ... edit the source of a module ...
+        >>> w.last_report
+        {'modules': ['mypkg.handlers'], 'errors': {}, 'invalidated': ['mypkg.handlers'], 'reload_time': 0.0021, 'latency': 0.4127}
+        >>> w.stop()
+    """
+    
+    def __init__(self, interval=1.0, on_reload=None):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+        self.interval = float(interval)
+        self.on_reload = on_reload
+        self.last_report = None
+        self._names = set()
+        self._files = {} # module name -> (source file, mtime, size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopped = threading.Event()
+        
+    def watch(self, *modules):
+        """Adds modules to the watched modules.
+        
+        Args:
+            modules(module or str): modules or module names.
+        """
+        with self._lock:
+            for module in modules:
+                self._names.add(getattr(module, '__name__', module))
+                
+    def poll(self):
+        """Reloads the modules whose source file changed since the previous poll.
+        
+        Returns:
+            dict: None if no file changed, otherwise a report with items
+            
+                - ``modules`` the names of the reloaded modules, in the
+                  order of their reload
+                - ``errors`` a dictionary mapping the names of the modules
+                  which could not be reloaded to the exception raised.
+                  They are not reloaded before their file changes again.
+                - ``invalidated`` the modules returned by :func:`check_modules()`
+                - ``reload_time`` the duration in seconds of the reloads and
+                  of the refresh of the symbols
+                - ``latency`` the time in seconds from the last modification
+                  of the files to the end of the refresh
+        
+        The first poll seeing a module only records the state of its file.
+        The changed modules are reloaded after the modules they use.
+        """
+        try:
+            from importlib import reload
+        except ImportError: # python 2
+            reload = __builtins__['reload']
+        with self._lock:
+            names = set(_seen)
+            names.update(self._names, self._files)
+            changed, newest = {}, 0.0
+            for name in names:
+                module = sys.modules.get(name)
+                source = _sourcefile(module)
+                if source is None:
+                    continue
+                try:
+                    st = os.stat(source)
+                except OSError:
+                    continue
+                state = (source, st.st_mtime, st.st_size)
+                old = self._files.get(name)
+                self._files[name] = state
+                if old is not None and old != state:
+                    changed[name] = module
+                    newest = max(newest, st.st_mtime)
+            if not changed:
+                return None
+            start = _timer()
+            modules, errors = [], {}
+            for name in _reload_order(changed):
+                try:
+                    reload(changed[name])
+                except Exception as exc:
+                    errors[name] = exc
+                else:
+                    modules.append(name)
+            invalidated = check_modules()
+            report = dict(modules=modules, errors=errors,
+                          invalidated=invalidated,
+                          reload_time=_timer() - start,
+                          latency=max(time.time() - newest, 0.0))
+            self.last_report = report
+        if self.on_reload is not None:
+            self.on_reload(report)
+        return report
+    
+    def start(self):
+        """Starts a daemon thread polling the source files periodically."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self.__run, name='symboldict-watcher')
+        self._thread.daemon = True
+        self._thread.start()
+        
+    def stop(self):
+        """Stops the thread started by :meth:`start()` and waits for its end."""
+        self._stopped.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+            
+    def __run(self):
+        self.poll() # records the initial state of the files
+        while not self._stopped.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as exc:
+                warnings.warn('symboldict watcher: {!r}'.format(exc))
+                
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, *args):
+        self.stop()
+
+class _Failure(object):
+    """The exception and time of a symbol's failed search."""
+    __slots__ = ('error', 'time', 'epoch')
+    
+    def __init__(self, error):
+        self.error = error
+        self.time = _clock()
+        self.epoch = _epoch
+        
+    def voiderror(self):
+        exc = VoidValueError('no value, the previous search failed')
+        exc.__cause__ = self.error
+        return exc
+
+def resolve_many(symbols, rule=Rule.TRY_LOAD_ONCE):
+    """Attempts to obtain the values of many symbols in a single call.
+    
+    Args:
+        symbols(iterable): a sequence of :class:`Symbol` instances or
+            of paths converted to :class:`Symbol` instances.
+        rule(Rule): a rule specifying how to obtain the objects' values.
+            It defaults to ``Rule.TRY_LOAD_ONCE``.
+    
+    Returns:
+        tuple: a pair of dictionaries ``(values, errors)``. The first
+            maps the items of ``symbols`` that have a value to their value,
+            the second maps the other items to the exception met while
+            trying to obtain their value.
+            
+    The symbols are grouped by top-level module. The root of each
+    group is imported once, and the modules along the paths are
+    imported at most once during the call. When the root of a group
+    cannot be obtained, its exception is reported for every member of the
+    group that needed a search, without searching them again.
+    The ``rule`` argument has the same meaning as in
+    :meth:`SymbolControl.getvalue()`.
+    
+    Example:
+        >>> values, errors = resolve_many(['os.path.isfile', 'spam.ham'])
+        >>> values
+        {'os.path.isfile': <function isfile at ...>}
+        >>> errors
+        {'spam.ham': ModuleNotFoundError("No module named 'spam'")}
+    """
+    return _resolve_many([(x, x if isinstance(x, Symbol) else Symbol(x))
+                          for x in symbols], rule)
+
+def _resolve_many(pairs, rule):
+    cache = resolution_cache
+    if not cache.maxsize:
+        cache = ResolutionCache(sys.maxsize) # memo for this batch only
+    groups = OrderedDict()
+    for key, symb in pairs:
+        parts = _segments(symb)
+        root = parts[0] if parts else ''
+        groups.setdefault(root, []).append((key, symb))
+    values, errors = {}, {}
+    for root, group in groups.items():
+        failure = None
+        if rule is not _DONT and _isrule(rule):
+            try:
+                _resolve(root, cache, True,
+                         _lazy_import if rule is _LAZY else None)
+            except Exception as exc:
+                failure = exc
+        for key, symb in group:
+            if failure is None:
+                try:
+                    values[key] = _getvalue(symb, rule, cache)
+                except Exception as exc:
+                    errors[key] = exc
+                continue
+            # the root is missing: only the values already found remain
+            if rule is not _FORCE:
+                try:
+                    values[key] = _getvalue(symb, _DONT)
+                    continue
+                except VoidValueError:
+                    if rule is _ONCE and _isfailed(symb):
+                        errors[key] = _readstate(symb)[1].voiderror()
+                        continue
+            _setfailure(symb, failure)
+            errors[key] = failure
+    return values, errors
+
+_plans = {}
+
+def _resolve(path, cache=None, reuse=True, importer=None, parts=None):
+    """Finds the python object referenced by a dot-separated path.
+    
+    Args:
+        path(str): the path to resolve
+        cache(ResolutionCache): a cache where the objects found for the
+            module-rooted prefixes of the path are stored.
+        reuse(bool): if True, the search starts from the longest
+            prefix of the path found in the cache.
+        importer(callable): the function importing a module from its
+            name. It defaults to :func:`importlib.import_module()`.
+        parts(tuple): the segments of the path if they are already known.
+        
+    Returns:
+        any: the python object found by importing modules and
+            taking attributes along the path.
+            
+    Raises:
+        Exception
+            met while trying to obtain the object.
+            
+    The first successful search of a path compiles a resolution plan,
+    which records the segments of the path that are imported and the
+    segments that are attributes. Later searches follow the plan
+    directly, and fall back to a new search if it does not apply anymore:
+    when an attribute of the plan is missing, or a module of the plan is
+    not found. Other errors, such as an exception raised by the body of
+    an imported module, are raised without searching again, so that the
+    module is not imported twice.
+    """
+    L = parts or path.split('.')
+    plan = _plans.get(path)
+    if plan is not None:
+        v = _follow(L, plan, cache, reuse, importer or import_module)
+        if v is not _STALE:
+            return v
+        # the modules changed, the plan must be compiled again
+        _plans.pop(path, None)
+    v, plan = _search(L, cache, reuse, importer or import_module)
+    if plan is not None:
+        _plans[path] = plan
+    return v
+
+def _start(L, cache, reuse):
+    if cache is not None and reuse and len(L) > 1 and L[0] in sys.modules:
+        return cache._longest_prefix(L)
+    return 0, None
+
+def _search(L, cache, reuse, import_module):
+    """Searches the path's segments by trial and error, returns (value, plan)."""
+    i, v = _start(L, cache, reuse)
+    if i:
+        acc = _DOT.join(L[:i])
+        plan = _plans.get(acc)
+        # the plan is not compiled if the prefix's plan is unknown
+        plan = None if plan is None else list(plan)
+    else:
+        acc = L[0]
+        try:
+            # may raise ValueError if s is empty string
+            v = import_module(acc)
+            _see(acc, v)
+        except ImportError:
+            # this section may raise AttributeError for example
+            if acc in __builtins__:
+                v = __builtins__[acc]
+            else:
+                raise
+            for attr in L[1:]:
+                v = getattr(v, attr)
+            return v, _PLAN_BUILTIN + _PLAN_ATTR * (len(L) - 1)
+        plan = [_PLAN_MODULE]
+        i = 1
+    put = None if (cache is None or not cache.maxsize) else cache.put
+    for attr in L[i:]:
+        if put is not None:
+            put(acc, v)
+            if plan is not None:
+                _plans[acc] = ''.join(plan)
+        acc = acc + _DOT + attr
+        try:
+            v = getattr(v, attr)
+        except AttributeError:
+            v = import_module(acc)
+            _see(acc, v)
+            code = _PLAN_MODULE
+        else:
+            if isinstance(v, _ModuleType) and sys.modules.get(acc) is v:
+                _see(acc, v)
+            code = _PLAN_ATTR
+        if plan is not None:
+            plan.append(code)
+    return v, (None if plan is None else ''.join(plan))
+
+def _follow(L, plan, cache, reuse, import_module):
+    """Follows a compiled resolution plan for the path's segments.
+    
+    Returns _STALE if the plan does not match the modules anymore.
+    """
+    if plan[0] == _PLAN_BUILTIN:
+        try:
+            v = __builtins__[L[0]]
+            for attr in L[1:]:
+                v = getattr(v, attr)
+        except (KeyError, AttributeError):
+            return _STALE
+        return v
+    i, v = _start(L, cache, reuse)
+    if i:
+        acc = _DOT.join(L[:i])
+    else:
+        acc = L[0]
+        v = _follow_import(import_module, acc)
+        if v is _STALE:
+            return v
+        i = 1
+    put = None if (cache is None or not cache.maxsize) else cache.put
+    for k in range(i, len(L)):
+        if put is not None:
+            put(acc, v)
+        attr = L[k]
+        acc = acc + _DOT + attr
+        if plan[k] == _PLAN_MODULE:
+            v = _follow_import(import_module, acc)
+            if v is _STALE:
+                return v
+        else:
+            try:
+                v = getattr(v, attr)
+            except AttributeError:
+                return _STALE
+            if isinstance(v, _ModuleType) and sys.modules.get(acc) is v:
+                _see(acc, v)
+    return v
+
+def _follow_import(import_module, name):
+    """Imports a module of a plan, returns _STALE if it is not found."""
+    try:
+        v = import_module(name)
+    except ImportError as exc:
+        if getattr(exc, 'name', None) == name:
+            return _STALE
+        raise
+    _see(name, v)
+    return v
+
+_STALE = object()
+
+_PLAN_MODULE, _PLAN_ATTR, _PLAN_BUILTIN = 'm', 'a', 'b'
+
+def _lazy_import(name):
+    """Imports a module with :class:`importlib.util.LazyLoader`.
+    
+    The module's body runs when one of its attributes is accessed.
+    Parent packages are imported normally, and so are builtin, frozen
+    and extension modules, which cannot be loaded lazily. A lock makes
+    the threads importing the same module share one lazy module.
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        pass
+    from importlib.machinery import (BuiltinImporter, ExtensionFileLoader,
+                                     FrozenImporter)
+    from importlib.util import LazyLoader, find_spec, module_from_spec
+    spec = find_spec(name)
+    if spec is None:
+        raise ImportError('No module named {!r}'.format(name), name=name)
+    loader = spec.loader
+    if (not hasattr(loader, 'exec_module') or isinstance(
+            loader, (ExtensionFileLoader, BuiltinImporter, FrozenImporter))
+            or loader in (BuiltinImporter, FrozenImporter)):
+        return import_module(name)
+    with _lazy_import_lock:
+        # another thread may have imported the module meanwhile
+        try:
+            return sys.modules[name]
+        except KeyError:
+            pass
+        spec.loader = LazyLoader(spec.loader)
+        module = module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        parent, _, child = name.rpartition(_DOT)
+        if parent:
+            setattr(sys.modules[parent], child, module)
+    return module
+
+_lazy_import_lock = threading.Lock()
+
+_MODULE_NAMES = frozenset((
+    '__name__', '__doc__', '__file__', '__spec__', '__loader__',
+    '__package__', '__path__', '__builtins__', '__cached__', '__dict__'))
+_source_names = {}
+_MAYBE = object() # key of the names that a module may bind at run time
+_DELETED = object() # key of the names that a module may delete
+_DYNAMIC_CALLS = frozenset(('globals', 'locals', 'vars', 'setattr', 'exec',
+                            'execfile'))
+
+def _exists(parts):
+    """Tells if a path can be resolved without running the modules it names.
+    
+    Returns True or False when the answer is known, and None when it
+    cannot be decided without importing a module.
+    """
+    try:
+        import importlib.util, importlib.machinery
+    except ImportError: # python 2
+        return None
+    return _probe(parts, 0)
+
+def _probe(L, depth):
+    from importlib.util import find_spec
+    if depth > 8:
+        return None
+    for i in range(len(L), 0, -1):
+        module = sys.modules.get(_DOT.join(L[:i]))
+        if module is not None:
+            return _probe_object(module, L, i, depth)
+    try:
+        spec = find_spec(L[0])
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        if L[0] in __builtins__:
+            return _probe_object(__builtins__[L[0]], L, 1, depth)
+        return False
+    return _probe_spec(spec, L, 1, depth)
+
+def _probe_object(obj, L, i, depth):
+    for k in range(i, len(L)):
+        try:
+            obj = getattr(obj, L[k])
+        except Exception:
+            locations = getattr(obj, '__path__', None)
+            if locations is None:
+                return False
+            spec = _find_submodule(_DOT.join(L[:k+1]), locations)
+            if spec is None:
+                return False
+            return _probe_spec(spec, L, k + 1, depth)
+    return True
+
+def _find_submodule(name, locations):
+    from importlib.machinery import PathFinder
+    try:
+        return PathFinder.find_spec(name, list(locations))
+    except (ImportError, ValueError):
+        return None
+
+def _probe_spec(spec, L, i, depth):
+    while i < len(L):
+        if spec.submodule_search_locations is not None:
+            sub = _find_submodule(spec.name + _DOT + L[i],
+                                  spec.submodule_search_locations)
+            if sub is not None:
+                spec, i = sub, i + 1
+                continue
+        names = _module_names(spec)
+        if names is None:
+            return None
+        if L[i] in names.get(_DELETED, ()):
+            return None
+        if L[i] not in names:
+            maybe = names.get(_MAYBE)
+            if maybe is True or (maybe and L[i] in maybe):
+                return None
+            return False
+        if i + 1 == len(L):
+            return True
+        target = names[L[i]]
+        if target is None:
+            return None
+        return _probe(tuple(target.split(_DOT)) + tuple(L[i+1:]), depth + 1)
+    return True
+
+def _module_names(spec):
+    """Returns the global names bound by a module's source code.
+    
+    The result maps each name to the path of the object imported under
+    this name, or to None for other bindings. It is None if the source
+    is not available or if it cannot tell all the module's attributes,
+    because of a star import or of a module level ``__getattr__()``.
+    The key ``_MAYBE`` maps to the set of the names declared ``global``
+    in functions or bound by assignment expressions, or to True if the
+    module may bind any name at run time through ``globals()``,
+    ``vars()``, ``setattr()``, ``exec`` or ``sys.modules``. The key
+    ``_DELETED`` maps to the set of the names of ``del`` statements.
+    """
+    import ast
+    origin = spec.origin
+    try:
+        key = (origin, os.stat(origin).st_mtime)
+    except (TypeError, OSError):
+        return None
+    try:
+        return _source_names[key]
+    except KeyError:
+        pass
+    try:
+        source = spec.loader.get_source(spec.name)
+    except Exception:
+        source = None
+    if source is None and origin.endswith('.py'):
+        try:
+            with open(origin, 'rb') as ifh:
+                source = ifh.read()
+        except (IOError, OSError):
+            pass
+    names = None
+    if source is not None:
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            tree = None
+        if tree is not None:
+            names = dict.fromkeys(_MODULE_NAMES)
+            package = spec.name if spec.submodule_search_locations is not None\
+                else spec.parent
+            if not _bind_names(tree.body, names, package):
+                names = None
+            else:
+                maybe, deleted = _dynamic_names(tree)
+                if maybe:
+                    names[_MAYBE] = maybe
+                if deleted:
+                    names[_DELETED] = deleted
+    _source_names[key] = names
+    return names
+
+def _dynamic_names(tree):
+    """Returns the names that a module may bind without assigning them,
+    and the names that it may delete.
+    
+    The first item is True if any name may be bound.
+    """
+    import ast
+    maybe, deleted = set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Global):
+            maybe.update(node.names)
+        elif isinstance(node, getattr(ast, 'NamedExpr', ())):
+            maybe.add(node.target.id)
+        elif isinstance(node, ast.Delete):
+            targets = {}
+            for target in node.targets:
+                _bind_target(target, targets)
+            deleted.update(targets)
+        elif isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and func.id in _DYNAMIC_CALLS:
+                return True, deleted
+        elif isinstance(node, getattr(ast, 'Exec', ())):
+            return True, deleted
+        elif isinstance(node, ast.Subscript):
+            # sys.modules[__name__]
+            value = node.value
+            if (isinstance(value, ast.Attribute) and value.attr == 'modules'
+                    and isinstance(value.value, ast.Name)
+                    and value.value.id == 'sys'):
+                return True, deleted
+    return maybe, deleted
+
+def _bind_names(body, names, package):
+    import ast
+    # some node types are missing in older pythons
+    functions = (ast.FunctionDef, getattr(ast, 'AsyncFunctionDef', ()))
+    annassign = getattr(ast, 'AnnAssign', ())
+    assigns = (ast.Assign, ast.AugAssign, annassign)
+    loops = (ast.For, getattr(ast, 'AsyncFor', ()))
+    withs = (ast.With, getattr(ast, 'AsyncWith', ()))
+    match = getattr(ast, 'Match', ())
+    for node in body:
+        if isinstance(node, functions + (ast.ClassDef,)):
+            if node.name == '__getattr__':
+                return False
+            names[node.name] = None
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    names[alias.asname] = alias.name
+                else:
+                    head = alias.name.partition(_DOT)[0]
+                    names[head] = head
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ''
+            if node.level:
+                parts = (package or '').split(_DOT)
+                if node.level > 1:
+                    parts = parts[:1-node.level]
+                base = _DOT.join(x for x in parts + [base] if x)
+            for alias in node.names:
+                if alias.name == '*':
+                    return False
+                names[alias.asname or alias.name] = base + _DOT + alias.name
+        elif isinstance(node, assigns):
+            if isinstance(node, annassign) and node.value is None:
+                continue
+            targets = getattr(node, 'targets', None) or [node.target]
+            for target in targets:
+                _bind_target(target, names)
+        elif isinstance(node, loops):
+            _bind_target(node.target, names)
+        elif isinstance(node, withs):
+            for item in node.items:
+                if item.optional_vars is not None:
+                    _bind_target(item.optional_vars, names)
+        elif isinstance(node, match):
+            for case in node.cases:
+                for sub in ast.walk(case.pattern):
+                    for name in (getattr(sub, 'name', None),
+                                 getattr(sub, 'rest', None)):
+                        if name:
+                            names[name] = None
+                if not _bind_names(case.body, names, package):
+                    return False
+        for field in ('body', 'orelse', 'finalbody'):
+            sub = getattr(node, field, None)
+            if (isinstance(sub, list) and sub
+                    and isinstance(sub[0], ast.stmt)
+                    and not isinstance(node, functions + (ast.ClassDef,))):
+                if not _bind_names(sub, names, package):
+                    return False
+        for handler in getattr(node, 'handlers', ()):
+            if handler.name:
+                names[handler.name] = None
+            if not _bind_names(handler.body, names, package):
+                return False
+    return True
+
+def _bind_target(target, names):
+    import ast
+    if isinstance(target, ast.Name):
+        names[target.id] = None
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        for elt in target.elts:
+            _bind_target(elt, names)
+    elif isinstance(target, ast.Starred):
+        _bind_target(target.value, names)
+
+def export_plans():
+    """Returns the compiled resolution plans of the paths resolved so far.
+    
+    Returns:
+        dict: a dictionary mapping paths to plans. A plan is a string
+            having one character for each segment of the path: ``'m'``
+            for a segment imported as a module, ``'a'`` for an attribute
+            access and ``'b'`` for a builtin object at the root of the path.
+    
+    The dictionary can be serialized, for example with :mod:`json`,
+    and given to :func:`import_plans()` in another process so that
+    symbols are resolved without trial imports from the start.
+    
+    Example:
+        >>> Symbol('xml.dom.minidom.parseString')().getvalue()
+        <function parseString at ...>
+        >>> export_plans()['xml.dom.minidom.parseString']
+        'mmma'
+    """
+    return dict(_plans)
+
+def import_plans(plans):
+    """Adds resolution plans obtained from :func:`export_plans()`.
+    
+    Args:
+        plans(mapping): a mapping from paths to plans.
+    
+    Raises:
+        ValueError: if one of the plans does not match its path.
+    
+    A plan that does not apply anymore is not an error: the
+    corresponding path is searched again and its plan recompiled.
+    """
+    checked = {}
+    for path, plan in dict(plans).items():
+        path, plan = str(path), str(plan)
+        n = len(path.split('.'))
+        if not (len(plan) == n and plan[0] in 'mb'
+                and set(plan[1:]) <= set('ma')
+                and (plan[0] == 'm' or set(plan[1:]) <= set('a'))):
+            raise ValueError(('Invalid resolution plan', path, plan))
+        checked[path] = plan
+    _plans.update(checked)
+
+class SymbolControl(object):
+    """SymbolControl(symb) -> new SymbolControl instance
+    
+    Args:
+        symb(Symbol): a symbol referenced by the SymbolControl object
+        
+    This is a class of lightweight wrappers around :class:`Symbol` instances
+    used to bypass the overriding of the dot operator in this class.
+    SymbolControl objects are returned by the :meth:`Symbol.__call__()`
+    method. Their main purpose is to hold methods to manipulate Symbols.
+    
+    Example:
+        >>> s = Symbol('os.path.isfile')
+        >>> s()
+        <symboldict.SymbolControl object ...>
+        >>> s().hasvalue()
+        True
+        >>> s().path()
+        'os.path.isfile'
+        >>> s().getvalue()
+        <function isfile ...>
+
+    """
+    __slots__ = ('__symb',)
+
+    def __init__(self, symb):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+        self.__symb = symb
+
+    def hasvalue(self, rule=Rule.TRY_LOAD_ONCE):
+        """Returns a boolean indicating if a value is available for the python object referenced symbolically by this instance.
+        
+        Args:
+            rule(Rule): a rule specifying how to obtain the object's value.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+                
+        Returns:
+            bool: a boolean indicating if a value is available for this instance.
+
+        This method returns True if the corresponding call to :meth:`getvalue()`
+        would succeed, and returns False if the call to :meth:`getvalue()` would
+        fail. In any case, it does not raise an exception.
+        
+        The rule argument has the same meaning as in :meth:`Symbol.getvalue()`.
+        
+        Example:
+            >>> a = Symbol('wave.Error')
+            >>> a().hasvalue()
+            True
+            >>> b = Symbol('spam.ham')
+            >>> b().hasvalue()
+            False
+        """
+        try:
+            _getvalue(self.__symb, rule)
+        except Exception:
+            return False
+        else:
+            return True
+
+    def exists(self, rule=None):
+        """Tells if the referenced python object exists without importing modules.
+        
+        Args:
+            rule(Rule or None): a rule used to load the object's value
+                when its existence cannot be decided without importing
+                a module. It defaults to None.
+        
+        Returns:
+            bool or None: True if the object exists, False if it does not,
+                and None if the answer is unknown and rule is None.
+        
+        Unlike :meth:`hasvalue()`, this method does not run the modules
+        that are not already imported. It looks for them with
+        :class:`importlib.machinery.PathFinder` and finds their attributes
+        by parsing their source code. The attributes of objects that are
+        already loaded are accessed normally. The answer is unknown when
+        a module has no python source, uses ``from ... import *`` or
+        defines a ``__getattr__()`` function, or when the path goes
+        through an attribute which is not a module or an imported name.
+        The answer is unknown too for a name which is not assigned in the
+        source of a module that binds names at run time, through
+        ``globals()``, ``vars()``, ``setattr()``, ``exec``, ``sys.modules``
+        or a ``global`` declaration. With python 2, the answer is always
+        unknown unless the object is already loaded.
+        If rule is not None, :meth:`hasvalue()` is then called with this rule.
+        
+        Example:
+            >>> Symbol('wave.Error')().exists()
+            True
+            >>> Symbol('wave.spam')().exists()
+            False
+            >>> Symbol('spam.ham')().exists()
+            False
+        """
+        symb = self.__symb
+        if _hasvalue(symb):
+            return True
+        found = _exists(_segments(symb) or ('',))
+        if found is None and rule is not None:
+            return self.hasvalue(rule)
+        return found
+
+    def getvalue(self, rule=Rule.TRY_LOAD_ONCE):
+        """Attempts to return the python object referenced symbolically by this instance.
+        
+        Args:
+            rule(Rule): a rule specifying how to obtain the object's value.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+            
+        Returns:
+            any: a python object referenced by this instance,
+                if such a value can be found.
+        
+        Raises:
+            Exception
+                met while trying to
+                obtain the value when it does not exist.
+        
+        This method tries to obtain a value by importing modules and taking
+        attributes according to the dotted path of the contained :class:`Symbol`
+        instance. In this path, the word before the first dot can be the
+        name of an importable module or that of a builtin python object
+        in the `__builtins__` dictionnary.
+        
+        If the object can not be  found, an exception is raised.
+        
+        Example:
+            >>> a = Symbol('wave.Error')
+            >>> a().getvalue()
+            <class 'wave.Error'>
+            
+        The `rule` parameter can be used to specify the policy
+        with respect to value search. The possible values are
+        
+        - ``Rule.TRY_LOAD_ONCE`` (default rule) The value
+            is searched once and stored in the ``Symbol`` instance. Subsequent
+            calls to ``getvalue()`` return the same value without trying
+            to reload the symbol. If the first search fails, subsequent
+            calls will fail without attempting to search the value. They
+            raise :class:`VoidValueError` with the exception of the first
+            search as ``__cause__``.
+            This rule handles most lazy import cases because symbol values
+            in imported modules usually don't vary. For example there is
+            no need to search the symbol ``Symbol('telnetlib.Telnet')``
+            more than once. This is a per-instance policy, which means that
+            a different instance with the same path will trigger a second search,
+            unless instances are shared through :func:`set_interning()`
+            or :func:`set_child_cache()`.
+            
+        - ``Rule.DONT_LOAD`` With this rule, there is no attempt to get
+            the symbol's value through imports or attribute accesses. It
+            means that the call will succeed only if a value was previously
+            found by a call to ``getvalue()`` or ``hasvalue()`` with a different
+            rule.
+            
+        - ``Rule.FORCE_RELOAD`` With this rule, an attempt is made to load
+            the symbol through imports and attribute access. It can be used
+            to handle cases where a variable changes in an imported module.
+            There is no attempt to reload imported modules. The value
+            found replaces the one stored in :data:`resolution_cache`.
+            
+        - ``Rule.TRY_LOAD_EACH`` With this rule, an attempt is made to load
+            the symbol's value only if the previous attempts failed
+            to obtain a value.
+            
+        - ``Rule.LAZY_IMPORT`` Like ``Rule.TRY_LOAD_ONCE``, but the modules
+            imported by the search are created by :class:`importlib.util.LazyLoader`.
+            Their body runs when one of their attributes is accessed, so that
+            a path ending at a module returns it at a very low cost. Intermediate
+            modules are loaded because the search needs their attributes.
+            Requires python 3.5 or later.
+            
+        - ``RetryAfter(seconds)`` Like ``Rule.TRY_LOAD_EACH``, but a failed
+            search is not attempted again before the given number of seconds.
+            
+        - ``Rule.REVALIDATE`` Returns the value already found as long as
+            the module owning it is the same object in ``sys.modules`` and
+            the name leading to the value in this module's namespace is
+            still bound to the same object. Otherwise, the value is searched
+            again from the start. The check costs two dictionary lookups.
+            A value found with a rule other than ``Rule.REVALIDATE`` or
+            ``ExpireAfter`` is searched again, because the module owning
+            it is only recorded by these rules.
+            
+        - ``ExpireAfter(seconds)`` Returns the value already found, or
+            raises the error of the previous search, if this search is less
+            than the given number of seconds old. Otherwise, the value is
+            searched again from the start. A value found with a rule other
+            than ``Rule.REVALIDATE`` or ``ExpireAfter`` is searched again.
+        
+        The search of a path is performed by a single thread at a time.
+        Other threads needing the same path while it is being searched
+        wait for the end of the search and share its result. A thread
+        waiting for more than a second, which happens when the searching
+        thread waits for a module imported by the waiting thread, or a
+        thread finding that the search ended without result, searches
+        the path itself.
+        
+        """
+        return _getvalue(self.__symb, rule)
+    
+    def agetvalue(self, rule=Rule.TRY_LOAD_ONCE, executor=None):
+        """Awaitable counterpart of :meth:`getvalue()`.
+        
+        Args:
+            rule(Rule): a rule specifying how to obtain the object's value.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+            executor(concurrent.futures.Executor): the executor where the
+                value is searched. It defaults to the event loop's default
+                executor.
+        
+        Returns:
+            coroutine: a coroutine returning the value of the symbol, or
+                raising the exception met while searching it.
+        
+        When the value is already available, the coroutine returns it
+        without leaving the event loop. Otherwise the imports run in
+        the executor, so that the event loop is not blocked. Coroutines
+        awaiting the same path on the same event loop share a single search.
+        A cancelled coroutine stops waiting, but the search completes in
+        its thread and stores the value found. Requires python 3.5 or later.
+        
+        Example:
+            >>> await Symbol('telnetlib.Telnet')().agetvalue()
+            <class 'telnetlib.Telnet'>
+        """
+        from ._aio import agetvalue
+        return agetvalue(self.__symb, rule, executor)
+
+    def error(self):
+        """Returns the exception of the last failed search of the referenced :class:`Symbol` instance.
+        
+        Returns:
+            Exception: the exception met by the last search if it failed,
+                or None if the symbol has a value or was never searched.
+        
+        Example:
+            >>> s = Symbol('spam.ham')
+            >>> s().hasvalue()
+            False
+            >>> s().error()
+            ModuleNotFoundError("No module named 'spam'")
+        """
+        has, v = _readstate(self.__symb)
+        if has == _epoch or type(v) is not _Failure or v.epoch != _epoch:
+            return None
+        return v.error
+
+    def path(self):
+        """Returns the path of the referenced :class:`Symbol` instance.
+        
+        Example:
+            >>> s = Symbol('socket.socket')
+            >>> s().path()
+            'socket.socket'
+        """
+        return _readpath(self.__symb)
+    
+    def symbol(self):
+        """Returns the referenced :class:`Symbol` instance.
+        
+        Example:
+            >>> s = Symbol('socket.socket')
+            >>> s().symbol() is s
+            True
+        """
+        return self.__symb
+    
+_dictga = dict.__getitem__
+
+def _symbolitems(items, check, cache):
+    """Generates the items of a SymbolDict update with values converted to Symbols."""
+    interning = _interning
+    for k, v in items:
+        if check and k in _reserved:
+            raise TypeError(("Invalid key for strict SymbolDict", k))
+        if cache:
+            cache.pop(k, None)
+        if type(v) is str and not interning:
+            v = _newsymbol(Symbol, v) # fast path of Symbol(v)
+        elif not isinstance(v, Symbol):
+            v = Symbol(v)
+        yield k, v
+
+class _TrieNode(object):
+    __slots__ = ('children', 'keys')
+
+    def __init__(self):
+        self.children = {} # segment -> _TrieNode
+        self.keys = OrderedDict() # key -> Symbol ending at this node
+
+class _PathTrie(object):
+    """Index of the keys of a SymbolDict by the segments of their symbols' paths."""
+    __slots__ = ('root',)
+
+    def __init__(self, items=()):
+        self.root = _TrieNode()
+        for key, symb in items:
+            self.add(key, symb)
+
+    def add(self, key, symb):
+        node = self.root
+        for part in _segments(symb):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _TrieNode()
+            node = child
+        node.keys[key] = symb
+
+    def discard(self, key, symb):
+        parts = _segments(symb)
+        nodes = []
+        node = self.root
+        for part in parts:
+            nodes.append(node)
+            node = node.children.get(part)
+            if node is None:
+                return
+        node.keys.pop(key, None)
+        # prune the branches left empty
+        while nodes and not (node.keys or node.children):
+            parent = nodes.pop()
+            del parent.children[parts[len(nodes)]]
+            node = parent
+
+    def find(self, prefix):
+        """Returns the node of a tuple of segments, or None."""
+        node = self.root
+        for part in prefix:
+            node = node.children.get(part)
+            if node is None:
+                break
+        return node
+
+    def items(self, prefix):
+        """Generates the pairs (key, symbol) whose path is under prefix."""
+        node = self.find(prefix)
+        stack = [] if node is None else [node]
+        while stack:
+            node = stack.pop()
+            for item in node.keys.items():
+                yield item
+            stack.extend(reversed(list(node.children.values())))
+
+    def groups(self):
+        """Returns an OrderedDict mapping module names to lists of keys."""
+        groups = OrderedDict()
+        modules = sys.modules
+        stack = [(child, part, part) for part, child
+                 in reversed(list(self.root.children.items()))]
+        while stack:
+            node, path, module = stack.pop()
+            if node.keys:
+                groups.setdefault(module, []).extend(node.keys)
+            for part, child in reversed(list(node.children.items())):
+                sub = path + _DOT + part
+                stack.append((child, sub, sub if sub in modules else module))
+        return groups
+
+def _prefixpath(prefix):
+    return _readpath(prefix) if isinstance(prefix, Symbol) else prefix
+
+def _prefixparts(prefix):
+    if isinstance(prefix, Symbol):
+        return _segments(prefix)
+    return tuple(prefix.split(_DOT)) if prefix else ()
+
+class BaseSymbolDict(dict):
+    __slots__ = ('_strict', '_lazy', '_index')
+    
+    def __new__(cls, *args, **kwargs):
         instance = dict.__new__(cls)
+        instance._lazy = False
+        instance._index = None
+        if hasattr(instance, '__dict__'):
+            _symboldicts[id(instance)] = instance # see check_modules()
         return instance
     
     def __init__(self, *args, **kwargs):
         """x.__init__(...) initializes x; see help(type(x)) for signature"""
         dict.__init__(self)
         self._strict = True
-        self.update(dict(*args, **kwargs))
+        self.update(*args, **kwargs)
 
 class SymbolDict(BaseSymbolDict):
     """SymbolDict() -> new empty SymbolDict
@@ -511,6 +2404,57 @@ class SymbolDict(BaseSymbolDict):
             raise TypeError('Invalid key for strict SymbolDict')
         self._strict = value
     
+    @property
+    def lazy(self):
+        """Boolean enabling the lazy value proxies of this SymbolDict.
+        
+        When this property is True, accessing an attribute whose symbol
+        has not been loaded returns a :class:`LazyValue` proxy instead of
+        the symbol's value, without importing anything. The symbol is
+        loaded when the proxy is used.
+        
+        Example:
+            >>> sy = SymbolDict(Telnet='telnetlib.Telnet')
+            >>> sy.lazy = True
+            >>> t = sy.Telnet # telnetlib is not imported
+            >>> t
+            <class 'telnetlib.Telnet'>
+            >>> sy.Telnet
+            <class 'telnetlib.Telnet'>
+        """
+        return self._lazy
+    
+    @lazy.setter
+    def lazy(self, value):
+        self._lazy = bool(value)
+
+    @property
+    def indexed(self):
+        """Boolean enabling the path index of this SymbolDict.
+        
+        When this property is True, the keys are indexed in a trie by the
+        dot-separated segments of their symbols' paths. The trie is updated
+        by the methods modifying the dictionary, and it makes
+        :meth:`keys_under()`, :meth:`load_under()`, :meth:`invalidate_under()`
+        and :meth:`group_by_module()` proportional to the size of their
+        result instead of the size of the dictionary. These methods give
+        the same results without the index.
+        
+        Example:
+            >>> sy = SymbolDict(isfile='os.path.isfile', sep='os.sep')
+            >>> sy.indexed = True
+            >>> sy.keys_under('os.path')
+            ['isfile']
+        """
+        return self._index is not None
+
+    @indexed.setter
+    def indexed(self, value):
+        if not value:
+            self._index = None
+        elif self._index is None:
+            self._index = _PathTrie(dict.items(self))
+
     def update(self, *args, **kwargs):
         """sy.update([E, ]**F) -> None. Update SymbolDict ``sy`` from dict/iterable E and F.
         - If E is present and has a .keys() method, then does: ``for k in E: sy[k] = Symbol(E[k])``
@@ -518,36 +2462,101 @@ class SymbolDict(BaseSymbolDict):
         - In either case, this is followed by: ``for k in F: sy[k] = Symbol(F[k])``
         
         The only difference with :meth:`dict.update()` is that values are converted
-        to :class:`Symbol` instances.
+        to :class:`Symbol` instances. :class:`Symbol` values are stored as
+        they are, like in :meth:`__setitem__()`, and the values cached for
+        the updated keys are discarded.
+        
+        The items are streamed into the dictionary without intermediate
+        copy, so that E can be a generator producing a very large number
+        of items. In strict mode, the keys of a mapping are checked before
+        the update. The keys of an iterable are checked while it is
+        consumed: the items preceding an invalid key are kept.
         """
-        d = dict()
-        d.update(*args, **kwargs)
-        if self.strict:
-            if len(d) < len(_reserved):
-                b = any(k in _reserved for k in d.keys())
+        if len(args) > 1:
+            raise TypeError('update expected at most 1 arguments, got {}'.format(
+                len(args)))
+        if args:
+            other = args[0]
+            if isinstance(other, dict):
+                self.__update(other.keys(), other.items())
+            elif hasattr(other, 'keys'):
+                self.__update(other.keys(), ((k, other[k]) for k in other.keys()))
             else:
-                b = any(k in d for k in _reserved)
-            if b:
+                self.__update(None, other)
+        if kwargs:
+            self.__update(kwargs.keys(), kwargs.items())
+        
+    def __update(self, keys, items):
+        check = self._strict
+        if check and keys is not None:
+            if not _reserved.isdisjoint(keys):
                 raise TypeError('Invalid key for strict SymbolDict')
-        dict.update(self, [(k, Symbol(v)) for (k, v) in d.items()])
+            check = False
+        items = _symbolitems(items, check, self.__dict__)
+        if self._index is not None:
+            items = self.__indexed(items)
+        dict.update(self, items)
         
+    def __indexed(self, items):
+        index = self._index
+        for k, v in items:
+            old = dict.get(self, k)
+            if old is not None:
+                index.discard(k, old)
+            index.add(k, v)
+            yield k, v
         
     def __setitem__(self, k, v):
         """Like :meth:`dict.__setitem__()` but converts value to :class:`Symbol`"""
         if self._strict and k in _reserved:
             raise TypeError(("Invalid key for strict SymbolDict", k))
-        dict.__setitem__(self, k, v if isinstance(v, Symbol) else Symbol(v))
+        v = v if isinstance(v, Symbol) else Symbol(v)
+        index = self._index
+        if index is not None:
+            old = dict.get(self, k)
+            if old is not None:
+                index.discard(k, old)
+            index.add(k, v)
+        dict.__setitem__(self, k, v)
         self.__dict__.pop(k, None)
         
         
     def __delitem__(self, k):
+        if self._index is not None and k in self:
+            self._index.discard(k, _dictga(self, k))
         dict.__delitem__(self, k)
         self.__dict__.pop(k, None)
     
     
     def setdefault(self, k, v):
         """Like :meth:`dict.setdefault()` but converts value to :class:`Symbol`"""
-        return dict.setdefault(self, k, Symbol(v))
+        v = Symbol(v)
+        result = dict.setdefault(self, k, v)
+        if result is v and self._index is not None:
+            self._index.add(k, v)
+        return result
+    
+    def pop(self, k, *args):
+        """Like :meth:`dict.pop()` but keeps the path index up to date"""
+        if self._index is not None and k in self:
+            self._index.discard(k, _dictga(self, k))
+        self.__dict__.pop(k, None)
+        return dict.pop(self, k, *args)
+    
+    def popitem(self):
+        """Like :meth:`dict.popitem()` but keeps the path index up to date"""
+        k, v = dict.popitem(self)
+        if self._index is not None:
+            self._index.discard(k, v)
+        self.__dict__.pop(k, None)
+        return k, v
+    
+    def clear(self):
+        """Like :meth:`dict.clear()` but keeps the path index up to date"""
+        dict.clear(self)
+        self.__dict__.clear()
+        if self._index is not None:
+            self._index = _PathTrie()
     
     
     def __getattr__(self, attr):
@@ -563,7 +2572,15 @@ class SymbolDict(BaseSymbolDict):
         except KeyError:
             raise AttributeError(attr)
         else:
-            value = _readval(symb) if _readhas(symb) else _getvalue(symb, _ONCE)
+            has, value = _readstate(symb)
+            if has != _epoch:
+                if self._lazy and attr not in _reserved:
+                    value = LazyValue(self, attr, symb)
+                    self.__dict__[attr] = value
+                    return value
+                value = _getvalue(symb, _ONCE)
+            if _recorder is not None:
+                _recorder.record(_readpath(symb))
             if attr not in _reserved:
                 self.__dict__[attr] = value
             return value
@@ -572,96 +2589,485 @@ class SymbolDict(BaseSymbolDict):
         return '{}({})'.format(self.__class__.__name__, dict.__repr__(self))
 
 
-    def getvalue(self, key, rule=Rule.TRY_LOAD_ONCE):
-        """Attempts to return the python object referenced symbolically by the Symbol under the given key.
+    def getvalue(self, key, rule=Rule.TRY_LOAD_ONCE):
+        """Attempts to return the python object referenced symbolically by the Symbol under the given key.
+        
+        Args:
+            key(hashable): one of the dictionary keys of the wrapped SymbolDict instance.
+            rule(Rule): a rule specifying how to obtain the object's value.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+            
+        Returns:
+            any: a python object referenced by this instance,
+                if such a value can be found.
+        
+        Raises:
+            Exception
+                met while trying to
+                obtain the value when it does not exist.
+                Also raises KeyError if the key is missing in this SymbolDict.
+        
+        This method tries to obtain a value by importing modules and taking
+        attributes according to the dotted path of the :class:`Symbol`
+        instance ``self[key]``. In this path, the word
+        before the first dot can be the
+        name of an importable module or that of a builtin python object
+        in the `__builtins__` dictionnary.
+        
+        If the object can not be  found, an exception is raised.
+        
+        The ``rule`` argument has the same meaning as in
+        the :meth:`SymbolControl.getvalue()` method. See this method's
+        documentation for details.
+        
+        Example:
+            >>> sy = SymbolDict(err=Symbol('wave.Error'))
+            >>> sy.getvalue('err')
+            <class 'wave.Error'>
+        """
+        try:
+            symb = self[key]
+            v = _getvalue(symb, rule)
+            if _recorder is not None:
+                _recorder.record(_readpath(symb))
+            if key not in _reserved:
+                self.__dict__[key] = v
+            return v
+        except Exception:
+            if key in self.__dict__:
+                del self.__dict__[key]
+            raise
+
+    def hasvalue(self, key, rule=Rule.TRY_LOAD_ONCE):
+        """Returns a boolean indicating if a value is available for the python object referenced symbolically by the symbol under this key.
+        
+        Args:
+            key(hashable): one of the dictionary keys of this SymbolDict
+            rule(Rule): a rule specifying how to obtain the object's value.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+                
+        Returns:
+            bool: a boolean indicating if a value is available for this key.
+
+        Raises:
+            KeyError: if the key is missing.
+
+        If the key is missing in this SymbolDict, the method raises
+        a KeyError exception, otherwise, it returns True if the corresponding
+        call to :meth:`getvalue()`
+        would succeed, and returns False if the call to :meth:`getvalue()` would
+        fail.
+        
+        The rule argument has the same meaning as in :meth:`Symbol.getvalue()`.
+        See this method's documentation for details.
+        
+        Example:
+            >>> sy = SymbolDict(err='wave.Error', ham='spam.ham')
+            >>> sy.hasvalue('err')
+            True
+            >>> sy.hasvalue('ham')
+            False
+            >>> sy.hasvalue('eggs')
+            Traceback ...
+            KeyError
+        """
+        try:
+            symb = self[key]
+            v = _getvalue(symb, rule)
+            if key not in _reserved:
+                self.__dict__[key] = v
+            return True
+        except Exception:
+            if key in self.__dict__:
+                del self.__dict__[key]
+            return False
+
+    def exists(self, key, rule=None):
+        """Tells if the object referenced by the symbol under this key exists without importing modules.
+        
+        Args:
+            key(hashable): one of the dictionary keys of this SymbolDict
+            rule(Rule or None): a rule used to load the object's value
+                when its existence cannot be decided without importing
+                a module. It defaults to None.
+        
+        Returns:
+            bool or None: True if the object exists, False if it does not,
+                and None if the answer is unknown and rule is None.
+        
+        Raises:
+            KeyError: if the key is missing.
+        
+        See :meth:`SymbolControl.exists()` for details.
+        
+        Example:
+            >>> sy = SymbolDict(err='wave.Error', ham='wave.ham')
+            >>> sy.exists('err')
+            True
+            >>> sy.exists('ham')
+            False
+        """
+        symb = self[key]
+        return symb().exists(rule)
+        
+    def load_all(self, keys=None, rule=Rule.TRY_LOAD_ONCE):
+        """Attempts to obtain the values of many symbols of this SymbolDict in a single call.
+        
+        Args:
+            keys(iterable): the keys to load. All the keys are loaded
+                if this argument is None.
+            rule(Rule): a rule specifying how to obtain the objects' values.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+                
+        Returns:
+            tuple: a pair of dictionaries ``(values, errors)``. The first
+                maps the keys having a value to this value, the second maps
+                the other keys to the exception met while trying to obtain
+                their value, including KeyError for missing keys.
+        
+        No exception is raised for a failing key. The symbols are loaded
+        by :func:`resolve_many()`, which imports each module once, and
+        the values found are stored like in :meth:`getvalue()`.
+        
+        Example:
+            >>> sy = SymbolDict(isfile='os.path.isfile', ham='spam.ham')
+            >>> values, errors = sy.load_all()
+            >>> sorted(values), sorted(errors)
+            (['isfile'], ['ham'])
+        """
+        if keys is None:
+            pairs = list(dict.items(self))
+            missing = {}
+        else:
+            pairs, missing = [], {}
+            for key in keys:
+                try:
+                    pairs.append((key, _dictga(self, key)))
+                except KeyError as exc:
+                    missing[key] = exc
+        values, errors = _resolve_many(pairs, rule)
+        d = self.__dict__
+        for key, v in values.items():
+            if key not in _reserved:
+                d[key] = v
+        for key in errors:
+            d.pop(key, None)
+        errors.update(missing)
+        return values, errors
+
+    def keys_under(self, prefix):
+        """Returns the keys whose symbols' paths are under a prefix.
+        
+        Args:
+            prefix(str): a dot-separated path, or a :class:`Symbol`.
+            
+        Returns:
+            list: the keys whose symbol's path is ``prefix`` or starts
+                with ``prefix + '.'``. The empty prefix selects all keys.
+        
+        The keys are found in the path index when :attr:`indexed` is True,
+        and by scanning the dictionary otherwise.
+        
+        Example:
+            >>> sy = SymbolDict(isfile='os.path.isfile', sep='os.sep',
+            ...     pa='os.pathsep')
+            >>> sorted(sy.keys_under('os.path'))
+            ['isfile']
+            >>> sorted(sy.keys_under('os'))
+            ['isfile', 'pa', 'sep']
+        """
+        return [k for k, v in self.__under(prefix)]
+
+    def __under(self, prefix):
+        index = self._index
+        if index is None:
+            index = _PathTrie(dict.items(self))
+        return index.items(_prefixparts(prefix))
+
+    def load_under(self, prefix, rule=Rule.TRY_LOAD_ONCE):
+        """Attempts to obtain the values of the symbols under a prefix.
+        
+        Args:
+            prefix(str): a dot-separated path, or a :class:`Symbol`.
+            rule(Rule): a rule specifying how to obtain the objects' values.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+        
+        Returns:
+            tuple: a pair of dictionaries ``(values, errors)`` like
+                :meth:`load_all()` for the keys of :meth:`keys_under()`.
+        
+        Example:
+            >>> sy = SymbolDict(isfile='os.path.isfile', ham='spam.ham')
+            >>> values, errors = sy.load_under('os')
+            >>> sorted(values), sorted(errors)
+            (['isfile'], [])
+        """
+        return self.load_all(self.keys_under(prefix), rule)
+
+    def invalidate_under(self, prefix):
+        """Forgets the values of the symbols under a prefix.
+        
+        Args:
+            prefix(str): a dot-separated path, or a :class:`Symbol`.
+        
+        Returns:
+            list: the keys whose symbols were invalidated.
+        
+        The symbols of :meth:`keys_under()` are searched again at their
+        next access, the attributes cached for them by the living
+        SymbolDicts are discarded and the paths under ``prefix``
+        are removed from the :data:`resolution_cache`.
+        
+        Example:
+            >>> sy = SymbolDict(isfile='os.path.isfile')
+            >>> sy.isfile
+            <function isfile ...>
+            >>> sy.invalidate_under('os.path')
+            ['isfile']
+            >>> sy['isfile']().hasvalue(Rule.DONT_LOAD)
+            False
+        """
+        keys, cleared = [], {}
+        for k, symb in self.__under(prefix):
+            _clearvalue(symb)
+            cleared[id(symb)] = symb
+            keys.append(k)
+        resolution_cache.invalidate(prefix=_prefixpath(prefix))
+        _uncache(cleared)
+        return keys
+
+    def group_by_module(self):
+        """Groups the keys of this SymbolDict by module.
+        
+        Returns:
+            OrderedDict: a dictionary mapping module names to lists
+                of keys. The module of a key is the longest prefix of
+                its symbol's path found in :data:`sys.modules`, or the
+                first segment of the path if no prefix is imported.
+        
+        The keys of a group whose module is in :data:`sys.modules` need no
+        import, and the other groups can be loaded by a single import,
+        for example with :meth:`load_all()`.
+        
+        Example:
+            >>> sy = SymbolDict(isfile='os.path.isfile', ham='spam.ham',
+            ...     eggs='spam.eggs')
+            >>> sy.group_by_module()
+            OrderedDict([('os.path', ['isfile']), ('spam', ['ham', 'eggs'])])
+        """
+        index = self._index
+        if index is None:
+            index = _PathTrie(dict.items(self))
+        return index.groups()
+
+    def preload(self, keys=None, workers=4, rule=Rule.TRY_LOAD_ONCE):
+        """Loads symbols of this SymbolDict in background threads.
+        
+        Args:
+            keys(iterable): the keys to load. All the keys are loaded
+                if this argument is None.
+            workers(int): the number of threads loading the symbols.
+            rule(Rule): a rule specifying how to obtain the objects' values.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+                
+        Returns:
+            dict: a dictionary mapping the keys to
+                :class:`concurrent.futures.Future` instances. The result of
+                a future is the value of the symbol, or the exception
+                met while trying to obtain this value.
+        
+        Raises:
+            KeyError: if one of the keys is missing in this SymbolDict.
+        
+        The method returns immediately. A thread which needs the value of
+        a symbol while a preloading thread is searching the same path
+        waits for the end of this search instead of starting another one
+        (see :meth:`SymbolControl.getvalue()`).
+        The values found are stored like in :meth:`getvalue()`.
+        
+        Example:
+            >>> sy = SymbolDict(Telnet='telnetlib.Telnet', isfile='os.path.isfile')
+            >>> futures = sy.preload(workers=2)
+            >>> sy.Telnet # waits for the preloading thread if needed
+            <class 'telnetlib.Telnet'>
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        keys = list(self) if keys is None else list(keys)
+        symbs = [_dictga(self, key) for key in keys]
+        executor = ThreadPoolExecutor(max_workers=max(1, int(workers)))
+        try:
+            return dict((key, executor.submit(self.__preload, key, symb, rule))
+                        for key, symb in zip(keys, symbs))
+        finally:
+            executor.shutdown(wait=False)
+
+    def __preload(self, key, symb, rule):
+        v = _getvalue(symb, rule)
+        if key not in _reserved and dict.get(self, key) is symb:
+            self.__dict__[key] = v
+        return v
+
+    def aget(self, key, rule=Rule.TRY_LOAD_ONCE, executor=None):
+        """Awaitable counterpart of :meth:`getvalue()`.
         
         Args:
-            key(hashable): one of the dictionary keys of the wrapped SymbolDict instance.
+            key(hashable): one of the dictionary keys of this SymbolDict.
             rule(Rule): a rule specifying how to obtain the object's value.
                 It defaults to ``Rule.TRY_LOAD_ONCE``.
-            
+            executor(concurrent.futures.Executor): the executor where the
+                value is searched. It defaults to the event loop's default
+                executor.
+        
         Returns:
-            any: a python object referenced by this instance,
-                if such a value can be found.
+            coroutine: a coroutine returning the value of the symbol,
+                or raising the exception met while searching it.
         
         Raises:
-            Exception
-                met while trying to
-                obtain the value when it does not exist.
-                Also raises KeyError if the key is missing in this SymbolDict.
+            KeyError: when the coroutine runs, if the key is missing.
         
-        This method tries to obtain a value by importing modules and taking
-        attributes according to the dotted path of the :class:`Symbol`
-        instance ``self[key]``. In this path, the word
-        before the first dot can be the
-        name of an importable module or that of a builtin python object
-        in the `__builtins__` dictionnary.
+        See :meth:`SymbolControl.agetvalue()` for details.
         
-        If the object can not be  found, an exception is raised.
+        Example:
+            >>> sy = SymbolDict(Telnet='telnetlib.Telnet')
+            >>> await sy.aget('Telnet')
+            <class 'telnetlib.Telnet'>
+        """
+        from ._aio import aget
+        return aget(self, key, rule, executor)
+
+    def awarmup(self, keys=None, concurrency=8,
+                rule=Rule.TRY_LOAD_ONCE, executor=None):
+        """Awaitable loading of many symbols of this SymbolDict.
         
-        The ``rule`` argument has the same meaning as in
-        the :meth:`SymbolControl.getvalue()` method. See this method's
-        documentation for details.
+        Args:
+            keys(iterable): the keys to load. All the keys are loaded
+                if this argument is None.
+            concurrency(int): the maximum number of symbols searched
+                at the same time.
+            rule(Rule): a rule specifying how to obtain the objects' values.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+            executor(concurrent.futures.Executor): the executor where the
+                values are searched.
         
+        Returns:
+            coroutine: a coroutine returning a pair of dictionaries
+                ``(values, errors)`` as in :meth:`load_all()`.
+                
         Example:
-            >>> sy = SymbolDict(err=Symbol('wave.Error'))
-            >>> sy.getvalue('err')
-            <class 'wave.Error'>
+            >>> values, errors = await sy.awarmup(concurrency=4)
         """
-        try:
-            v = _getvalue(self[key], rule)
-            if key not in _reserved:
-                self.__dict__[key] = v
-            return v
-        except Exception:
-            if key in self.__dict__:
-                del self.__dict__[key]
-            raise
+        from ._aio import awarmup
+        return awarmup(self, keys, concurrency, rule, executor)
 
-    def hasvalue(self, key, rule=Rule.TRY_LOAD_ONCE):
-        """Returns a boolean indicating if a value is available for the python object referenced symbolically by the symbol under this key.
+    def stats(self):
+        """Returns a snapshot of the loading statistics of the symbols in this SymbolDict.
+        
+        Returns:
+            dict: a dictionary mapping the keys having statistics to
+                dictionaries described in the module-level :func:`stats()`
+                function. Symbols are identified by path, thus the statistics
+                of a key include the loads of the same path elsewhere.
+        
+        Statistics are collected only while enabled by :func:`set_stats()`.
+        """
+        if _stats is None:
+            return {}
+        pairs = [(k, _readpath(v)) for k, v in dict.items(self)]
+        data = _stats.snapshot(set(p for k, p in pairs))
+        return dict((k, data[p]) for k, p in pairs if p in data)
+
+    def preload_from_manifest(self, manifest, workers=1, rule=Rule.TRY_LOAD_ONCE):
+        """Preloads the symbols of this SymbolDict listed in a manifest file.
         
         Args:
-            key(hashable): one of the dictionary keys of this SymbolDict
-            rule(Rule): a rule specifying how to obtain the object's value.
+            manifest(str): the name of a file written by :func:`write_manifest()`.
+            workers(int): the number of threads loading the symbols. With
+                the default value 1, the symbols are loaded in the order
+                of their first use in the recorded process.
+            rule(Rule): a rule specifying how to obtain the objects' values.
                 It defaults to ``Rule.TRY_LOAD_ONCE``.
                 
         Returns:
-            bool: a boolean indicating if a value is available for this key.
+            dict: a dictionary mapping keys to futures, as in :meth:`preload()`.
+        
+        Only the keys whose symbol's path appears in the manifest are loaded.
+        
+        Example:
+            >>> futures = sy.preload_from_manifest('worker.manifest.json')
+        """
+        order = dict((entry['path'], entry['order'])
+                     for entry in read_manifest(manifest))
+        keys = [(order[_readpath(v)], k) for k, v in dict.items(self)
+                if _readpath(v) in order]
+        keys.sort(key=lambda x: x[0])
+        return self.preload([k for o, k in keys], workers, rule)
 
-        Raises:
-            KeyError: if the key is missing.
+    def overlay(self, *args, **kwargs):
+        """Returns a copy-on-write overlay of this SymbolDict.
+        
+        Args:
+            args, kwargs: the overridden entries, as in :meth:`update()`
+            
+        Returns:
+            SymbolDictOverlay: a new overlay having this SymbolDict as base.
+        
+        The overlay stores only the overridden entries and shares the
+        values already resolved by this SymbolDict. See
+        :class:`SymbolDictOverlay` for details.
+        
+        Example:
+            >>> sy = SymbolDict(isfile='os.path.isfile', dumps='json.dumps')
+            >>> tenant = sy.overlay(dumps='pickle.dumps')
+            >>> tenant['dumps'], tenant['isfile']
+            (Symbol('pickle.dumps'), Symbol('os.path.isfile'))
+        """
+        return SymbolDictOverlay(self, *args, **kwargs)
 
-        If the key is missing in this SymbolDict, the method raises
-        a KeyError exception, otherwise, it returns True if the corresponding
-        call to :meth:`getvalue()`
-        would succeed, and returns False if the call to :meth:`getvalue()` would
-        fail.
+    def freeze(self, keys=None, rule=Rule.TRY_LOAD_ONCE):
+        """Returns an immutable snapshot of the values of this SymbolDict.
         
-        The rule argument has the same meaning as in :meth:`Symbol.getvalue()`.
-        See this method's documentation for details.
+        Args:
+            keys(iterable): the keys of the snapshot. All the keys are
+                included if this argument is None.
+            rule(Rule): a rule specifying how to obtain the objects' values.
+                It defaults to ``Rule.TRY_LOAD_ONCE``.
+        
+        Returns:
+            FrozenSymbolDict: an object having one attribute for each key,
+                set to the value of the key's symbol.
+        
+        Raises:
+            Exception: the exception met while trying to obtain the value
+                of the first key without value, KeyError for a missing key.
+            ValueError: if a key is not a valid attribute name, or starts
+                with two underscores.
+        
+        The values are loaded as by :meth:`load_all()` and stored in
+        the fixed slots of the snapshot. Reading them is a plain
+        attribute access, without any fallback logic, and reading a missing
+        attribute raises AttributeError immediately. The snapshot cannot be
+        modified, so that it can be shared by threads. It is hashable.
+        Later changes of the SymbolDict or of the symbols' values do not
+        affect it.
         
         Example:
-            >>> sy = SymbolDict(err='wave.Error', ham='spam.ham')
-            >>> sy.hasvalue('err')
-            True
-            >>> sy.hasvalue('ham')
-            False
-            >>> sy.hasvalue('eggs')
+            >>> sy = SymbolDict(isfile='os.path.isfile', Telnet='telnetlib.Telnet')
+            >>> fz = sy.freeze()
+            >>> fz.isfile
+            <function isfile ...>
+            >>> fz
+            FrozenSymbolDict(Telnet=<class 'telnetlib.Telnet'>, isfile=<function isfile ...>)
+            >>> fz.isfile = None
             Traceback ...
-            KeyError
+            AttributeError: FrozenSymbolDict is immutable
         """
-        try:
-            symb = self[key]
-            v = _getvalue(symb, rule)
-            if key not in _reserved:
-                self.__dict__[key] = v
-            return True
-        except Exception:
-            if key in self.__dict__:
-                del self.__dict__[key]
-            return False
-        
+        keys = list(dict.keys(self) if keys is None else keys)
+        values, errors = self.load_all(keys, rule)
+        for key in keys:
+            if key in errors:
+                raise errors[key]
+        return _freeze(values)
+
     @deprecated
     def __call__(self):
         """Deprecated method. Returns the calling instance."""
@@ -672,7 +3078,562 @@ class SymbolDict(BaseSymbolDict):
         """Deprecated method. Returns the calling instance."""
         return self
 
+try:
+    from collections.abc import Mapping as _Mapping, MutableMapping as _MutableMapping
+except ImportError: # python 2
+    from collections import Mapping as _Mapping, MutableMapping as _MutableMapping
+
+class SymbolDictOverlay(_MutableMapping):
+    """SymbolDictOverlay(base, *args, **kwargs) -> new SymbolDictOverlay instance
+    
+    Args:
+        base(SymbolDict): the underlying SymbolDict, or another overlay.
+        args, kwargs: the overridden entries, as in :meth:`SymbolDict.update()`
+    
+    An overlay is a mapping showing the entries of a base SymbolDict,
+    some of them being overridden by the overlay's own entries. It stores
+    only these entries, so that it is created in constant time for a given
+    number of overrides. Like :class:`collections.ChainMap`, the items set
+    or deleted in the overlay don't change the base, and deleting a key
+    which is only in the base raises KeyError.
+    
+    Attribute access, :meth:`getvalue()`, :meth:`hasvalue()`,
+    :meth:`exists()`, :meth:`load_all()` and :meth:`freeze()` behave as in
+    :class:`SymbolDict`. The keys which are not overridden are delegated to
+    the base, whose cache of resolved values is shared by all its overlays:
+    reading such an attribute stores nothing in the overlay. The overlay
+    is strict when its base is strict at creation time.
+    
+    Example:
+        >>> sy = SymbolDict(isfile='os.path.isfile', dumps='json.dumps')
+        >>> tenant = sy.overlay(dumps='pickle.dumps')
+        >>> tenant.dumps
+        <built-in function dumps>
+        >>> tenant.isfile is sy.isfile
+        True
+        >>> sorted(tenant)
+        ['dumps', 'isfile']
+        >>> sy['dumps']
+        Symbol('json.dumps')
+    """
+    __slots__ = ('__base', '__layer')
+    
+    def __init__(self, base, *args, **kwargs):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+        layer = SymbolDict()
+        layer.strict = base.strict
+        layer.update(*args, **kwargs)
+        self.__base = base
+        self.__layer = layer
+        
+    @property
+    def strict(self):
+        return self.__layer.strict
+    
+    @strict.setter
+    def strict(self, value):
+        self.__layer.strict = value
+    
+    def overlay(self, *args, **kwargs):
+        """Returns a new overlay having this overlay as base, see :meth:`SymbolDict.overlay()`."""
+        return SymbolDictOverlay(self, *args, **kwargs)
+    
+    def __getitem__(self, key):
+        layer = self.__layer
+        if key in layer:
+            return _dictga(layer, key)
+        return self.__base[key]
+    
+    def __setitem__(self, key, value):
+        self.__layer[key] = value
+        
+    def __delitem__(self, key):
+        del self.__layer[key]
+        
+    def __contains__(self, key):
+        return key in self.__layer or key in self.__base
+    
+    def __iter__(self):
+        layer = self.__layer
+        for key in layer:
+            yield key
+        for key in self.__base:
+            if key not in layer:
+                yield key
+                
+    def __len__(self):
+        base = self.__base
+        return len(base) + sum(1 for key in self.__layer if key not in base)
+    
+    def __getattr__(self, attr):
+        """Identical to ``self.getvalue(attr)`` but raises AttributeError if attr is not a dictionary key."""
+        try:
+            # the slots are unset while copy or pickle rebuild the overlay
+            layer = object.__getattribute__(self, '_SymbolDictOverlay__layer')
+            base = object.__getattribute__(self, '_SymbolDictOverlay__base')
+        except AttributeError:
+            raise AttributeError(attr)
+        if attr in layer:
+            return getattr(layer, attr)
+        if attr in base:
+            return getattr(base, attr)
+        raise AttributeError(attr)
+    
+    def __repr__(self):
+        return '{}({!r}, {!r})'.format(
+            type(self).__name__, self.__base, dict(self.__layer))
+    
+    def __owner(self, key):
+        layer = self.__layer
+        return layer if key in layer else self.__base
+    
+    def copy(self):
+        """Returns a new overlay with the same base and a copy of the overridden entries."""
+        return SymbolDictOverlay(self.__base, self.__layer)
+    
+    __copy__ = copy
+    
+    def getvalue(self, key, rule=Rule.TRY_LOAD_ONCE):
+        """See :meth:`SymbolDict.getvalue()`."""
+        return self.__owner(key).getvalue(key, rule)
+    
+    def hasvalue(self, key, rule=Rule.TRY_LOAD_ONCE):
+        """See :meth:`SymbolDict.hasvalue()`."""
+        return self.__owner(key).hasvalue(key, rule)
+    
+    def exists(self, key, rule=None):
+        """See :meth:`SymbolDict.exists()`."""
+        return self.__owner(key).exists(key, rule)
+    
+    def load_all(self, keys=None, rule=Rule.TRY_LOAD_ONCE):
+        """See :meth:`SymbolDict.load_all()`."""
+        layer = self.__layer
+        keys = list(self) if keys is None else list(keys)
+        values, errors = layer.load_all(
+            [k for k in keys if k in layer], rule)
+        more = self.__base.load_all(
+            [k for k in keys if k not in layer], rule)
+        values.update(more[0])
+        errors.update(more[1])
+        return values, errors
+    
+    def freeze(self, keys=None, rule=Rule.TRY_LOAD_ONCE):
+        """See :meth:`SymbolDict.freeze()`."""
+        keys = list(self) if keys is None else list(keys)
+        values, errors = self.load_all(keys, rule)
+        for key in keys:
+            if key in errors:
+                raise errors[key]
+        return _freeze(values)
+
+class PersistentSymbolDict(_Mapping):
+    """PersistentSymbolDict(*args, **kwargs) -> new PersistentSymbolDict instance
+    
+    Args:
+        args, kwargs: the initial entries, as in :class:`SymbolDict`.
+    
+    A persistent SymbolDict is an immutable mapping of keys to
+    :class:`Symbol` instances. The methods :meth:`set()`, :meth:`delete()`
+    and :meth:`merge()` return new versions of the mapping, which share
+    with the previous version all the structure that the change does not
+    touch: the entries are stored in a hash array mapped trie, and an
+    update creates only a few nodes along the path to the changed keys.
+    The versions also share their :class:`Symbol` instances, hence the
+    values already resolved. :meth:`diff()` compares two versions in
+    time proportional to the number of changes between them.
+    
+    Attribute access, :meth:`getvalue()`, :meth:`hasvalue()` and
+    :meth:`exists()` behave as in :class:`SymbolDict`. Since the values
+    are stored in the symbols, there is no attribute cache to invalidate.
+    A PersistentSymbolDict is always strict: it refuses the keys which
+    are names of attributes of :class:`SymbolDict` or of this class.
+    
+    Example:
+        >>> v1 = PersistentSymbolDict(isfile='os.path.isfile')
+        >>> v2 = v1.set('dumps', 'json.dumps')
+        >>> sorted(v1), sorted(v2)
+        (['isfile'], ['dumps', 'isfile'])
+        >>> v2.dumps
+        <function dumps at ...>
+        >>> v2['isfile'] is v1['isfile']
+        True
+        >>> v1.diff(v2)
+        {'dumps': (None, Symbol('json.dumps'))}
+    """
+    __slots__ = ('__root', '__len')
+    
+    def __init__(self, *args, **kwargs):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+        self.__root, self.__len = _hamt.EMPTY, 0
+        if args or kwargs:
+            self.__root, self.__len = self.__update(*args, **kwargs)
+    
+    def __new(self, root, size):
+        new = object.__new__(type(self))
+        new.__root, new.__len = root, size
+        return new
+    
+    def __update(self, *args, **kwargs):
+        root, size = self.__root, self.__len
+        assoc, keyhash = _hamt.assoc, _hamt.keyhash
+        for k, v in _mappingitems(*args, **kwargs):
+            if k in _preserved:
+                raise TypeError(("Invalid key for strict PersistentSymbolDict", k))
+            if type(v) is str and not _interning:
+                v = _newsymbol(Symbol, v)
+            elif not isinstance(v, Symbol):
+                v = Symbol(v)
+            root, added = assoc(root, keyhash(k), k, v)
+            size += added
+        return root, size
+    
+    def set(self, key, value):
+        """Returns a new version where key is mapped to ``Symbol(value)``.
+        
+        Example:
+            >>> v1 = PersistentSymbolDict()
+            >>> v2 = v1.set('isfile', 'os.path.isfile')
+            >>> v2['isfile']
+            Symbol('os.path.isfile')
+        """
+        return self.__new(*self.__update(((key, value),)))
+    
+    def delete(self, key):
+        """Returns a new version without key.
+        
+        Raises:
+            KeyError: if the key is missing.
+        """
+        root, removed = _hamt.dissoc(self.__root, _hamt.keyhash(key), key)
+        if not removed:
+            raise KeyError(key)
+        return self.__new(_hamt.EMPTY if root is None else root, self.__len - 1)
+    
+    def merge(self, *args, **kwargs):
+        """Returns a new version updated as by :meth:`SymbolDict.update()`.
+        
+        Example:
+            >>> v1 = PersistentSymbolDict(isfile='os.path.isfile')
+            >>> v2 = v1.merge({'isdir': 'os.path.isdir'}, sep='os.sep')
+            >>> sorted(v2)
+            ['isdir', 'isfile', 'sep']
+        """
+        return self.__new(*self.__update(*args, **kwargs))
+    
+    def diff(self, other):
+        """Returns the changes from this version to another one.
+        
+        Args:
+            other(PersistentSymbolDict): another version.
+        
+        Returns:
+            dict: a dictionary mapping the keys whose symbol differ
+                to pairs ``(old, new)`` where old is the symbol in this
+                version and new the symbol in the other version. A missing
+                key is represented by None.
+        
+        The parts of the two versions that are shared are not compared,
+        so that the time needed is proportional to the number of changes
+        when other is derived from this version or the converse.
+        """
+        missing = _hamt.missing
+        return dict(
+            (k, (None if old is missing else old, None if new is missing else new))
+            for k, old, new in _hamt.diff(self.__root, other.__root))
+    
+    def __getitem__(self, key):
+        v = _hamt.get(self.__root, _hamt.keyhash(key), key, _MISSING)
+        if v is _MISSING:
+            raise KeyError(key)
+        return v
+    
+    def __contains__(self, key):
+        return _hamt.get(self.__root, _hamt.keyhash(key), key, _MISSING) is not _MISSING
+    
+    def __iter__(self):
+        for leaf in _hamt.leaves(self.__root):
+            yield leaf[1]
+            
+    def __len__(self):
+        return self.__len
+    
+    def __getattr__(self, attr):
+        """Identical to ``self.getvalue(attr)`` but raises AttributeError if attr is not a dictionary key."""
+        symb = _hamt.get(self.__root, _hamt.keyhash(attr), attr)
+        if symb is None:
+            raise AttributeError(attr)
+        has, v = _readstate(symb)
+        if has != _epoch:
+            v = _getvalue(symb, _ONCE)
+        return v
+    
+    def __setattr__(self, attr, value):
+        if attr.startswith('_PersistentSymbolDict__'):
+            object.__setattr__(self, attr, value)
+        else:
+            raise AttributeError('PersistentSymbolDict is immutable')
+    
+    def __repr__(self):
+        return 'PersistentSymbolDict({!r})'.format(dict(self.items()))
+    
+    def __reduce__(self):
+        return (PersistentSymbolDict, (dict(
+            (k, _readpath(v)) for k, v in self.items()),))
+    
+    def __copy__(self):
+        return self
+    
+    def getvalue(self, key, rule=Rule.TRY_LOAD_ONCE):
+        """See :meth:`SymbolDict.getvalue()`."""
+        return _getvalue(self[key], rule)
+    
+    def hasvalue(self, key, rule=Rule.TRY_LOAD_ONCE):
+        """See :meth:`SymbolDict.hasvalue()`."""
+        return self[key]().hasvalue(rule)
+    
+    def exists(self, key, rule=None):
+        """See :meth:`SymbolDict.exists()`."""
+        return self[key]().exists(rule)
+    
+    def thaw(self):
+        """Returns a new :class:`SymbolDict` holding the symbols of this version."""
+        return SymbolDict(self.items())
+
+def _mappingitems(*args, **kwargs):
+    """Generates the items of the arguments of dict.update()."""
+    if len(args) > 1:
+        raise TypeError('expected at most 1 arguments, got {}'.format(len(args)))
+    if args:
+        other = args[0]
+        if isinstance(other, dict):
+            for item in other.items():
+                yield item
+        elif hasattr(other, 'keys'):
+            for k in other.keys():
+                yield k, other[k]
+        else:
+            for k, v in other:
+                yield k, v
+    for item in kwargs.items():
+        yield item
+
+class FrozenSymbolDict(object):
+    """The base class of the snapshots returned by :meth:`SymbolDict.freeze()`.
+    
+    The snapshots are instances of subclasses having a slot for each key.
+    These subclasses are created once for each set of keys. Two snapshots
+    are equal if they have the same keys and their values are the same
+    objects.
+    """
+    __slots__ = ()
+    
+    def __setattr__(self, attr, value):
+        raise AttributeError('FrozenSymbolDict is immutable')
+    
+    def __delattr__(self, attr):
+        raise AttributeError('FrozenSymbolDict is immutable')
+    
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(a is b for a, b in zip(_frozenvalues(self),
+                                          _frozenvalues(other)))
+    
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    def __hash__(self):
+        return hash((type(self),) + tuple(id(v) for v in _frozenvalues(self)))
+    
+    def __repr__(self):
+        return 'FrozenSymbolDict({})'.format(', '.join(
+            '{}={!r}'.format(k, v) for k, v in zip(
+                type(self).__slots__, _frozenvalues(self))))
+
+    def __reduce__(self):
+        return (_freeze, (dict(zip(type(self).__slots__,
+                                   _frozenvalues(self))),))
+
+def _frozenvalues(fz):
+    return [getattr(fz, k) for k in type(fz).__slots__]
+
+_frozen_classes = {}
+
+def _freeze(values):
+    """Returns a FrozenSymbolDict having the items of a dictionary as attributes."""
+    names = tuple(sorted(values))
+    cls = _frozen_classes.get(names)
+    if cls is None:
+        for name in names:
+            # names starting with '__' would clash with special attributes
+            # or be mangled by __slots__
+            if not (isinstance(name, (str, type(''))) and _isidentifier(name)
+                    ) or name.startswith('__'):
+                raise ValueError(('Invalid attribute name', name))
+        cls = type(FrozenSymbolDict)(
+            str('FrozenSymbolDict'), (FrozenSymbolDict,),
+            {'__slots__': names, '__module__': __name__})
+        cls = _frozen_classes.setdefault(names, cls)
+    fz = object.__new__(cls)
+    for name in names:
+        object.__setattr__(fz, name, values[name])
+    return fz
+
+try:
+    _isidentifier = str.isidentifier
+except AttributeError: # python 2
+    import re
+    _isidentifier = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$').match
+    del re
+
+class LazyValue(object):
+    """LazyValue(sd, key, symb) -> new LazyValue instance
+    
+    Args:
+        sd(SymbolDict): the SymbolDict where the proxy is installed.
+        key(str): the key of the symbol in sd.
+        symb(Symbol): the symbol whose value is represented.
+    
+    A transparent proxy for the value of a :class:`Symbol`, returned by
+    the attribute access of a :class:`SymbolDict` in lazy mode (see
+    :attr:`SymbolDict.lazy`). The symbol's value is loaded by the first
+    real use of the proxy: attribute access, call, comparison, hashing,
+    conversion to str, bytes or numbers, rounding, container, iteration,
+    arithmetic operations or ``os.fspath()``. The proxy
+    then replaces itself by this value in the SymbolDict's attribute
+    cache, so that later attribute accesses return the value directly.
+    ``isinstance()`` works with a proxy as first argument (through
+    ``__class__``) and as second argument when it represents a class.
+    With python 3.7 and later, the proxy of a class can also be a base
+    in a class statement. In-place operators such as ``+=`` apply to the
+    value, and rebind the name to the result.
+    
+    If the symbol has no value, its exception is raised by the operation
+    which uses the proxy.
+    """
+    __slots__ = ('_LazyValue__sd', '_LazyValue__key', '_LazyValue__symb',
+                 '__weakref__')
+    
+    def __init__(self, sd, key, symb):
+        """x.__init__(...) initializes x; see help(type(x)) for signature"""
+        _lazyset(self, '_LazyValue__sd', sd)
+        _lazyset(self, '_LazyValue__key', key)
+        _lazyset(self, '_LazyValue__symb', symb)
+    
+    def __getattribute__(self, attr):
+        if attr == '__mro_entries__':
+            return _lazyget(self, attr)
+        return getattr(_lazyresolve(self), attr)
+    
+    def __mro_entries__(self, bases):
+        # python >= 3.7, allows the proxy of a class as a base class
+        return (_lazyresolve(self),)
+    
+    def __setattr__(self, attr, value):
+        setattr(_lazyresolve(self), attr, value)
+    
+    def __delattr__(self, attr):
+        delattr(_lazyresolve(self), attr)
+    
+    def __dir__(self):
+        return dir(_lazyresolve(self))
+    
+    def __repr__(self):
+        return repr(_lazyresolve(self))
+    
+    def __str__(self):
+        return str(_lazyresolve(self))
+    
+    def __format__(self, spec):
+        return format(_lazyresolve(self), spec)
+    
+    def __hash__(self):
+        return hash(_lazyresolve(self))
+    
+    def __bool__(self):
+        return bool(_lazyresolve(self))
+    __nonzero__ = __bool__
+    
+    def __call__(self, *args, **kwargs):
+        return _lazyresolve(self)(*args, **kwargs)
+    
+    def __instancecheck__(self, obj):
+        return isinstance(obj, _lazyresolve(self))
+    
+    def __subclasscheck__(self, cls):
+        return issubclass(cls, _lazyresolve(self))
+
+    def __enter__(self):
+        return _lazyresolve(self).__enter__()
+    
+    def __exit__(self, *args):
+        return _lazyresolve(self).__exit__(*args)
+
+def _lazyforward(op, reflected=False):
+    if reflected:
+        def method(self, other):
+            return op(other, _lazyresolve(self))
+    else:
+        def method(self, *args):
+            return op(_lazyresolve(self), *args)
+    return method
+
+def _init_lazyvalue():
+    import math
+    import operator
+    unary = 'neg pos abs invert index'
+    binary = ('lt le eq ne gt ge getitem setitem delitem contains '
+              'add sub mul truediv floordiv mod pow and_ or_ xor lshift rshift')
+    reflected = 'add sub mul truediv floordiv mod pow and_ or_ xor lshift rshift'
+    inplace = ('iadd isub imul itruediv ifloordiv imod ipow iand ior ixor '
+               'ilshift irshift')
+    if hasattr(operator, 'matmul'): # python >= 3.5
+        binary += ' matmul'
+        reflected += ' matmul'
+        inplace += ' imatmul'
+    for name in (unary + ' ' + binary).split():
+        setattr(LazyValue, '__{}__'.format(name.rstrip('_')),
+                _lazyforward(getattr(operator, name)))
+    for name in reflected.split():
+        setattr(LazyValue, '__r{}__'.format(name.rstrip('_')),
+                _lazyforward(getattr(operator, name), True))
+    for name in inplace.split():
+        # mutates the value itself, and rebinds the name to it
+        setattr(LazyValue, '__{}__'.format(name),
+                _lazyforward(getattr(operator, name)))
+    funcs = dict(len=len, iter=iter, int=int, float=float, complex=complex,
+                 round=round, divmod=divmod, reversed=reversed, next=next,
+                 trunc=math.trunc, floor=math.floor, ceil=math.ceil)
+    if bytes is not str: # python 3, bytes is str in python 2
+        funcs['bytes'] = bytes
+    if hasattr(os, 'fspath'): # python >= 3.6
+        funcs['fspath'] = os.fspath
+    for name, func in funcs.items():
+        setattr(LazyValue, '__{}__'.format(name), _lazyforward(func))
+    LazyValue.__rdivmod__ = _lazyforward(divmod, True)
+    LazyValue.next = LazyValue.__next__ # python 2
+_init_lazyvalue()
+
+_lazyget = object.__getattribute__
+_lazyset = object.__setattr__
+
+def _lazyresolve(proxy):
+    """Returns the value represented by a LazyValue and installs it in the SymbolDict."""
+    symb = _lazyget(proxy, '_LazyValue__symb')
+    has, v = _readstate(symb)
+    if has != _epoch:
+        v = _getvalue(symb, _ONCE)
+        if _recorder is not None:
+            _recorder.record(_readpath(symb))
+    d = _lazyget(proxy, '_LazyValue__sd').__dict__
+    key = _lazyget(proxy, '_LazyValue__key')
+    if d.get(key) is proxy:
+        d[key] = v
+    return v
+
 _reserved = frozenset(dir(dict) + dir(SymbolDict) + ['_strict',])
+_preserved = _reserved | frozenset(dir(PersistentSymbolDict))
 # print(_reserved)
 
 def LaxSymbolDict(*args, **kwd):
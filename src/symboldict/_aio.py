@@ -0,0 +1,97 @@
+# -*-coding: utf8-*-
+"""asyncio support for symboldict (python 3.5 and later)
+
+This module is imported by the awaitable methods of
+:class:`symboldict.SymbolControl` and :class:`symboldict.SymbolDict`.
+"""
+import asyncio
+import functools
+import sys
+import weakref
+
+from . import (_DONT, _EACH, _ONCE, _REVAL, ExpireAfter, _clock,
+               _readpath, _readstamp, _readstate, _reserved, _setfailure,
+               _setvalue)
+
+_sd = sys.modules[__package__] # _getvalue may be replaced, see set_stats()
+
+_get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+# event loop -> {path: future of the search running in an executor}
+_inflight = weakref.WeakKeyDictionary()
+
+async def agetvalue(symb, rule=_ONCE, executor=None):
+    """Awaitable counterpart of :func:`symboldict._getvalue`.
+    
+    The search runs in ``executor`` (the loop's default executor if None).
+    Coroutines awaiting the same path on the same loop share one search.
+    Cancelling an awaiting coroutine does not cancel the shared search,
+    which completes in its thread and stores the value found.
+    """
+    has, v = _readstate(symb)
+    if has == _sd._epoch:
+        if rule is _ONCE or rule is _DONT or rule is _EACH:
+            return v
+        stamp = _readstamp(symb)
+        if stamp is not None:
+            if rule is _REVAL and stamp.isvalid():
+                return stamp.value
+            if (type(rule) is ExpireAfter
+                    and _clock() - stamp.time < rule.seconds):
+                return stamp.value
+    if rule is _DONT:
+        return _sd._getvalue(symb, rule) # never blocks
+    loop = _get_running_loop()
+    pending = _inflight.setdefault(loop, {})
+    path = _readpath(symb)
+    fut = pending.get(path)
+    if fut is None:
+        fut = loop.run_in_executor(
+            executor, functools.partial(_sd._getvalue, symb, rule))
+        pending[path] = fut
+        fut.add_done_callback(functools.partial(_done, pending, path))
+        return await asyncio.shield(fut)
+    # another coroutine is searching this path
+    try:
+        v = await asyncio.shield(fut)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        _setfailure(symb, exc)
+        raise
+    _setvalue(symb, v, rule)
+    return v
+
+def _done(pending, path, fut):
+    if pending.get(path) is fut:
+        del pending[path]
+
+async def aget(sd, key, rule=_ONCE, executor=None):
+    """Awaitable counterpart of :meth:`symboldict.SymbolDict.getvalue`."""
+    symb = sd[key]
+    try:
+        v = await agetvalue(symb, rule, executor)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        sd.__dict__.pop(key, None)
+        raise
+    if key not in _reserved and dict.get(sd, key) is symb:
+        sd.__dict__[key] = v
+    return v
+
+async def awarmup(sd, keys=None, concurrency=8, rule=_ONCE, executor=None):
+    """Awaitable counterpart of :meth:`symboldict.SymbolDict.load_all`."""
+    keys = list(sd) if keys is None else list(keys)
+    semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+    values, errors = {}, {}
+    async def load(key):
+        async with semaphore:
+            try:
+                values[key] = await aget(sd, key, rule, executor)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                errors[key] = exc
+    await asyncio.gather(*[load(key) for key in keys])
+    return values, errors
@@ -0,0 +1,216 @@
+# -*-coding: utf8-*-
+"""Hash array mapped trie for symboldict (persistent mappings)
+
+This module implements the immutable nodes used by
+:class:`symboldict.PersistentSymbolDict`. Every update returns a new
+root sharing the unchanged nodes with the previous one.
+
+A node is either a _Bitmap with up to 32 entries indexed by 5 bits of
+the keys' hashes, or a _Collision holding keys having the same hash.
+An entry of a _Bitmap is a leaf tuple ``(hash, key, value)`` or a node.
+"""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+
+_MASK = (1 << 64) - 1
+
+class _Bitmap(object):
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries
+
+class _Collision(object):
+    __slots__ = ('hash', 'entries')
+
+    def __init__(self, hash, entries):
+        self.hash = hash
+        self.entries = entries
+
+EMPTY = _Bitmap(0, ())
+
+def keyhash(key):
+    return hash(key) & _MASK
+
+try:
+    _popcount = int.bit_count
+except AttributeError: # python < 3.10
+    _popcount = lambda x: bin(x).count('1')
+
+def _bit(h, shift):
+    return 1 << ((h >> shift) & 31)
+
+def _index(bitmap, bit):
+    return _popcount(bitmap & (bit - 1))
+
+def _match(entry, h, key):
+    return entry[0] == h and (entry[1] is key or entry[1] == key)
+
+def get(node, h, key, default=None):
+    """Returns the value of key in the trie, or default."""
+    # the root is a _Bitmap, _bit() and _index() are inlined
+    bits = h
+    while True:
+        bitmap = node.bitmap
+        bit = 1 << (bits & 31)
+        if not bitmap & bit:
+            return default
+        entry = node.entries[_popcount(bitmap & (bit - 1))]
+        if type(entry) is tuple:
+            if entry[0] == h and (entry[1] is key or entry[1] == key):
+                return entry[2]
+            return default
+        if type(entry) is _Collision:
+            for entry in entry.entries:
+                if entry[1] is key or entry[1] == key:
+                    return entry[2]
+            return default
+        node = entry
+        bits >>= 5
+
+def _pair(e1, e2, shift):
+    """Returns a node holding two leaves with different keys."""
+    if e1[0] == e2[0]:
+        return _Collision(e1[0], (e1, e2))
+    b1, b2 = _bit(e1[0], shift), _bit(e2[0], shift)
+    if b1 == b2:
+        return _Bitmap(b1, (_pair(e1, e2, shift + 5),))
+    return _Bitmap(b1 | b2, (e1, e2) if b1 < b2 else (e2, e1))
+
+def assoc(node, h, key, value, shift=0):
+    """Returns (node, added) where node maps key to value."""
+    if type(node) is _Collision:
+        if h != node.hash:
+            # push the collision one level down
+            node = _Bitmap(_bit(node.hash, shift), (node,))
+            return assoc(node, h, key, value, shift)
+        entries = node.entries
+        for i, entry in enumerate(entries):
+            if _match(entry, h, key):
+                if entry[2] is value:
+                    return node, False
+                return _Collision(h, entries[:i] + ((h, key, value),)
+                                  + entries[i+1:]), False
+        return _Collision(h, entries + ((h, key, value),)), True
+    bitmap, entries = node.bitmap, node.entries
+    bit = _bit(h, shift)
+    i = _index(bitmap, bit)
+    if not bitmap & bit:
+        return _Bitmap(bitmap | bit, entries[:i] + ((h, key, value),)
+                       + entries[i:]), True
+    entry = entries[i]
+    if type(entry) is tuple:
+        if _match(entry, h, key):
+            if entry[2] is value:
+                return node, False
+            new, added = (h, key, value), False
+        else:
+            new, added = _pair(entry, (h, key, value), shift + 5), True
+    else:
+        new, added = assoc(entry, h, key, value, shift + 5)
+        if new is entry:
+            return node, False
+    return _Bitmap(bitmap, entries[:i] + (new,) + entries[i+1:]), added
+
+def dissoc(node, h, key, shift=0):
+    """Returns (node, removed) where node doesn't contain key.
+
+    The returned node is None if it is empty, or a leaf tuple if it
+    holds a single leaf and is not the root.
+    """
+    if type(node) is _Collision:
+        entries = node.entries
+        for i, entry in enumerate(entries):
+            if _match(entry, h, key):
+                entries = entries[:i] + entries[i+1:]
+                if len(entries) == 1:
+                    return entries[0], True
+                return _Collision(node.hash, entries), True
+        return node, False
+    bitmap, entries = node.bitmap, node.entries
+    bit = _bit(h, shift)
+    if not bitmap & bit:
+        return node, False
+    i = _index(bitmap, bit)
+    entry = entries[i]
+    if type(entry) is tuple:
+        if not _match(entry, h, key):
+            return node, False
+        new = None
+    else:
+        new, removed = dissoc(entry, h, key, shift + 5)
+        if not removed:
+            return node, False
+    if new is None:
+        bitmap ^= bit
+        entries = entries[:i] + entries[i+1:]
+        if not bitmap:
+            return None, True
+    else:
+        entries = entries[:i] + (new,) + entries[i+1:]
+    if shift and len(entries) == 1 and type(entries[0]) is tuple:
+        return entries[0], True
+    return _Bitmap(bitmap, entries), True
+
+def leaves(node):
+    """Generates the leaf tuples of a node or of a leaf."""
+    if type(node) is tuple:
+        yield node
+        return
+    for entry in node.entries:
+        if type(entry) is tuple:
+            yield entry
+        else:
+            for leaf in leaves(entry):
+                yield leaf
+
+def diff(a, b):
+    """Generates (key, old, new) for the keys whose value differ in two tries.
+
+    The old or new value is the ``missing`` marker below when the key
+    is absent. The subtrees shared by the two tries are not visited.
+    """
+    if a is b:
+        return
+    if type(a) is _Bitmap and type(b) is _Bitmap:
+        ba, bb = a.bitmap, b.bitmap
+        bits = ba | bb
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            ea = a.entries[_index(ba, bit)] if ba & bit else None
+            eb = b.entries[_index(bb, bit)] if bb & bit else None
+            for item in _diffentries(ea, eb):
+                yield item
+        return
+    for item in _difflists(leaves(a), leaves(b)):
+        yield item
+
+missing = object()
+
+def _diffentries(ea, eb):
+    if ea is eb:
+        return
+    if ea is None:
+        for leaf in leaves(eb):
+            yield leaf[1], missing, leaf[2]
+    elif eb is None:
+        for leaf in leaves(ea):
+            yield leaf[1], leaf[2], missing
+    elif type(ea) is not tuple and type(eb) is not tuple:
+        for item in diff(ea, eb):
+            yield item
+    else:
+        for item in _difflists(leaves(ea), leaves(eb)):
+            yield item
+
+def _difflists(la, lb):
+    old = dict((leaf[1], leaf[2]) for leaf in la)
+    for leaf in lb:
+        key, value = leaf[1], leaf[2]
+        v = old.pop(key, missing)
+        if v is not value:
+            yield key, v, value
+    for key, v in old.items():
+        yield key, v, missing
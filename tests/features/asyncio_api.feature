@@ -0,0 +1,28 @@
+Feature: Awaitable loading of symbols
+
+Background:
+    Given namespace
+
+Scenario: Awaiting aget returns the value and installs attribute proxy
+    Given sd pointing to Telnet
+    When aget is awaited for this key
+    Then result is stdlib Telnet object
+    And the symboldict instance has the value in its dict
+
+Scenario: Concurrent awaiters of the same key share one search
+    Given sd pointing to a slow symbol
+    When 8 coroutines await aget for the slow key
+    Then the slow path was searched once
+    And every coroutine obtained the value
+
+Scenario: Cancelled awaiter does not cancel the search
+    Given sd pointing to a slow symbol
+    When an awaiter of the slow key is cancelled
+    And aget is awaited for the slow key
+    Then the slow path was searched once
+
+Scenario: Warmup reports values and errors
+    Given sd pointing to existing and non existing symbols
+    When warmup is awaited with concurrency 2
+    Then existing keys are in values
+    And non existing keys are in errors
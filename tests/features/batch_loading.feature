@@ -0,0 +1,22 @@
+Feature: Batch loading of symbols
+
+Background:
+    Given namespace
+
+Scenario: Load all reports values and errors by key
+    Given sd pointing to existing and non existing symbols
+    When all keys are loaded
+    Then existing keys are in values
+    And non existing keys are in errors
+    And attribute proxies are installed for existing keys
+
+Scenario: Load all reports missing keys
+    Given sd pointing to existing and non existing symbols
+    When keys including a missing key are loaded
+    Then the missing key has a keyerror
+
+Scenario: Resolve many imports a missing root module once
+    Given several paths under a missing module
+    When these paths are resolved at once
+    Then the missing module is searched once
+    And every path has the same error
@@ -0,0 +1,29 @@
+Feature: Streaming SymbolDict update
+
+Background:
+    Given namespace
+    And an empty symboldict
+
+Scenario: Update consumes a generator
+    When the symboldict is updated from a generator of 1000 items
+    Then the symboldict has 1000 symbols
+
+Scenario: Update keeps the given Symbol instances
+    When the symboldict is updated with a Symbol instance
+    Then the symboldict holds this Symbol instance
+
+Scenario: Update discards the cached values of the updated keys
+    Given key isfile to os.path.isfile in the symboldict
+    When the attribute isfile is accessed
+    And the symboldict is updated with key isfile to os.path.isdir
+    Then the attribute isfile is os.path.isdir
+
+Scenario: Strict update from a mapping with a reserved key changes nothing
+    When the symboldict is updated from a mapping with a reserved key
+    Then TypeError is raised
+    And the symboldict is empty
+
+Scenario: Strict update from a generator stops at a reserved key
+    When the symboldict is updated from a generator with a reserved key
+    Then TypeError is raised
+    And the symboldict has the items preceding the reserved key
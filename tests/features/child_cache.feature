@@ -0,0 +1,28 @@
+Feature: Cache of the child symbols
+
+Background:
+    Given namespace
+    And a child cache w size 4
+
+Scenario: Repeated attribute chains return the cached children
+    When the chain symbol.os.path.isfile is built twice
+    Then the two chains are the same instance
+    And the value loaded by the first chain is available to the second
+
+Scenario: Child cache is bounded
+    When 10 child symbols are created
+    Then the child cache holds at most 4 symbols
+
+Scenario: Disabled child cache creates new children
+    Given the child cache is disabled
+    When the chain symbol.os.path.isfile is built twice
+    Then the two chains are different instances
+
+Scenario: Child cache is not used while interning is enabled
+    Given symbol interning is enabled
+    When the chain symbol.os.path.isfile is built twice
+    Then the two chains are the same instance
+    And the child cache is empty
+
+Scenario: Child cache is disabled by default
+    Then the child cache was disabled before the test
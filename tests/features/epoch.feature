@@ -0,0 +1,25 @@
+Feature: Global cache epoch
+
+Background:
+    Given namespace
+    And symboldict w keys to an existing and a missing object
+
+Scenario: Bumping the epoch voids the values of the symbols
+    When the attributes of the symboldict are accessed
+    And the epoch is bumped
+    Then the symbol of the existing object has no value
+    And the attribute cache of the symboldict is empty
+
+Scenario: Bumping the epoch voids the failures of the symbols
+    When the attributes of the symboldict are accessed
+    And the epoch is bumped
+    Then the symbol of the missing object has no error
+
+Scenario: Symbols are searched again after the epoch is bumped
+    When the attributes of the symboldict are accessed
+    And the epoch is bumped
+    Then the existing object is loaded again from the symboldict
+    And the symbol of the existing object has a value
+
+Scenario: Bumping the epoch returns the new epoch
+    Then bumping the epoch twice returns consecutive integers
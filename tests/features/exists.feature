@@ -0,0 +1,75 @@
+Feature: Existence check without import
+
+Background:
+    Given namespace
+    And a package with a side effect
+
+Scenario: Existing attribute is found without running the module
+    Given symbol w path to an attribute of the module
+    When exists is called
+    Then the result is true
+    And the module body has not run
+
+Scenario: Missing attribute is not found
+    Given symbol w path to a missing attribute of the module
+    When exists is called
+    Then the result is false
+    And the module body has not run
+
+Scenario: Missing module is not found
+    Given symbol w path to a missing submodule
+    When exists is called
+    Then the result is false
+
+Scenario: Imported name is followed to its module
+    Given symbol w path through an imported name
+    When exists is called
+    Then the result is true
+    And the module body has not run
+
+Scenario: Star import makes the answer unknown
+    Given symbol w path to an attribute of a module with a star import
+    When exists is called
+    Then the result is none
+    And the module body has not run
+
+Scenario: Module binding names at run time makes missing names unknown
+    Given symbol w path to a name missing from a module calling globals
+    When exists is called
+    Then the result is none
+    And the module body has not run
+
+Scenario: Names declared global in a function are unknown
+    Given symbol w path to a name declared global in a function
+    When exists is called
+    Then the result is none
+    And the module body has not run
+
+Scenario: Functions defined in match cases are found
+    Given symbol w path to a function defined in a match case
+    When exists is called
+    Then the result is true
+    And the module body has not run
+
+Scenario: Names bound by assignment expressions are unknown
+    Given symbol w path to a name bound by an assignment expression
+    When exists is called
+    Then the result is none
+    And the module body has not run
+
+Scenario: Deleted names are unknown
+    Given symbol w path to a deleted name
+    When exists is called
+    Then the result is none
+    And the module body has not run
+
+Scenario: Unknown answer falls back to the rule
+    Given symbol w path to an attribute of a module with a star import
+    When exists is called with rule try load once
+    Then the result is true
+
+Scenario: SymbolDict exists raises KeyError on missing key
+    Given symboldict w keys to existing and missing attributes
+    Then exists on the existing key is true
+    And exists on the missing key is false
+    And exists on an absent key raises KeyError
@@ -0,0 +1,31 @@
+Feature: Frozen SymbolDict snapshot
+
+Background:
+    Given namespace
+    And symboldict w keys to existing objects
+
+Scenario: Frozen snapshot has the values as attributes
+    When the symboldict is frozen
+    Then the attributes of the snapshot are the values
+    And a missing attribute raises AttributeError
+
+Scenario: Frozen snapshot is immutable
+    When the symboldict is frozen
+    Then setting an attribute of the snapshot raises AttributeError
+    And deleting an attribute of the snapshot raises AttributeError
+
+Scenario: Frozen snapshots are hashable
+    When the symboldict is frozen twice
+    Then the snapshots are equal and have the same hash
+
+Scenario: Freezing fails on a key without value
+    Given a key to a missing object in the symboldict
+    Then freezing the symboldict raises ImportError
+
+Scenario: Freezing fails on an invalid attribute name
+    Given a key which is not an identifier in the symboldict
+    Then freezing the symboldict raises ValueError
+
+Scenario: Freezing fails on a private attribute name
+    Given a key starting with two underscores in the symboldict
+    Then freezing the symboldict raises ValueError
@@ -0,0 +1,26 @@
+Feature: Interning of Symbol instances
+
+Background:
+    Given namespace
+
+Scenario: Interned symbols with same path are identical
+    Given symbol interning is enabled
+    When 2 symbols are created with the same path
+    Then these 2 symbols are the same instance
+
+Scenario: Interned symbols share their value
+    Given symbol interning is enabled
+    And symbol w path to isfile and value
+    When another symbol is created with the same path
+    Then its value is available w rule dont load
+
+Scenario: Unused interned symbols are released
+    Given symbol interning is enabled
+    When 2 symbols are created with the same path
+    And these symbols are deleted
+    Then the path is not interned
+
+Scenario: Symbols are not interned by default
+    Given symbol interning is disabled
+    When 2 symbols are created with the same path
+    Then these 2 symbols are different instances
@@ -0,0 +1,29 @@
+Feature: Lazy import rule
+
+Background:
+    Given namespace
+    And an importable module with a side effect
+
+Scenario: Lazy import rule does not run the module body
+    Given symbol w path to this module
+    When getvalue is called with rule lazy import
+    Then the module is returned
+    And the module body has not run
+
+Scenario: Module body runs when an attribute is accessed
+    Given symbol w path to this module
+    When getvalue is called with rule lazy import
+    And an attribute of the module is accessed
+    Then the module body has run once
+
+Scenario: Batch loading w rule lazy import does not run the module body
+    Given symboldict w key to this module
+    When load_all is called with rule lazy import
+    Then the module is loaded
+    And the module body has not run
+
+Scenario: Threads importing a module lazily share the same module
+    Given a slow creation of the lazy modules
+    When two threads import the module lazily
+    Then both threads obtain the module in sys modules
+    And the module body has not run
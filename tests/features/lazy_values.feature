@@ -0,0 +1,43 @@
+Feature: Lazy value proxies in SymbolDict
+
+Background:
+    Given namespace
+
+Scenario: Attribute access in lazy mode does not import
+    Given lazy sd pointing to Telnet
+    And telnetlib forced out of sys modules
+    When the Telnet attribute is accessed
+    Then result is a lazy value
+    And telnetlib is not in sys modules
+
+Scenario: First use of the proxy loads the value and rebinds it
+    Given lazy sd pointing to Telnet
+    When the Telnet attribute is accessed
+    And the proxy is called with attribute access
+    Then the symboldict instance has the Telnet class in its dict
+
+Scenario: Proxy supports isinstance and operators
+    Given lazy sd pointing to OrderedDict and pi
+    Then isinstance works with the proxies
+    And arithmetic works with the pi proxy
+
+Scenario: Proxy supports numeric, iteration and path protocols
+    Given a module with numeric, iterator and path attributes
+    And lazy sd pointing to these attributes
+    Then the numeric protocols work with the proxies
+    And the iteration protocols work with the proxies
+    And the path protocol works with the proxies
+
+Scenario: Proxy of a class can be a base class
+    Given lazy sd pointing to OrderedDict and pi
+    Then a class can derive from the OrderedDict proxy
+
+Scenario: In-place operators mutate the value of the proxy
+    Given a module with numeric, iterator and path attributes
+    And lazy sd pointing to these attributes
+    Then in-place operators mutate the value of the proxy
+
+Scenario: Proxy of a missing symbol raises on use
+    Given lazy sd pointing to spam
+    When the ham attribute is accessed
+    Then calling the proxy raises importerror
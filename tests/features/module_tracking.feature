@@ -0,0 +1,39 @@
+Feature: Invalidation of values from reloaded or replaced modules
+
+Background:
+    Given namespace
+    And a module with a class Spam and an attribute x
+    And symboldict w keys to the class and to another module
+
+Scenario: Reloaded module invalidates its symbols
+    When the attributes of the symboldict are accessed
+    And the module is reloaded
+    And check modules is called
+    Then the reported modules are the module
+    And the class is a new object
+    And the other key keeps its cached value
+
+Scenario: Replaced module invalidates its symbols
+    When the attributes of the symboldict are accessed
+    And the module is replaced in sys modules
+    And check modules is called
+    Then the reported modules are the module
+    And the symbol of the class has no value
+    And the class is a new object
+
+Scenario: Unchanged modules are not reported
+    When the attributes of the symboldict are accessed
+    And check modules is called
+    Then no module is reported
+    And the symbol of the class has a value
+
+Scenario: Loading from a replaced module invalidates the other symbols
+    When the attributes of the symboldict are accessed
+    And the module is replaced in sys modules
+    And the attribute x is loaded through a new symbol
+    Then the symbol of the class has no value
+
+Scenario: Replaced modules are not kept alive
+    When the attributes of the symboldict are accessed
+    And the module is replaced in sys modules
+    Then the replaced module is freed
@@ -0,0 +1,20 @@
+Feature: Negative cache of failed searches
+
+Background:
+    Given namespace
+
+Scenario: Failed search is the cause of later errors
+    Given symbol w path to spam in os
+    When calling getvalue wo rule fails
+    Then calling getvalue again raises voidvalueerror caused by the first error
+    And symbolcontrol error method returns the first error
+
+Scenario: Retry after rule does not search again before delay
+    Given symbol w path to spam in os
+    When hasvalue is called twice with rule retry after 60 seconds
+    Then the path was searched once
+
+Scenario: Retry after rule searches again after delay
+    Given symbol w path to spam in os
+    When hasvalue is called twice with rule retry after 0 seconds
+    Then the path was searched twice
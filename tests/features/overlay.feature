@@ -0,0 +1,39 @@
+Feature: Copy-on-write SymbolDict overlays
+
+Background:
+    Given namespace
+    And symboldict w keys isfile and dumps
+    And an overlay of this symboldict overriding dumps
+
+Scenario: Overlay shows the entries of its base with its overrides
+    Then the overlay has the keys isfile and dumps
+    And the symbol of dumps in the overlay is the override
+    And the symbol of dumps in the base is unchanged
+
+Scenario: Overlay shares the values resolved by its base
+    When the attribute isfile of the overlay is accessed
+    Then the value of isfile is cached in the base
+    And the overlay stores only the overridden entry
+
+Scenario: Overlay resolves its overridden entries
+    Then the attribute dumps of the overlay is the overridden value
+    And getvalue dumps on the overlay is the overridden value
+    And hasvalue dumps on the overlay is true
+
+Scenario: Overlay changes do not affect the base
+    When a key is set in the overlay
+    And the overridden key is deleted from the overlay
+    Then the base does not have the new key
+    And the overlay shows the symbol of dumps in the base
+
+Scenario: Deleting a key of the base from the overlay raises KeyError
+    Then deleting isfile from the overlay raises KeyError
+
+Scenario: Strict overlay refuses reserved keys
+    Then setting a reserved key in the overlay raises TypeError
+
+Scenario: Overlay can be copied
+    When the overlay is copied with the copy module
+    Then the copies have the keys isfile and dumps
+    And setting a key in a copy does not change the overlay
+    And an overlay without slots has no attributes
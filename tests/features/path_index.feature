@@ -0,0 +1,31 @@
+Feature: Path index of SymbolDict
+
+Background:
+    Given namespace
+    And symboldict w keys under os, os.path and spam
+    And the path index is enabled
+
+Scenario: Keys under a prefix follow the path segments
+    Then the keys under os.path are isfile
+    And the keys under os are isfile, sep and pathsep
+    And the keys under spam are ham and eggs
+    And the keys are the same without the index
+
+Scenario: Path index follows the dictionary modifications
+    When the dictionary is modified by every method
+    Then the keys under each prefix are the same without the index
+    And the emptied branches are pruned from the index
+
+Scenario: Load the symbols under a prefix
+    When the symbols under os are loaded
+    Then the values of isfile, sep and pathsep are cached
+    And the symbols under spam are not loaded
+
+Scenario: Invalidate the symbols under a prefix
+    When the attributes isfile and sep are accessed
+    And the symbols under os.path are invalidated
+    Then the symbol of isfile has no value
+    And the symbol of sep has a value
+
+Scenario: Group the keys by module
+    Then the keys are grouped by imported module or top-level name
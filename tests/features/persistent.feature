@@ -0,0 +1,43 @@
+Feature: Persistent SymbolDict versions
+
+Background:
+    Given namespace
+    And a persistent symboldict w 1000 keys
+
+Scenario: Set returns a new version
+    When key isfile is set to os.path.isfile
+    Then the new version has key isfile
+    And the old version does not have key isfile
+
+Scenario: Delete returns a new version
+    When key k5 is deleted
+    Then the new version does not have key k5
+    And the old version has key k5
+    And deleting a missing key raises KeyError
+
+Scenario: Merge returns a new version
+    When a mapping and keywords are merged
+    Then the new version has the merged keys
+
+Scenario: Versions share their unchanged structure
+    When key k5 is set to os.path.isdir
+    Then the root nodes of the versions share all entries but one
+
+Scenario: Diff lists the changes between versions
+    When key k5 is deleted
+    And key isfile is set to os.path.isfile
+    And key k7 is set to os.path.isdir
+    Then the diff between the versions lists these changes
+
+Scenario: Versions share the resolved values
+    When key isfile is set to os.path.isfile
+    And the attribute isfile of the new version is accessed
+    And key isdir is set to os.path.isdir
+    Then the symbol of isfile in the last version has a value
+
+Scenario: Persistent symboldict is immutable and strict
+    Then setting an attribute raises AttributeError
+    And setting a reserved key raises TypeError
+
+Scenario: Random updates agree with a dict
+    Then random updates w colliding hashes agree with a dict
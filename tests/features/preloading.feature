@@ -0,0 +1,16 @@
+Feature: Background preloading of SymbolDict entries
+
+Background:
+    Given namespace
+
+Scenario: Preload returns futures of the values
+    Given sd pointing to existing and non existing symbols
+    When all keys are preloaded
+    Then the futures hold the values and errors
+    And attribute proxies are installed for existing keys
+
+Scenario: Foreground access waits for the preloading thread
+    Given sd pointing to a slow symbol
+    When all keys are preloaded
+    And the slow symbol is accessed by attribute
+    Then the slow path was searched once
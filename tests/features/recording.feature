@@ -0,0 +1,17 @@
+Feature: Recording of used symbols
+
+Background:
+    Given namespace
+    And recording is started
+
+Scenario: Used symbols are recorded in first use order
+    Given sd pointing to three stdlib symbols
+    When two symbols are used in reverse order
+    Then the records list these paths in first use order
+
+Scenario: Preloading from manifest loads the recorded symbols only
+    Given sd pointing to three stdlib symbols
+    When two symbols are used in reverse order
+    And the manifest is written
+    And a new sd is preloaded from the manifest
+    Then the preloaded keys are the recorded keys in first use order
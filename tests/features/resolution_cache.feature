@@ -0,0 +1,32 @@
+Feature: Process-wide resolution cache
+
+Background:
+    Given namespace
+    And empty resolution cache of size 2
+
+Scenario: Symbols with same path share the cached value
+    Given symbol w path to isfile and value
+    When another symbol is created with the same path
+    And the value of the other symbol is fetched
+    Then the cache reports 1 hit and 1 miss
+
+Scenario: Symboldict attribute access consults the cache
+    Given symbol w path to isfile and value
+    When a symboldict with the same path is accessed by attribute
+    Then the cache reports 1 hit and 1 miss
+
+Scenario: Least recently used path is evicted
+    When 3 different paths are fetched
+    Then the first path is not in cache
+    And the cache has size 2
+
+Scenario: Cache invalidation by module prefix
+    When 3 different paths are fetched
+    And the cache is invalidated with prefix os
+    Then no cached path starts with os
+
+Scenario: Sibling symbols resume from the cached parent path
+    Given symbol w path to isfile and value
+    When os path is replaced in the cache by a fake module
+    And a sibling symbol is fetched
+    Then the sibling value is taken from the fake module
@@ -0,0 +1,32 @@
+Feature: Compiled resolution plans
+
+Background:
+    Given namespace
+
+Scenario: Resolving a path compiles its plan
+    Given symbol w path to minidom parseString
+    When getvalue is called with rule force reload
+    Then the exported plan of this path is mmma
+
+Scenario: Builtin paths have a builtin plan
+    Given symbol w path to complex conjugate
+    When getvalue is called with rule force reload
+    Then the exported plan of this path is ba
+
+Scenario: A stale imported plan is recompiled
+    Given symbol w path to sys platform
+    When the plan mm is imported for this path
+    And getvalue is called with rule force reload
+    Then the result is sys platform
+    And the exported plan of this path is ma
+
+Scenario: A module raising on import is not imported again
+    Given a module raising on import
+    And symbol w path to an attribute of this module
+    When the plan ma is imported for this path
+    Then getvalue raises the error of the module
+    And the body of the module ran once
+
+Scenario: An invalid plan is rejected
+    Given symbol w path to sys platform
+    Then importing the plan b for this path raises valueerror
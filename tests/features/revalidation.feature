@@ -0,0 +1,36 @@
+Feature: Time-to-live and revalidation rules
+
+Background:
+    Given namespace
+    And a module with attribute x equal to 1
+    And symbol w path to this attribute
+
+Scenario: Revalidation keeps the value of an unchanged module
+    When getvalue is called with rule revalidate
+    And searching is disabled
+    Then getvalue with rule revalidate returns 1
+
+Scenario: Revalidation sees a rebound attribute
+    When getvalue is called with rule revalidate
+    And the attribute is rebound to 2
+    Then getvalue with rule revalidate returns 2
+
+Scenario: Revalidation sees a replaced module
+    When getvalue is called with rule revalidate
+    And the module is replaced by a module with x equal to 3
+    Then getvalue with rule revalidate returns 3
+
+Scenario: Value is kept before expiry
+    When getvalue is called with rule expire after 3600 seconds
+    And the attribute is rebound to 2
+    Then getvalue with rule expire after 3600 seconds returns 1
+
+Scenario: Value is searched again after expiry
+    When getvalue is called with rule expire after 0 seconds
+    And the attribute is rebound to 2
+    Then getvalue with rule expire after 0 seconds returns 2
+
+Scenario: Revalidation searches again a value loaded by another rule
+    When getvalue is called with rule try load once
+    And the attribute is rebound to 2
+    Then getvalue with rule revalidate returns 2
@@ -0,0 +1,28 @@
+Feature: Pre-split path segments of Symbol
+
+Background:
+    Given namespace
+
+Scenario: Symbols built by attribute access inherit their segments
+    When symbol os.path.isfile is built by attribute access
+    Then its segments are os, path and isfile
+    And its path is os.path.isfile
+
+Scenario: Attribute access with a dotted name splits it into segments
+    Given symbol os with its segments
+    When symbol os.path.isfile is built by getattr with path.isfile
+    And its value is obtained
+    Then its segments are os, path and isfile
+
+Scenario: Segments are computed when a symbol is resolved
+    Given symbol os.path.isfile built from its path
+    And it has no segments
+    When its value is obtained
+    Then its segments are os, path and isfile
+
+Scenario: Identical segments are shared by the symbols
+    Then the segments of two symbols built from different strings are identical
+
+Scenario: Attribute access returns interned symbols
+    Given interning is enabled
+    Then attribute access returns the interned symbol
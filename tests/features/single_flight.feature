@@ -0,0 +1,28 @@
+Feature: Single-flight loading of symbols
+
+Background:
+    Given namespace
+
+Scenario: Many threads accessing a cold attribute load it once
+    Given sd pointing to a slow symbol
+    When 32 threads access the slow symbol by attribute
+    Then the slow path was searched once
+    And every thread obtained the value
+
+Scenario: Many threads loading a failing symbol share the error
+    Given symbol pointing to a slow missing path
+    When 32 threads call hasvalue w rule try load each
+    Then the slow path was searched once
+    And every thread obtained false
+
+Scenario: A thread importing a module loads its symbols while another thread waits for the module
+    Given a module whose body loads one of its symbols
+    When a thread imports the module while another thread loads this symbol
+    Then both threads obtained the value
+
+Scenario: Waiting threads search the path when the search is interrupted
+    Given sd pointing to a slow symbol
+    And the first search is interrupted by SystemExit
+    When 8 threads access the slow symbol by attribute
+    Then one thread was interrupted
+    And the other threads obtained the value
@@ -0,0 +1,17 @@
+Feature: Loading statistics
+
+Background:
+    Given namespace
+    And statistics are enabled
+
+Scenario: Symboldict statistics count calls, loads and failures
+    Given sd pointing to existing and non existing symbols
+    When each key is checked twice with hasvalue
+    Then the statistics of the existing key show 2 calls and 1 load
+    And the statistics of the non existing key show 1 failure
+
+Scenario: Disabled statistics are not collected
+    Given sd pointing to existing and non existing symbols
+    When statistics are disabled
+    And each key is checked twice with hasvalue
+    Then the module statistics did not change
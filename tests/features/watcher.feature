@@ -0,0 +1,31 @@
+Feature: File-watching hot reload
+
+Background:
+    Given namespace
+    And a package whose init imports a value from a submodule
+    And symboldict w key to the value in the package
+    And a watcher having polled once
+
+Scenario: Unchanged files are not reloaded
+    When the watcher polls
+    Then the report is none
+
+Scenario: Changed module is reloaded and its symbols refreshed
+    When the value is changed to 2 in the package init
+    And the watcher polls
+    Then the reloaded modules are the package
+    And the value in the symboldict is 2
+    And the report has reload time and latency
+
+Scenario: Changed modules are reloaded in dependency order
+    When the value is changed to 3 in the submodule
+    And the package init is touched
+    And the watcher polls
+    Then the reloaded modules are the submodule then the package
+    And the value in the symboldict is 3
+
+Scenario: Watcher thread reloads changed modules
+    When the watcher thread is started
+    And the value is changed to 2 in the package init
+    Then the on reload callback receives a report
+    And the value in the symboldict is 2
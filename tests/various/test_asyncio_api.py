@@ -0,0 +1,157 @@
+"""Awaitable loading of symbols feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import asyncio
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+import time
+
+scenario = partial(scenario, '../features/asyncio_api.feature')
+
+
+@scenario('Awaiting aget returns the value and installs attribute proxy')
+def test_awaiting_aget_returns_the_value_and_installs_attribute_proxy():
+    """Awaiting aget returns the value and installs attribute proxy."""
+
+
+@scenario('Concurrent awaiters of the same key share one search')
+def test_concurrent_awaiters_of_the_same_key_share_one_search():
+    """Concurrent awaiters of the same key share one search."""
+
+
+@scenario('Cancelled awaiter does not cancel the search')
+def test_cancelled_awaiter_does_not_cancel_the_search():
+    """Cancelled awaiter does not cancel the search."""
+
+
+@scenario('Warmup reports values and errors')
+def test_warmup_reports_values_and_errors():
+    """Warmup reports values and errors."""
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('sd pointing to Telnet')
+def sd_pointing_to_telnet(self):
+    """sd pointing to Telnet."""
+    self.sd = sd.SymbolDict(Telnet='telnetlib.Telnet')
+    return self.sd
+
+
+@given('sd pointing to a slow symbol')
+def sd_pointing_to_a_slow_symbol(self, monkeypatch):
+    """sd pointing to a slow symbol."""
+    self.calls = []
+    real = sd._resolve
+    def slow_resolve(path, *args):
+        self.calls.append(path)
+        time.sleep(0.1)
+        return real(path, *args)
+    monkeypatch.setattr(sd, '_resolve', slow_resolve)
+    self.sd = sd.SymbolDict(slow='os.path.isdir')
+    return self.sd
+
+
+@given('sd pointing to existing and non existing symbols')
+def sd_pointing_to_existing_and_non_existing_symbols(self):
+    """sd pointing to existing and non existing symbols."""
+    self.sd = sd.SymbolDict(isfile='os.path.isfile', sep='os.sep',
+                            ham='spam.ham', eggs='os.path.eggs')
+    return self.sd
+
+
+@when('aget is awaited for this key')
+def aget_is_awaited_for_this_key(self):
+    """aget is awaited for this key."""
+    self.result = run(self.sd.aget('Telnet'))
+
+
+@when('8 coroutines await aget for the slow key')
+def coroutines_await_aget_for_the_slow_key(self):
+    """8 coroutines await aget for the slow key."""
+    async def main():
+        return await asyncio.gather(*[self.sd.aget('slow') for i in range(8)])
+    self.results = run(main())
+
+
+@when('an awaiter of the slow key is cancelled')
+def an_awaiter_of_the_slow_key_is_cancelled(self):
+    """an awaiter of the slow key is cancelled."""
+    async def main():
+        task = asyncio.ensure_future(self.sd.aget('slow'))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return await self.sd.aget('slow')
+    self.result = run(main())
+
+
+@when('aget is awaited for the slow key')
+def aget_is_awaited_for_the_slow_key(self):
+    """aget is awaited for the slow key."""
+    assert run(self.sd.aget('slow')) is os.path.isdir
+
+
+@when('warmup is awaited with concurrency 2')
+def warmup_is_awaited_with_concurrency_2(self):
+    """warmup is awaited with concurrency 2."""
+    self.values, self.errors = run(self.sd.awarmup(concurrency=2))
+
+
+@then('result is stdlib Telnet object')
+def result_is_stdlib_telnet_object(self):
+    """result is stdlib Telnet object."""
+    import telnetlib
+    assert self.result is telnetlib.Telnet
+
+
+@then('the symboldict instance has the value in its dict')
+def the_symboldict_instance_has_the_value_in_its_dict(self):
+    """the symboldict instance has the value in its dict."""
+    assert self.sd.__dict__['Telnet'] is self.result
+
+
+@then('the slow path was searched once')
+def the_slow_path_was_searched_once(self):
+    """the slow path was searched once."""
+    assert self.calls == ['os.path.isdir']
+
+
+@then('every coroutine obtained the value')
+def every_coroutine_obtained_the_value(self):
+    """every coroutine obtained the value."""
+    assert all(r is os.path.isdir for r in self.results)
+
+
+@then('existing keys are in values')
+def existing_keys_are_in_values(self):
+    """existing keys are in values."""
+    assert sorted(self.values) == ['isfile', 'sep']
+
+
+@then('non existing keys are in errors')
+def non_existing_keys_are_in_errors(self):
+    """non existing keys are in errors."""
+    assert sorted(self.errors) == ['eggs', 'ham']
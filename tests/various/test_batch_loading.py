@@ -0,0 +1,121 @@
+"""Batch loading of symbols feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+import sys
+
+scenario = partial(scenario, '../features/batch_loading.feature')
+
+
+@scenario('Load all reports values and errors by key')
+def test_load_all_reports_values_and_errors_by_key():
+    """Load all reports values and errors by key."""
+
+
+@scenario('Load all reports missing keys')
+def test_load_all_reports_missing_keys():
+    """Load all reports missing keys."""
+
+
+@scenario('Resolve many imports a missing root module once')
+def test_resolve_many_imports_a_missing_root_module_once():
+    """Resolve many imports a missing root module once."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('sd pointing to existing and non existing symbols')
+def sd_pointing_to_existing_and_non_existing_symbols(self):
+    """sd pointing to existing and non existing symbols."""
+    self.sd = sd.SymbolDict(
+        isfile='os.path.isfile', sep='os.sep', platform='sys.platform',
+        ham='spam.ham', eggs='spam.eggs', nope='os.path.nope')
+    return self.sd
+
+
+@given('several paths under a missing module')
+def several_paths_under_a_missing_module(self):
+    """several paths under a missing module."""
+    self.paths = ['spam.ham', 'spam.eggs', 'spam.ham.eggs']
+    return self.paths
+
+
+@when('all keys are loaded')
+def all_keys_are_loaded(self):
+    """all keys are loaded."""
+    self.values, self.errors = self.sd.load_all()
+
+
+@when('keys including a missing key are loaded')
+def keys_including_a_missing_key_are_loaded(self):
+    """keys including a missing key are loaded."""
+    self.values, self.errors = self.sd.load_all(['isfile', 'missing'])
+
+
+@when('these paths are resolved at once')
+def these_paths_are_resolved_at_once(self, monkeypatch):
+    """these paths are resolved at once."""
+    calls = []
+    def import_module(name):
+        calls.append(name)
+        return real(name)
+    real = sd.import_module
+    monkeypatch.setattr(sd, 'import_module', import_module)
+    self.calls = calls
+    self.values, self.errors = sd.resolve_many(self.paths)
+
+
+@then('existing keys are in values')
+def existing_keys_are_in_values(self):
+    """existing keys are in values."""
+    assert sorted(self.values) == ['isfile', 'platform', 'sep']
+    assert self.values['isfile'] is os.path.isfile
+
+
+@then('non existing keys are in errors')
+def non_existing_keys_are_in_errors(self):
+    """non existing keys are in errors."""
+    assert sorted(self.errors) == ['eggs', 'ham', 'nope']
+    assert isinstance(self.errors['ham'], ImportError)
+    assert isinstance(self.errors['nope'], ImportError)
+
+
+@then('attribute proxies are installed for existing keys')
+def attribute_proxies_are_installed_for_existing_keys(self):
+    """attribute proxies are installed for existing keys."""
+    assert sorted(self.sd.__dict__) == ['isfile', 'platform', 'sep']
+
+
+@then('the missing key has a keyerror')
+def the_missing_key_has_a_keyerror(self):
+    """the missing key has a keyerror."""
+    assert list(self.values) == ['isfile']
+    assert isinstance(self.errors['missing'], KeyError)
+
+
+@then('the missing module is searched once')
+def the_missing_module_is_searched_once(self):
+    """the missing module is searched once."""
+    assert self.calls == ['spam']
+
+
+@then('every path has the same error')
+def every_path_has_the_same_error(self):
+    """every path has the same error."""
+    assert not self.values
+    errs = [self.errors[p] for p in self.paths]
+    assert all(e is errs[0] for e in errs)
@@ -0,0 +1,139 @@
+"""Streaming SymbolDict update feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/bulk_update.feature')
+
+
+@scenario('Update consumes a generator')
+def test_update_consumes_a_generator():
+    """Update consumes a generator."""
+
+
+@scenario('Update keeps the given Symbol instances')
+def test_update_keeps_the_given_symbol_instances():
+    """Update keeps the given Symbol instances."""
+
+
+@scenario('Update discards the cached values of the updated keys')
+def test_update_discards_the_cached_values_of_the_updated_keys():
+    """Update discards the cached values of the updated keys."""
+
+
+@scenario('Strict update from a mapping with a reserved key changes nothing')
+def test_strict_update_from_a_mapping_with_a_reserved_key_changes_nothing():
+    """Strict update from a mapping with a reserved key changes nothing."""
+
+
+@scenario('Strict update from a generator stops at a reserved key')
+def test_strict_update_from_a_generator_stops_at_a_reserved_key():
+    """Strict update from a generator stops at a reserved key."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('an empty symboldict')
+def an_empty_symboldict(self):
+    """an empty symboldict."""
+    self.sy = sd.SymbolDict()
+
+
+@given('key isfile to os.path.isfile in the symboldict')
+def key_isfile_to_ospathisfile_in_the_symboldict(self):
+    """key isfile to os.path.isfile in the symboldict."""
+    self.sy['isfile'] = 'os.path.isfile'
+
+
+@when('the symboldict is updated from a generator of 1000 items')
+def the_symboldict_is_updated_from_a_generator_of_1000_items(self):
+    """the symboldict is updated from a generator of 1000 items."""
+    self.sy.update(('k{}'.format(i), 'spam.ham{}'.format(i))
+                   for i in range(1000))
+
+
+@when('the symboldict is updated with a Symbol instance')
+def the_symboldict_is_updated_with_a_symbol_instance(self):
+    """the symboldict is updated with a Symbol instance."""
+    self.symb = Symbol('os.path.isfile')
+    self.sy.update(isfile=self.symb)
+
+
+@when('the attribute isfile is accessed')
+def the_attribute_isfile_is_accessed(self):
+    """the attribute isfile is accessed."""
+    assert self.sy.isfile is os.path.isfile
+
+
+@when('the symboldict is updated with key isfile to os.path.isdir')
+def the_symboldict_is_updated_with_key_isfile_to_ospathisdir(self):
+    """the symboldict is updated with key isfile to os.path.isdir."""
+    self.sy.update({'isfile': 'os.path.isdir'})
+
+
+@when('the symboldict is updated from a mapping with a reserved key')
+def the_symboldict_is_updated_from_a_mapping_with_a_reserved_key(self):
+    """the symboldict is updated from a mapping with a reserved key."""
+    with pytest.raises(TypeError) as self.info:
+        self.sy.update({'isfile': 'os.path.isfile', 'items': 'os.sep'})
+
+
+@when('the symboldict is updated from a generator with a reserved key')
+def the_symboldict_is_updated_from_a_generator_with_a_reserved_key(self):
+    """the symboldict is updated from a generator with a reserved key."""
+    items = [('isfile', 'os.path.isfile'), ('items', 'os.sep'),
+             ('isdir', 'os.path.isdir')]
+    with pytest.raises(TypeError) as self.info:
+        self.sy.update(x for x in items)
+
+
+@then('the symboldict has 1000 symbols')
+def the_symboldict_has_1000_symbols(self):
+    """the symboldict has 1000 symbols."""
+    assert len(self.sy) == 1000
+    assert all(isinstance(v, Symbol) for v in self.sy.values())
+    assert self.sy['k999'] == Symbol('spam.ham999')
+
+
+@then('the symboldict holds this Symbol instance')
+def the_symboldict_holds_this_symbol_instance(self):
+    """the symboldict holds this Symbol instance."""
+    assert self.sy['isfile'] is self.symb
+
+
+@then('the attribute isfile is os.path.isdir')
+def the_attribute_isfile_is_ospathisdir(self):
+    """the attribute isfile is os.path.isdir."""
+    assert self.sy.isfile is os.path.isdir
+
+
+@then('TypeError is raised')
+def typeerror_is_raised(self):
+    """TypeError is raised."""
+    assert self.info.type is TypeError
+
+
+@then('the symboldict is empty')
+def the_symboldict_is_empty(self):
+    """the symboldict is empty."""
+    assert len(self.sy) == 0
+
+
+@then('the symboldict has the items preceding the reserved key')
+def the_symboldict_has_the_items_preceding_the_reserved_key(self):
+    """the symboldict has the items preceding the reserved key."""
+    assert list(self.sy) == ['isfile']
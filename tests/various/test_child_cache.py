@@ -0,0 +1,126 @@
+"""Cache of the child symbols feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/child_cache.feature')
+
+
+@scenario('Repeated attribute chains return the cached children')
+def test_repeated_attribute_chains_return_the_cached_children():
+    """Repeated attribute chains return the cached children."""
+
+
+@scenario('Child cache is bounded')
+def test_child_cache_is_bounded():
+    """Child cache is bounded."""
+
+
+@scenario('Disabled child cache creates new children')
+def test_disabled_child_cache_creates_new_children():
+    """Disabled child cache creates new children."""
+
+
+@scenario('Child cache is not used while interning is enabled')
+def test_child_cache_is_not_used_while_interning_is_enabled():
+    """Child cache is not used while interning is enabled."""
+
+
+@scenario('Child cache is disabled by default')
+def test_child_cache_is_disabled_by_default():
+    """Child cache is disabled by default."""
+
+
+@pytest.fixture
+def restore():
+    size = sd.set_child_cache(0)
+    interning = sd.set_interning(False)
+    yield size
+    sd.set_interning(interning)
+    sd.set_child_cache(size)
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('a child cache w size 4')
+def a_child_cache_w_size_4(restore):
+    """a child cache w size 4."""
+    sd.set_child_cache(4)
+
+
+@given('the child cache is disabled')
+def the_child_cache_is_disabled():
+    """the child cache is disabled."""
+    assert sd.set_child_cache(0) == 4
+
+
+@given('symbol interning is enabled')
+def symbol_interning_is_enabled():
+    """symbol interning is enabled."""
+    sd.set_interning(True)
+
+
+@when('the chain symbol.os.path.isfile is built twice')
+def the_chain_symbolospathisfile_is_built_twice(self):
+    """the chain symbol.os.path.isfile is built twice."""
+    self.first = sd.symbol.os.path.isfile
+    self.first().getvalue()
+    self.second = sd.symbol.os.path.isfile
+
+
+@when('10 child symbols are created')
+def child_symbols_are_created():
+    """10 child symbols are created."""
+    for i in range(10):
+        getattr(sd.symbol.spam, 'ham{}'.format(i))
+
+
+@then('the two chains are the same instance')
+def the_two_chains_are_the_same_instance(self):
+    """the two chains are the same instance."""
+    assert self.first is self.second
+
+
+@then('the two chains are different instances')
+def the_two_chains_are_different_instances(self):
+    """the two chains are different instances."""
+    assert self.first == self.second
+    assert self.first is not self.second
+
+
+@then('the value loaded by the first chain is available to the second')
+def the_value_loaded_by_the_first_chain_is_available_to_the_second(self):
+    """the value loaded by the first chain is available to the second."""
+    assert self.second().getvalue(sd.Rule.DONT_LOAD) is os.path.isfile
+
+
+@then('the child cache holds at most 4 symbols')
+def the_child_cache_holds_at_most_4_symbols():
+    """the child cache holds at most 4 symbols."""
+    assert 0 < len(sd._children) <= 4
+
+
+@then('the child cache was disabled before the test')
+def the_child_cache_was_disabled_before_the_test(restore):
+    """the child cache was disabled before the test."""
+    assert restore == 0
+
+
+@then('the child cache is empty')
+def the_child_cache_is_empty():
+    """the child cache is empty."""
+    assert not sd._children
@@ -0,0 +1,102 @@
+"""Global cache epoch feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/epoch.feature')
+
+
+@scenario('Bumping the epoch voids the values of the symbols')
+def test_bumping_the_epoch_voids_the_values_of_the_symbols():
+    """Bumping the epoch voids the values of the symbols."""
+
+
+@scenario('Bumping the epoch voids the failures of the symbols')
+def test_bumping_the_epoch_voids_the_failures_of_the_symbols():
+    """Bumping the epoch voids the failures of the symbols."""
+
+
+@scenario('Symbols are searched again after the epoch is bumped')
+def test_symbols_are_searched_again_after_the_epoch_is_bumped():
+    """Symbols are searched again after the epoch is bumped."""
+
+
+@scenario('Bumping the epoch returns the new epoch')
+def test_bumping_the_epoch_returns_the_new_epoch():
+    """Bumping the epoch returns the new epoch."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('symboldict w keys to an existing and a missing object')
+def symboldict_w_keys_to_an_existing_and_a_missing_object(self):
+    """symboldict w keys to an existing and a missing object."""
+    self.sy = sd.SymbolDict(isfile='os.path.isfile', ham='spam.ham')
+
+
+@when('the attributes of the symboldict are accessed')
+def the_attributes_of_the_symboldict_are_accessed(self):
+    """the attributes of the symboldict are accessed."""
+    assert self.sy.isfile is os.path.isfile
+    assert not self.sy.hasvalue('ham')
+    assert self.sy['ham']().error() is not None
+
+
+@when('the epoch is bumped')
+def the_epoch_is_bumped():
+    """the epoch is bumped."""
+    sd.bump_epoch()
+
+
+@then('the symbol of the existing object has no value')
+def the_symbol_of_the_existing_object_has_no_value(self):
+    """the symbol of the existing object has no value."""
+    assert not self.sy['isfile']().hasvalue(sd.Rule.DONT_LOAD)
+
+
+@then('the symbol of the existing object has a value')
+def the_symbol_of_the_existing_object_has_a_value(self):
+    """the symbol of the existing object has a value."""
+    assert self.sy['isfile']().hasvalue(sd.Rule.DONT_LOAD)
+
+
+@then('the attribute cache of the symboldict is empty')
+def the_attribute_cache_of_the_symboldict_is_empty(self):
+    """the attribute cache of the symboldict is empty."""
+    assert self.sy.__dict__ == {}
+
+
+@then('the symbol of the missing object has no error')
+def the_symbol_of_the_missing_object_has_no_error(self):
+    """the symbol of the missing object has no error."""
+    assert self.sy['ham']().error() is None
+    with pytest.raises(sd.VoidValueError) as info:
+        self.sy['ham']().getvalue(sd.Rule.DONT_LOAD)
+    assert info.value.__cause__ is None
+
+
+@then('the existing object is loaded again from the symboldict')
+def the_existing_object_is_loaded_again_from_the_symboldict(self):
+    """the existing object is loaded again from the symboldict."""
+    assert self.sy.isfile is os.path.isfile
+
+
+@then('bumping the epoch twice returns consecutive integers')
+def bumping_the_epoch_twice_returns_consecutive_integers():
+    """bumping the epoch twice returns consecutive integers."""
+    first = sd.bump_epoch()
+    assert sd.bump_epoch() == first + 1
@@ -0,0 +1,262 @@
+"""Existence check without import feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+import sys
+
+scenario = partial(scenario, '../features/exists.feature')
+
+PKGNAME = 'symboldict_exists_test_package'
+
+
+@scenario('Existing attribute is found without running the module')
+def test_existing_attribute_is_found_without_running_the_module():
+    """Existing attribute is found without running the module."""
+
+
+@scenario('Missing attribute is not found')
+def test_missing_attribute_is_not_found():
+    """Missing attribute is not found."""
+
+
+@scenario('Missing module is not found')
+def test_missing_module_is_not_found():
+    """Missing module is not found."""
+
+
+@scenario('Imported name is followed to its module')
+def test_imported_name_is_followed_to_its_module():
+    """Imported name is followed to its module."""
+
+
+@scenario('Star import makes the answer unknown')
+def test_star_import_makes_the_answer_unknown():
+    """Star import makes the answer unknown."""
+
+
+@scenario('Module binding names at run time makes missing names unknown')
+def test_module_binding_names_at_run_time_makes_missing_names_unknown():
+    """Module binding names at run time makes missing names unknown."""
+
+
+@scenario('Names declared global in a function are unknown')
+def test_names_declared_global_in_a_function_are_unknown():
+    """Names declared global in a function are unknown."""
+
+
+@scenario('Functions defined in match cases are found')
+def test_functions_defined_in_match_cases_are_found():
+    """Functions defined in match cases are found."""
+
+
+@scenario('Names bound by assignment expressions are unknown')
+def test_names_bound_by_assignment_expressions_are_unknown():
+    """Names bound by assignment expressions are unknown."""
+
+
+@scenario('Deleted names are unknown')
+def test_deleted_names_are_unknown():
+    """Deleted names are unknown."""
+
+
+@scenario('Unknown answer falls back to the rule')
+def test_unknown_answer_falls_back_to_the_rule():
+    """Unknown answer falls back to the rule."""
+
+
+@scenario('SymbolDict exists raises KeyError on missing key')
+def test_symboldict_exists_raises_keyerror_on_missing_key():
+    """SymbolDict exists raises KeyError on missing key."""
+
+
+@pytest.fixture(autouse=True)
+def package(tmp_path, monkeypatch):
+    pkg = tmp_path / PKGNAME
+    pkg.mkdir()
+    (pkg / '__init__.py').write_text('')
+    side_effect = (
+        'import sys\n'
+        'sys._symboldict_test_runs = getattr(sys, "_symboldict_test_runs", 0) + 1\n')
+    (pkg / 'mod.py').write_text(
+        side_effect +
+        'from . import other as aliased\n'
+        'try:\n'
+        '    import json\n'
+        'except ImportError:\n'
+        '    json = None\n'
+        'class Spam(object):\n'
+        '    pass\n'
+        'answer, question = 42, None\n')
+    (pkg / 'other.py').write_text(side_effect + 'def helper():\n    pass\n')
+    (pkg / 'star.py').write_text(side_effect + 'from os.path import *\n')
+    (pkg / 'dynamic.py').write_text(
+        side_effect + 'globals().update(OK=200)\n')
+    (pkg / 'late.py').write_text(
+        side_effect + 'def init():\n    global LATE\n    LATE = 1\n')
+    (pkg / 'gone.py').write_text(side_effect + 'GONE = 1\ndel GONE\n')
+    if sys.version_info >= (3, 10):
+        (pkg / 'modern.py').write_text(
+            side_effect +
+            'if (WALRUS := 3):\n'
+            '    pass\n'
+            'match sys.platform:\n'
+            '    case _:\n'
+            '        def matched():\n'
+            '            pass\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in list(sys.modules):
+        if name.startswith(PKGNAME):
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(sys, '_symboldict_test_runs', 0, raising=False)
+    yield
+    for name in list(sys.modules):
+        if name.startswith(PKGNAME):
+            del sys.modules[name]
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('a package with a side effect')
+def a_package_with_a_side_effect():
+    """a package with a side effect."""
+
+
+@given('symbol w path to an attribute of the module')
+def symbol_w_path_to_an_attribute_of_the_module(self):
+    """symbol w path to an attribute of the module."""
+    self.symb = Symbol(PKGNAME, 'mod.Spam')
+
+
+@given('symbol w path to a missing attribute of the module')
+def symbol_w_path_to_a_missing_attribute_of_the_module(self):
+    """symbol w path to a missing attribute of the module."""
+    self.symb = Symbol(PKGNAME, 'mod.eggs')
+
+
+@given('symbol w path to a missing submodule')
+def symbol_w_path_to_a_missing_submodule(self):
+    """symbol w path to a missing submodule."""
+    self.symb = Symbol(PKGNAME, 'nosuchmodule.Spam')
+
+
+@given('symbol w path through an imported name')
+def symbol_w_path_through_an_imported_name(self):
+    """symbol w path through an imported name."""
+    self.symb = Symbol(PKGNAME, 'mod.aliased.helper')
+
+
+@given('symbol w path to an attribute of a module with a star import')
+def symbol_w_path_to_an_attribute_of_a_module_with_a_star_import(self):
+    """symbol w path to an attribute of a module with a star import."""
+    self.symb = Symbol(PKGNAME, 'star.join')
+
+
+@given('symbol w path to a name missing from a module calling globals')
+def symbol_w_path_to_a_name_missing_from_a_module_calling_globals(self):
+    """symbol w path to a name missing from a module calling globals."""
+    self.symb = Symbol(PKGNAME, 'dynamic.OK')
+
+
+@given('symbol w path to a name declared global in a function')
+def symbol_w_path_to_a_name_declared_global_in_a_function(self):
+    """symbol w path to a name declared global in a function."""
+    self.symb = Symbol(PKGNAME, 'late.LATE')
+    assert Symbol(PKGNAME, 'late.EARLY')().exists() is False
+
+
+@given('symbol w path to a function defined in a match case')
+def symbol_w_path_to_a_function_defined_in_a_match_case(self):
+    """symbol w path to a function defined in a match case."""
+    if sys.version_info < (3, 10):
+        pytest.skip('match statement requires python 3.10')
+    self.symb = Symbol(PKGNAME, 'modern.matched')
+
+
+@given('symbol w path to a name bound by an assignment expression')
+def symbol_w_path_to_a_name_bound_by_an_assignment_expression(self):
+    """symbol w path to a name bound by an assignment expression."""
+    if sys.version_info < (3, 10):
+        pytest.skip('match statement requires python 3.10')
+    self.symb = Symbol(PKGNAME, 'modern.WALRUS')
+
+
+@given('symbol w path to a deleted name')
+def symbol_w_path_to_a_deleted_name(self):
+    """symbol w path to a deleted name."""
+    self.symb = Symbol(PKGNAME, 'gone.GONE')
+
+
+@given('symboldict w keys to existing and missing attributes')
+def symboldict_w_keys_to_existing_and_missing_attributes(self):
+    """symboldict w keys to existing and missing attributes."""
+    self.sy = sd.SymbolDict(
+        spam=PKGNAME + '.mod.answer', eggs=PKGNAME + '.mod.eggs')
+
+
+@when('exists is called')
+def exists_is_called(self):
+    """exists is called."""
+    self.result = self.symb().exists()
+
+
+@when('exists is called with rule try load once')
+def exists_is_called_with_rule_try_load_once(self):
+    """exists is called with rule try load once."""
+    self.result = self.symb().exists(sd.Rule.TRY_LOAD_ONCE)
+
+
+@then('the result is true')
+def the_result_is_true(self):
+    """the result is true."""
+    assert self.result is True
+
+
+@then('the result is false')
+def the_result_is_false(self):
+    """the result is false."""
+    assert self.result is False
+
+
+@then('the result is none')
+def the_result_is_none(self):
+    """the result is none."""
+    assert self.result is None
+
+
+@then('the module body has not run')
+def the_module_body_has_not_run():
+    """the module body has not run."""
+    assert sys._symboldict_test_runs == 0
+    assert PKGNAME + '.mod' not in sys.modules
+
+
+@then('exists on the existing key is true')
+def exists_on_the_existing_key_is_true(self):
+    """exists on the existing key is true."""
+    assert self.sy.exists('spam') is True
+
+
+@then('exists on the missing key is false')
+def exists_on_the_missing_key_is_false(self):
+    """exists on the missing key is false."""
+    assert self.sy.exists('eggs') is False
+
+
+@then('exists on an absent key raises KeyError')
+def exists_on_an_absent_key_raises_keyerror(self):
+    """exists on an absent key raises KeyError."""
+    with pytest.raises(KeyError):
+        self.sy.exists('ham')
@@ -0,0 +1,144 @@
+"""Frozen SymbolDict snapshot feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/freeze.feature')
+
+
+@scenario('Frozen snapshot has the values as attributes')
+def test_frozen_snapshot_has_the_values_as_attributes():
+    """Frozen snapshot has the values as attributes."""
+
+
+@scenario('Frozen snapshot is immutable')
+def test_frozen_snapshot_is_immutable():
+    """Frozen snapshot is immutable."""
+
+
+@scenario('Frozen snapshots are hashable')
+def test_frozen_snapshots_are_hashable():
+    """Frozen snapshots are hashable."""
+
+
+@scenario('Freezing fails on a key without value')
+def test_freezing_fails_on_a_key_without_value():
+    """Freezing fails on a key without value."""
+
+
+@scenario('Freezing fails on an invalid attribute name')
+def test_freezing_fails_on_an_invalid_attribute_name():
+    """Freezing fails on an invalid attribute name."""
+
+
+@scenario('Freezing fails on a private attribute name')
+def test_freezing_fails_on_a_private_attribute_name():
+    """Freezing fails on a private attribute name."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('symboldict w keys to existing objects')
+def symboldict_w_keys_to_existing_objects(self):
+    """symboldict w keys to existing objects."""
+    self.sy = sd.SymbolDict(isfile='os.path.isfile', join='os.path.join')
+
+
+@given('a key to a missing object in the symboldict')
+def a_key_to_a_missing_object_in_the_symboldict(self):
+    """a key to a missing object in the symboldict."""
+    self.sy['ham'] = 'spam.ham'
+
+
+@given('a key which is not an identifier in the symboldict')
+def a_key_which_is_not_an_identifier_in_the_symboldict(self):
+    """a key which is not an identifier in the symboldict."""
+    self.sy['not valid'] = 'os.sep'
+
+
+@given('a key starting with two underscores in the symboldict')
+def a_key_starting_with_two_underscores_in_the_symboldict(self):
+    """a key starting with two underscores in the symboldict."""
+    self.sy['__priv'] = 'os.sep'
+
+
+@when('the symboldict is frozen')
+def the_symboldict_is_frozen(self):
+    """the symboldict is frozen."""
+    self.fz = self.sy.freeze()
+
+
+@when('the symboldict is frozen twice')
+def the_symboldict_is_frozen_twice(self):
+    """the symboldict is frozen twice."""
+    self.fz = self.sy.freeze()
+    self.other = self.sy.freeze()
+
+
+@then('the attributes of the snapshot are the values')
+def the_attributes_of_the_snapshot_are_the_values(self):
+    """the attributes of the snapshot are the values."""
+    assert isinstance(self.fz, sd.FrozenSymbolDict)
+    assert self.fz.isfile is os.path.isfile
+    assert self.fz.join is os.path.join
+
+
+@then('a missing attribute raises AttributeError')
+def a_missing_attribute_raises_attributeerror(self):
+    """a missing attribute raises AttributeError."""
+    with pytest.raises(AttributeError):
+        self.fz.spam
+
+
+@then('setting an attribute of the snapshot raises AttributeError')
+def setting_an_attribute_of_the_snapshot_raises_attributeerror(self):
+    """setting an attribute of the snapshot raises AttributeError."""
+    with pytest.raises(AttributeError):
+        self.fz.isfile = None
+    with pytest.raises(AttributeError):
+        self.fz.spam = None
+    assert self.fz.isfile is os.path.isfile
+
+
+@then('deleting an attribute of the snapshot raises AttributeError')
+def deleting_an_attribute_of_the_snapshot_raises_attributeerror(self):
+    """deleting an attribute of the snapshot raises AttributeError."""
+    with pytest.raises(AttributeError):
+        del self.fz.isfile
+
+
+@then('the snapshots are equal and have the same hash')
+def the_snapshots_are_equal_and_have_the_same_hash(self):
+    """the snapshots are equal and have the same hash."""
+    assert self.fz is not self.other
+    assert self.fz == self.other
+    assert hash(self.fz) == hash(self.other)
+    assert len(set([self.fz, self.other])) == 1
+
+
+@then('freezing the symboldict raises ImportError')
+def freezing_the_symboldict_raises_importerror(self):
+    """freezing the symboldict raises ImportError."""
+    with pytest.raises(ImportError):
+        self.sy.freeze()
+
+
+@then('freezing the symboldict raises ValueError')
+def freezing_the_symboldict_raises_valueerror(self):
+    """freezing the symboldict raises ValueError."""
+    with pytest.raises(ValueError):
+        self.sy.freeze()
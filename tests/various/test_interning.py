@@ -0,0 +1,116 @@
+"""Interning of Symbol instances feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import gc
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/interning.feature')
+
+
+@pytest.fixture(autouse=True)
+def restore_interning():
+    old = sd.set_interning(False)
+    yield
+    sd.set_interning(old)
+
+
+@scenario('Interned symbols with same path are identical')
+def test_interned_symbols_with_same_path_are_identical():
+    """Interned symbols with same path are identical."""
+
+
+@scenario('Interned symbols share their value')
+def test_interned_symbols_share_their_value():
+    """Interned symbols share their value."""
+
+
+@scenario('Unused interned symbols are released')
+def test_unused_interned_symbols_are_released():
+    """Unused interned symbols are released."""
+
+
+@scenario('Symbols are not interned by default')
+def test_symbols_are_not_interned_by_default():
+    """Symbols are not interned by default."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('symbol interning is enabled')
+def symbol_interning_is_enabled():
+    """symbol interning is enabled."""
+    sd.set_interning(True)
+
+
+@given('symbol interning is disabled')
+def symbol_interning_is_disabled():
+    """symbol interning is disabled."""
+    sd.set_interning(False)
+
+
+@given('symbol w path to isfile and value')
+def symbol_w_path_to_isfile_and_value(self):
+    """symbol w path to isfile and value."""
+    self.symb = Symbol('os.path.isfile')
+    self.symb().getvalue()
+    return self.symb
+
+
+@when('2 symbols are created with the same path')
+def symbols_are_created_with_the_same_path(self):
+    """2 symbols are created with the same path."""
+    self.symbs = [Symbol('spam.ham.eggs'), Symbol('spam', 'ham').eggs]
+
+
+@when('another symbol is created with the same path')
+def another_symbol_is_created_with_the_same_path(self):
+    """another symbol is created with the same path."""
+    self.other = Symbol('os', 'path', 'isfile')
+
+
+@when('these symbols are deleted')
+def these_symbols_are_deleted(self):
+    """these symbols are deleted."""
+    del self.symbs
+    gc.collect()
+
+
+@then('these 2 symbols are the same instance')
+def these_2_symbols_are_the_same_instance(self):
+    """these 2 symbols are the same instance."""
+    a, b = self.symbs
+    assert a is b
+
+
+@then('these 2 symbols are different instances')
+def these_2_symbols_are_different_instances(self):
+    """these 2 symbols are different instances."""
+    a, b = self.symbs
+    assert a == b
+    assert a is not b
+
+
+@then('its value is available w rule dont load')
+def its_value_is_available_w_rule_dont_load(self):
+    """its value is available w rule dont load."""
+    assert self.other().getvalue(sd.Rule.DONT_LOAD) is os.path.isfile
+
+
+@then('the path is not interned')
+def the_path_is_not_interned():
+    """the path is not interned."""
+    assert 'spam.ham.eggs' not in sd._interned
@@ -0,0 +1,150 @@
+"""Lazy import rule feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+import importlib.util
+import sys
+import threading
+import time
+import types
+
+scenario = partial(scenario, '../features/lazy_import.feature')
+
+MODNAME = 'symboldict_lazy_import_test_module'
+
+
+@scenario('Lazy import rule does not run the module body')
+def test_lazy_import_rule_does_not_run_the_module_body():
+    """Lazy import rule does not run the module body."""
+
+
+@scenario('Module body runs when an attribute is accessed')
+def test_module_body_runs_when_an_attribute_is_accessed():
+    """Module body runs when an attribute is accessed."""
+
+
+@scenario('Batch loading w rule lazy import does not run the module body')
+def test_batch_loading_w_rule_lazy_import_does_not_run_the_module_body():
+    """Batch loading w rule lazy import does not run the module body."""
+
+
+@scenario('Threads importing a module lazily share the same module')
+def test_threads_importing_a_module_lazily_share_the_same_module():
+    """Threads importing a module lazily share the same module."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('an importable module with a side effect')
+def an_importable_module_with_a_side_effect(tmp_path, monkeypatch):
+    """an importable module with a side effect."""
+    (tmp_path / (MODNAME + '.py')).write_text(
+        'import sys\n'
+        'sys._symboldict_test_runs = getattr(sys, "_symboldict_test_runs", 0) + 1\n'
+        'answer = 42\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, MODNAME, raising=False)
+    monkeypatch.setattr(sys, '_symboldict_test_runs', 0, raising=False)
+    yield
+    sys.modules.pop(MODNAME, None)
+
+
+@given('symbol w path to this module')
+def symbol_w_path_to_this_module(self):
+    """symbol w path to this module."""
+    self.symb = Symbol(MODNAME)
+    return self.symb
+
+
+@given('symboldict w key to this module')
+def symboldict_w_key_to_this_module(self):
+    """symboldict w key to this module."""
+    self.sy = sd.SymbolDict(mod=MODNAME)
+
+
+@when('load_all is called with rule lazy import')
+def load_all_is_called_with_rule_lazy_import(self):
+    """load_all is called with rule lazy import."""
+    self.values, self.errors = self.sy.load_all(rule=sd.Rule.LAZY_IMPORT)
+
+
+@then('the module is loaded')
+def the_module_is_loaded(self):
+    """the module is loaded."""
+    assert not self.errors
+    assert self.values['mod'] is sys.modules[MODNAME]
+
+
+@when('getvalue is called with rule lazy import')
+def getvalue_is_called_with_rule_lazy_import(self):
+    """getvalue is called with rule lazy import."""
+    self.result = self.symb().getvalue(sd.Rule.LAZY_IMPORT)
+
+
+@when('an attribute of the module is accessed')
+def an_attribute_of_the_module_is_accessed(self):
+    """an attribute of the module is accessed."""
+    assert self.result.answer == 42
+
+
+@then('the module is returned')
+def the_module_is_returned(self):
+    """the module is returned."""
+    assert isinstance(self.result, types.ModuleType)
+    assert sys.modules[MODNAME] is self.result
+
+
+@then('the module body has not run')
+def the_module_body_has_not_run():
+    """the module body has not run."""
+    assert sys._symboldict_test_runs == 0
+
+
+@then('the module body has run once')
+def the_module_body_has_run_once():
+    """the module body has run once."""
+    assert sys._symboldict_test_runs == 1
+
+
+@given('a slow creation of the lazy modules')
+def a_slow_creation_of_the_lazy_modules(monkeypatch):
+    """a slow creation of the lazy modules."""
+    module_from_spec = importlib.util.module_from_spec
+    def slow(spec):
+        time.sleep(0.05)
+        return module_from_spec(spec)
+    monkeypatch.setattr(importlib.util, 'module_from_spec', slow)
+
+
+@when('two threads import the module lazily')
+def two_threads_import_the_module_lazily(self):
+    """two threads import the module lazily."""
+    self.results = []
+    def target():
+        self.results.append(sd._lazy_import(MODNAME))
+    threads = [threading.Thread(target=target) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+@then('both threads obtain the module in sys modules')
+def both_threads_obtain_the_module_in_sys_modules(self):
+    """both threads obtain the module in sys modules."""
+    assert len(self.results) == 2
+    for module in self.results:
+        assert module is sys.modules[MODNAME]
@@ -0,0 +1,249 @@
+"""Lazy value proxies in SymbolDict feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from collections import OrderedDict
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import math
+import operator
+import pytest
+import symboldict as sd
+import os
+import sys
+import types
+
+scenario = partial(scenario, '../features/lazy_values.feature')
+
+
+@scenario('Attribute access in lazy mode does not import')
+def test_attribute_access_in_lazy_mode_does_not_import():
+    """Attribute access in lazy mode does not import."""
+
+
+@scenario('First use of the proxy loads the value and rebinds it')
+def test_first_use_of_the_proxy_loads_the_value_and_rebinds_it():
+    """First use of the proxy loads the value and rebinds it."""
+
+
+@scenario('Proxy supports isinstance and operators')
+def test_proxy_supports_isinstance_and_operators():
+    """Proxy supports isinstance and operators."""
+
+
+@scenario('Proxy supports numeric, iteration and path protocols')
+def test_proxy_supports_numeric_iteration_and_path_protocols():
+    """Proxy supports numeric, iteration and path protocols."""
+
+
+@scenario('Proxy of a class can be a base class')
+def test_proxy_of_a_class_can_be_a_base_class():
+    """Proxy of a class can be a base class."""
+
+
+@scenario('In-place operators mutate the value of the proxy')
+def test_inplace_operators_mutate_the_value_of_the_proxy():
+    """In-place operators mutate the value of the proxy."""
+
+
+@scenario('Proxy of a missing symbol raises on use')
+def test_proxy_of_a_missing_symbol_raises_on_use():
+    """Proxy of a missing symbol raises on use."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+def lazy_sd(**kwargs):
+    d = sd.SymbolDict(**kwargs)
+    d.lazy = True
+    return d
+
+
+@given('lazy sd pointing to Telnet')
+def lazy_sd_pointing_to_telnet(self):
+    """lazy sd pointing to Telnet."""
+    self.sd = lazy_sd(Telnet='telnetlib.Telnet')
+    return self.sd
+
+
+@given('lazy sd pointing to OrderedDict and pi')
+def lazy_sd_pointing_to_ordereddict_and_pi(self):
+    """lazy sd pointing to OrderedDict and pi."""
+    self.sd = lazy_sd(odict='collections.OrderedDict', pi='math.pi')
+    return self.sd
+
+
+MODNAME = str('symboldict_lazy_values_module')
+
+
+class Matrix(object):
+    def __matmul__(self, other):
+        return 'matmul'
+
+    def __rmatmul__(self, other):
+        return 'rmatmul'
+
+
+@given('a module with numeric, iterator and path attributes')
+def a_module_with_numeric_iterator_and_path_attributes(monkeypatch):
+    """a module with numeric, iterator and path attributes."""
+    module = types.ModuleType(MODNAME)
+    module.x = 7.5
+    module.data = b'spam'
+    module.seq = [1, 2, 3]
+    module.it = iter([1, 2])
+    module.matrix = Matrix()
+    module.path = '.'
+    monkeypatch.setitem(sys.modules, MODNAME, module)
+
+
+@given('lazy sd pointing to these attributes')
+def lazy_sd_pointing_to_these_attributes(self):
+    """lazy sd pointing to these attributes."""
+    self.sd = lazy_sd(**dict(
+        (key, MODNAME + '.' + key)
+        for key in ('x', 'data', 'seq', 'it', 'matrix', 'path')))
+    return self.sd
+
+
+@given('lazy sd pointing to spam')
+def lazy_sd_pointing_to_spam(self):
+    """lazy sd pointing to spam."""
+    self.sd = lazy_sd(ham='spam.ham')
+    return self.sd
+
+
+@given('telnetlib forced out of sys modules')
+def telnetlib_forced_out_of_sys_modules():
+    """telnetlib forced out of sys modules."""
+    sys.modules.pop('telnetlib', None)
+
+
+@when('the Telnet attribute is accessed')
+def the_telnet_attribute_is_accessed(self):
+    """the Telnet attribute is accessed."""
+    self.result = self.sd.Telnet
+
+
+@when('the ham attribute is accessed')
+def the_ham_attribute_is_accessed(self):
+    """the ham attribute is accessed."""
+    self.result = self.sd.ham
+
+
+@when('the proxy is called with attribute access')
+def the_proxy_is_called_with_attribute_access(self):
+    """the proxy is called with attribute access."""
+    assert self.result.__name__ == 'Telnet'
+
+
+@then('result is a lazy value')
+def result_is_a_lazy_value(self):
+    """result is a lazy value."""
+    assert type(self.result) is sd.LazyValue
+    assert self.sd.Telnet is self.result
+
+
+@then('telnetlib is not in sys modules')
+def telnetlib_is_not_in_sys_modules():
+    """telnetlib is not in sys modules."""
+    assert 'telnetlib' not in sys.modules
+
+
+@then('the symboldict instance has the Telnet class in its dict')
+def the_symboldict_instance_has_the_telnet_class_in_its_dict(self):
+    """the symboldict instance has the Telnet class in its dict."""
+    import telnetlib
+    assert self.sd.__dict__['Telnet'] is telnetlib.Telnet
+    assert self.sd.Telnet is telnetlib.Telnet
+
+
+@then('isinstance works with the proxies')
+def isinstance_works_with_the_proxies(self):
+    """isinstance works with the proxies."""
+    odict, pi = self.sd.odict, self.sd.pi
+    assert isinstance(OrderedDict(), odict)
+    assert isinstance(pi, float)
+
+
+@then('arithmetic works with the pi proxy')
+def arithmetic_works_with_the_pi_proxy(self):
+    """arithmetic works with the pi proxy."""
+    pi = lazy_sd(pi='math.pi').pi
+    assert pi * 2 == 2 * pi == 2 * math.pi
+    assert pi > 3 and -pi < 0
+    assert hash(pi) == hash(math.pi)
+
+
+@then('calling the proxy raises importerror')
+def calling_the_proxy_raises_importerror(self):
+    """calling the proxy raises importerror."""
+    with pytest.raises(ImportError):
+        self.result()
+
+
+@then('the numeric protocols work with the proxies')
+def the_numeric_protocols_work_with_the_proxies(self):
+    """the numeric protocols work with the proxies."""
+    x = self.sd.x
+    assert round(x) == round(7.5)
+    assert round(x, 1) == 7.5
+    assert divmod(x, 2) == divmod(7.5, 2)
+    assert divmod(16, lazy_sd(x=MODNAME + '.x').x) == divmod(16, 7.5)
+    assert math.trunc(x) == 7
+    assert math.floor(x) == 7
+    assert math.ceil(x) == 8
+    if sys.version_info >= (3,):
+        assert bytes(self.sd.data) == b'spam'
+    if sys.version_info >= (3, 5):
+        matrix = self.sd.matrix
+        assert operator.matmul(matrix, None) == 'matmul'
+        assert operator.matmul(None, matrix) == 'rmatmul'
+
+
+@then('the iteration protocols work with the proxies')
+def the_iteration_protocols_work_with_the_proxies(self):
+    """the iteration protocols work with the proxies."""
+    assert list(reversed(self.sd.seq)) == [3, 2, 1]
+    it = self.sd.it
+    assert next(it) == 1
+    assert next(lazy_sd(it=MODNAME + '.it').it) == 2
+
+
+@then('the path protocol works with the proxies')
+def the_path_protocol_works_with_the_proxies(self):
+    """the path protocol works with the proxies."""
+    if hasattr(os, 'fspath'):
+        assert os.fspath(self.sd.path) == '.'
+
+
+@then('a class can derive from the OrderedDict proxy')
+def a_class_can_derive_from_the_ordereddict_proxy(self):
+    """a class can derive from the OrderedDict proxy."""
+    if sys.version_info < (3, 7):
+        pytest.skip('__mro_entries__ requires python 3.7')
+    class Derived(self.sd.odict):
+        pass
+    assert Derived.__mro__[1] is OrderedDict
+
+
+@then('in-place operators mutate the value of the proxy')
+def inplace_operators_mutate_the_value_of_the_proxy(self):
+    """in-place operators mutate the value of the proxy."""
+    seq = sys.modules[MODNAME].seq
+    proxy = self.sd.seq
+    proxy += [4]
+    assert proxy is seq
+    assert seq == [1, 2, 3, 4]
+    x = self.sd.x
+    x += 1
+    assert x == 8.5
+    assert sys.modules[MODNAME].x == 7.5
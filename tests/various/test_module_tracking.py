@@ -0,0 +1,156 @@
+"""Invalidation of values from reloaded or replaced modules feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from importlib import import_module, reload
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import gc
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+import sys
+import types
+import weakref
+
+scenario = partial(scenario, '../features/module_tracking.feature')
+
+MODNAME = str('symboldict_tracking_module')
+
+
+@scenario('Reloaded module invalidates its symbols')
+def test_reloaded_module_invalidates_its_symbols():
+    """Reloaded module invalidates its symbols."""
+
+
+@scenario('Replaced module invalidates its symbols')
+def test_replaced_module_invalidates_its_symbols():
+    """Replaced module invalidates its symbols."""
+
+
+@scenario('Unchanged modules are not reported')
+def test_unchanged_modules_are_not_reported():
+    """Unchanged modules are not reported."""
+
+
+@scenario('Loading from a replaced module invalidates the other symbols')
+def test_loading_from_a_replaced_module_invalidates_the_other_symbols():
+    """Loading from a replaced module invalidates the other symbols."""
+
+
+@scenario('Replaced modules are not kept alive')
+def test_replaced_modules_are_not_kept_alive():
+    """Replaced modules are not kept alive."""
+
+
+@pytest.fixture(autouse=True)
+def clean_owners():
+    sd.check_modules() # forget the modules replaced by other tests
+    yield
+    sys.modules.pop(MODNAME, None)
+    sd.check_modules()
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('a module with a class Spam and an attribute x')
+def a_module_with_a_class_spam_and_an_attribute_x(tmp_path, monkeypatch):
+    """a module with a class Spam and an attribute x."""
+    (tmp_path / (MODNAME + '.py')).write_text(
+        'class Spam(object):\n    pass\nx = 1\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sys.modules.pop(MODNAME, None)
+
+
+@given('symboldict w keys to the class and to another module')
+def symboldict_w_keys_to_the_class_and_to_another_module(self):
+    """symboldict w keys to the class and to another module."""
+    self.sy = sd.SymbolDict(Spam=MODNAME + '.Spam', dumps='json.dumps')
+
+
+@when('the attributes of the symboldict are accessed')
+def the_attributes_of_the_symboldict_are_accessed(self):
+    """the attributes of the symboldict are accessed."""
+    self.spam = self.sy.Spam
+    self.dumps = self.sy.dumps
+
+
+@when('the module is reloaded')
+def the_module_is_reloaded():
+    """the module is reloaded."""
+    reload(import_module(MODNAME))
+
+
+@when('the module is replaced in sys modules')
+def the_module_is_replaced_in_sys_modules(self):
+    """the module is replaced in sys modules."""
+    self.replaced = weakref.ref(sys.modules[MODNAME])
+    module = types.ModuleType(MODNAME)
+    exec('class Spam(object):\n    pass\nx = 2\n', module.__dict__)
+    sys.modules[MODNAME] = module
+
+
+@when('check modules is called')
+def check_modules_is_called(self):
+    """check modules is called."""
+    self.reported = sd.check_modules()
+
+
+@when('the attribute x is loaded through a new symbol')
+def the_attribute_x_is_loaded_through_a_new_symbol():
+    """the attribute x is loaded through a new symbol."""
+    assert Symbol(MODNAME, 'x')().getvalue() == 2
+
+
+@then('the reported modules are the module')
+def the_reported_modules_are_the_module(self):
+    """the reported modules are the module."""
+    assert self.reported == [MODNAME]
+
+
+@then('no module is reported')
+def no_module_is_reported(self):
+    """no module is reported."""
+    assert self.reported == []
+
+
+@then('the class is a new object')
+def the_class_is_a_new_object(self):
+    """the class is a new object."""
+    spam = self.sy.Spam
+    assert spam is not self.spam
+    assert spam is sys.modules[MODNAME].Spam
+
+
+@then('the other key keeps its cached value')
+def the_other_key_keeps_its_cached_value(self):
+    """the other key keeps its cached value."""
+    assert self.sy.__dict__['dumps'] is self.dumps
+
+
+@then('the symbol of the class has no value')
+def the_symbol_of_the_class_has_no_value(self):
+    """the symbol of the class has no value."""
+    assert 'Spam' not in self.sy.__dict__
+    assert not self.sy['Spam']().hasvalue(sd.Rule.DONT_LOAD)
+
+
+@then('the replaced module is freed')
+def the_replaced_module_is_freed(self):
+    """the replaced module is freed."""
+    gc.collect()
+    assert self.replaced() is None
+
+
+@then('the symbol of the class has a value')
+def the_symbol_of_the_class_has_a_value(self):
+    """the symbol of the class has a value."""
+    assert self.sy['Spam']().hasvalue(sd.Rule.DONT_LOAD)
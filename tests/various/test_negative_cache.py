@@ -0,0 +1,100 @@
+"""Negative cache of failed searches feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/negative_cache.feature')
+
+
+@scenario('Failed search is the cause of later errors')
+def test_failed_search_is_the_cause_of_later_errors():
+    """Failed search is the cause of later errors."""
+
+
+@scenario('Retry after rule does not search again before delay')
+def test_retry_after_rule_does_not_search_again_before_delay():
+    """Retry after rule does not search again before delay."""
+
+
+@scenario('Retry after rule searches again after delay')
+def test_retry_after_rule_searches_again_after_delay():
+    """Retry after rule searches again after delay."""
+
+
+@given('namespace')
+def self(monkeypatch):
+    """namespace."""
+    ns = type(str('Namespace'), (object,), {})()
+    ns.calls = []
+    real = sd._resolve
+    def counting_resolve(path, *args):
+        ns.calls.append(path)
+        return real(path, *args)
+    monkeypatch.setattr(sd, '_resolve', counting_resolve)
+    return ns
+
+
+@given('symbol w path to spam in os')
+def symbol_w_path_to_spam_in_os(self):
+    """symbol w path to spam in os."""
+    self.symb = Symbol('os.spam')
+    return self.symb
+
+
+@when('calling getvalue wo rule fails')
+def calling_getvalue_wo_rule_fails(self):
+    """calling getvalue wo rule fails."""
+    with pytest.raises(ImportError) as info:
+        self.symb().getvalue()
+    self.error = info.value
+
+
+@when('hasvalue is called twice with rule retry after 60 seconds')
+def hasvalue_is_called_twice_with_rule_retry_after_60_seconds(self):
+    """hasvalue is called twice with rule retry after 60 seconds."""
+    rule = sd.RetryAfter(60)
+    assert not self.symb().hasvalue(rule)
+    assert not self.symb().hasvalue(rule)
+
+
+@when('hasvalue is called twice with rule retry after 0 seconds')
+def hasvalue_is_called_twice_with_rule_retry_after_0_seconds(self):
+    """hasvalue is called twice with rule retry after 0 seconds."""
+    rule = sd.RetryAfter(0)
+    assert not self.symb().hasvalue(rule)
+    assert not self.symb().hasvalue(rule)
+
+
+@then('calling getvalue again raises voidvalueerror caused by the first error')
+def calling_getvalue_again_raises_voidvalueerror_caused_by_the_first_error(self):
+    """calling getvalue again raises voidvalueerror caused by the first error."""
+    with pytest.raises(sd.VoidValueError) as info:
+        self.symb().getvalue()
+    assert info.value.__cause__ is self.error
+
+
+@then('symbolcontrol error method returns the first error')
+def symbolcontrol_error_method_returns_the_first_error(self):
+    """symbolcontrol error method returns the first error."""
+    assert self.symb().error() is self.error
+
+
+@then('the path was searched once')
+def the_path_was_searched_once(self):
+    """the path was searched once."""
+    assert self.calls == ['os.spam']
+
+
+@then('the path was searched twice')
+def the_path_was_searched_twice(self):
+    """the path was searched twice."""
+    assert self.calls == ['os.spam', 'os.spam']
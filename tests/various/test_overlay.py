@@ -0,0 +1,205 @@
+"""Copy-on-write SymbolDict overlays feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import copy
+import json
+import os
+import pickle
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/overlay.feature')
+
+
+@scenario('Overlay shows the entries of its base with its overrides')
+def test_overlay_shows_the_entries_of_its_base_with_its_overrides():
+    """Overlay shows the entries of its base with its overrides."""
+
+
+@scenario('Overlay shares the values resolved by its base')
+def test_overlay_shares_the_values_resolved_by_its_base():
+    """Overlay shares the values resolved by its base."""
+
+
+@scenario('Overlay resolves its overridden entries')
+def test_overlay_resolves_its_overridden_entries():
+    """Overlay resolves its overridden entries."""
+
+
+@scenario('Overlay changes do not affect the base')
+def test_overlay_changes_do_not_affect_the_base():
+    """Overlay changes do not affect the base."""
+
+
+@scenario('Deleting a key of the base from the overlay raises KeyError')
+def test_deleting_a_key_of_the_base_from_the_overlay_raises_keyerror():
+    """Deleting a key of the base from the overlay raises KeyError."""
+
+
+@scenario('Strict overlay refuses reserved keys')
+def test_strict_overlay_refuses_reserved_keys():
+    """Strict overlay refuses reserved keys."""
+
+
+@scenario('Overlay can be copied')
+def test_overlay_can_be_copied():
+    """Overlay can be copied."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('symboldict w keys isfile and dumps')
+def symboldict_w_keys_isfile_and_dumps(self):
+    """symboldict w keys isfile and dumps."""
+    self.sy = sd.SymbolDict(isfile='os.path.isfile', dumps='json.dumps')
+
+
+@given('an overlay of this symboldict overriding dumps')
+def an_overlay_of_this_symboldict_overriding_dumps(self):
+    """an overlay of this symboldict overriding dumps."""
+    self.ov = self.sy.overlay(dumps='pickle.dumps')
+
+
+@when('the attribute isfile of the overlay is accessed')
+def the_attribute_isfile_of_the_overlay_is_accessed(self):
+    """the attribute isfile of the overlay is accessed."""
+    assert self.ov.isfile is os.path.isfile
+
+
+@when('a key is set in the overlay')
+def a_key_is_set_in_the_overlay(self):
+    """a key is set in the overlay."""
+    self.ov['isdir'] = 'os.path.isdir'
+    assert self.ov.isdir is os.path.isdir
+
+
+@when('the overridden key is deleted from the overlay')
+def the_overridden_key_is_deleted_from_the_overlay(self):
+    """the overridden key is deleted from the overlay."""
+    del self.ov['dumps']
+
+
+@then('the overlay has the keys isfile and dumps')
+def the_overlay_has_the_keys_isfile_and_dumps(self):
+    """the overlay has the keys isfile and dumps."""
+    assert sorted(self.ov) == ['dumps', 'isfile']
+    assert len(self.ov) == 2
+    assert 'isfile' in self.ov
+
+
+@then('the symbol of dumps in the overlay is the override')
+def the_symbol_of_dumps_in_the_overlay_is_the_override(self):
+    """the symbol of dumps in the overlay is the override."""
+    assert self.ov['dumps'] == Symbol('pickle.dumps')
+
+
+@then('the symbol of dumps in the base is unchanged')
+def the_symbol_of_dumps_in_the_base_is_unchanged(self):
+    """the symbol of dumps in the base is unchanged."""
+    assert self.sy['dumps'] == Symbol('json.dumps')
+
+
+@then('the value of isfile is cached in the base')
+def the_value_of_isfile_is_cached_in_the_base(self):
+    """the value of isfile is cached in the base."""
+    assert self.sy.__dict__['isfile'] is os.path.isfile
+
+
+@then('the overlay stores only the overridden entry')
+def the_overlay_stores_only_the_overridden_entry(self):
+    """the overlay stores only the overridden entry."""
+    assert not hasattr(self.ov, '__dict__')
+    layer = self.ov._SymbolDictOverlay__layer
+    assert list(layer) == ['dumps']
+    assert layer.__dict__ == {}
+
+
+@then('the attribute dumps of the overlay is the overridden value')
+def the_attribute_dumps_of_the_overlay_is_the_overridden_value(self):
+    """the attribute dumps of the overlay is the overridden value."""
+    assert self.ov.dumps is pickle.dumps
+
+
+@then('getvalue dumps on the overlay is the overridden value')
+def getvalue_dumps_on_the_overlay_is_the_overridden_value(self):
+    """getvalue dumps on the overlay is the overridden value."""
+    assert self.ov.getvalue('dumps') is pickle.dumps
+    assert self.sy.getvalue('dumps') is json.dumps
+
+
+@then('hasvalue dumps on the overlay is true')
+def hasvalue_dumps_on_the_overlay_is_true(self):
+    """hasvalue dumps on the overlay is true."""
+    assert self.ov.hasvalue('dumps')
+
+
+@then('the base does not have the new key')
+def the_base_does_not_have_the_new_key(self):
+    """the base does not have the new key."""
+    assert 'isdir' not in self.sy
+    with pytest.raises(AttributeError):
+        self.sy.isdir
+
+
+@then('the overlay shows the symbol of dumps in the base')
+def the_overlay_shows_the_symbol_of_dumps_in_the_base(self):
+    """the overlay shows the symbol of dumps in the base."""
+    assert self.ov['dumps'] is self.sy['dumps']
+    assert self.ov.dumps is json.dumps
+
+
+@then('deleting isfile from the overlay raises KeyError')
+def deleting_isfile_from_the_overlay_raises_keyerror(self):
+    """deleting isfile from the overlay raises KeyError."""
+    with pytest.raises(KeyError):
+        del self.ov['isfile']
+    assert 'isfile' in self.sy
+
+
+@then('setting a reserved key in the overlay raises TypeError')
+def setting_a_reserved_key_in_the_overlay_raises_typeerror(self):
+    """setting a reserved key in the overlay raises TypeError."""
+    with pytest.raises(TypeError):
+        self.ov['items'] = 'os.sep'
+
+
+@when('the overlay is copied with the copy module')
+def the_overlay_is_copied_with_the_copy_module(self):
+    """the overlay is copied with the copy module."""
+    self.copies = [copy.copy(self.ov), self.ov.copy()]
+
+
+@then('the copies have the keys isfile and dumps')
+def the_copies_have_the_keys_isfile_and_dumps(self):
+    """the copies have the keys isfile and dumps."""
+    for ov in self.copies:
+        assert sorted(ov) == ['dumps', 'isfile']
+        assert ov['dumps'] == Symbol('pickle.dumps')
+
+
+@then('setting a key in a copy does not change the overlay')
+def setting_a_key_in_a_copy_does_not_change_the_overlay(self):
+    """setting a key in a copy does not change the overlay."""
+    for ov in self.copies:
+        ov['isdir'] = 'os.path.isdir'
+    assert 'isdir' not in self.ov
+
+
+@then('an overlay without slots has no attributes')
+def an_overlay_without_slots_has_no_attributes():
+    """an overlay without slots has no attributes."""
+    # the state of an overlay rebuilt by copy.copy() or pickle
+    ov = object.__new__(sd.SymbolDictOverlay)
+    assert not hasattr(ov, 'isfile')
@@ -0,0 +1,198 @@
+"""Path index of SymbolDict feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import random
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/path_index.feature')
+
+PREFIXES = ['', 'os', 'os.path', 'os.path.isfile', 'spam', 'spam.ham',
+            'json', 'json.decoder', 'sys']
+
+
+@scenario('Keys under a prefix follow the path segments')
+def test_keys_under_a_prefix_follow_the_path_segments():
+    """Keys under a prefix follow the path segments."""
+
+
+@scenario('Path index follows the dictionary modifications')
+def test_path_index_follows_the_dictionary_modifications():
+    """Path index follows the dictionary modifications."""
+
+
+@scenario('Load the symbols under a prefix')
+def test_load_the_symbols_under_a_prefix():
+    """Load the symbols under a prefix."""
+
+
+@scenario('Invalidate the symbols under a prefix')
+def test_invalidate_the_symbols_under_a_prefix():
+    """Invalidate the symbols under a prefix."""
+
+
+@scenario('Group the keys by module')
+def test_group_the_keys_by_module():
+    """Group the keys by module."""
+
+
+def unindexed(sy):
+    """Returns a SymbolDict with the items of sy and no index."""
+    result = sd.SymbolDict(sy)
+    assert not result.indexed
+    return result
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('symboldict w keys under os, os.path and spam')
+def symboldict_w_keys_under_os_ospath_and_spam(self):
+    """symboldict w keys under os, os.path and spam."""
+    self.sy = sd.SymbolDict(isfile='os.path.isfile', sep='os.sep',
+                            pathsep='os.pathsep', ham='spam.ham',
+                            eggs='spam.eggs')
+
+
+@given('the path index is enabled')
+def the_path_index_is_enabled(self):
+    """the path index is enabled."""
+    self.sy.indexed = True
+    assert self.sy.indexed
+
+
+@when('the dictionary is modified by every method')
+def the_dictionary_is_modified_by_every_method(self):
+    """the dictionary is modified by every method."""
+    sy = self.sy
+    rng = random.Random(0)
+    paths = ['os.path.isfile', 'os.path.join', 'os.sep', 'os',
+             'spam.ham', 'spam.ham.eggs', 'json.decoder.JSONDecoder']
+    keys = ['k{}'.format(i) for i in range(6)]
+    for step in range(300):
+        op = rng.randrange(6)
+        k, p = rng.choice(keys), rng.choice(paths)
+        if op == 0:
+            sy[k] = p
+        elif op == 1:
+            sy.update([(k, p), (rng.choice(keys), rng.choice(paths))])
+        elif op == 2:
+            sy.setdefault(k, p)
+        elif op == 3:
+            if k in sy:
+                del sy[k]
+        elif op == 4:
+            sy.pop(k, None)
+        elif sy and rng.random() < 0.3:
+            sy.popitem()
+    sy.clear()
+    sy.update(isfile='os.path.isfile', sep='os.sep')
+
+
+@when('the symbols under os are loaded')
+def the_symbols_under_os_are_loaded(self):
+    """the symbols under os are loaded."""
+    values, errors = self.sy.load_under('os')
+    assert sorted(values) == ['isfile', 'pathsep', 'sep']
+    assert not errors
+
+
+@when('the attributes isfile and sep are accessed')
+def the_attributes_isfile_and_sep_are_accessed(self):
+    """the attributes isfile and sep are accessed."""
+    assert self.sy.isfile is os.path.isfile
+    assert self.sy.sep == os.sep
+
+
+@when('the symbols under os.path are invalidated')
+def the_symbols_under_ospath_are_invalidated(self):
+    """the symbols under os.path are invalidated."""
+    assert self.sy.invalidate_under(Symbol('os.path')) == ['isfile']
+
+
+@then('the keys under os.path are isfile')
+def the_keys_under_ospath_are_isfile(self):
+    """the keys under os.path are isfile."""
+    assert self.sy.keys_under('os.path') == ['isfile']
+    assert self.sy.keys_under('os.pa') == []
+
+
+@then('the keys under os are isfile, sep and pathsep')
+def the_keys_under_os_are_isfile_sep_and_pathsep(self):
+    """the keys under os are isfile, sep and pathsep."""
+    assert sorted(self.sy.keys_under('os')) == ['isfile', 'pathsep', 'sep']
+
+
+@then('the keys under spam are ham and eggs')
+def the_keys_under_spam_are_ham_and_eggs(self):
+    """the keys under spam are ham and eggs."""
+    assert sorted(self.sy.keys_under(Symbol('spam'))) == ['eggs', 'ham']
+
+
+@then('the keys are the same without the index')
+@then('the keys under each prefix are the same without the index')
+def the_keys_under_each_prefix_are_the_same_without_the_index(self):
+    """the keys under each prefix are the same without the index."""
+    other = unindexed(self.sy)
+    for prefix in PREFIXES:
+        assert (sorted(self.sy.keys_under(prefix))
+                == sorted(other.keys_under(prefix)))
+    assert self.sy.group_by_module() == other.group_by_module()
+
+
+@then('the emptied branches are pruned from the index')
+def the_emptied_branches_are_pruned_from_the_index(self):
+    """the emptied branches are pruned from the index."""
+    root = self.sy._index.root
+    assert sorted(root.children) == ['os']
+    assert sorted(root.children['os'].children) == ['path', 'sep']
+
+
+@then('the values of isfile, sep and pathsep are cached')
+def the_values_of_isfile_sep_and_pathsep_are_cached(self):
+    """the values of isfile, sep and pathsep are cached."""
+    assert self.sy.__dict__ == {'isfile': os.path.isfile, 'sep': os.sep,
+                                'pathsep': os.pathsep}
+
+
+@then('the symbols under spam are not loaded')
+def the_symbols_under_spam_are_not_loaded(self):
+    """the symbols under spam are not loaded."""
+    for key in ('ham', 'eggs'):
+        assert not self.sy.hasvalue(key, sd.Rule.DONT_LOAD)
+
+
+@then('the symbol of isfile has no value')
+def the_symbol_of_isfile_has_no_value(self):
+    """the symbol of isfile has no value."""
+    assert 'isfile' not in self.sy.__dict__
+    assert not self.sy.hasvalue('isfile', sd.Rule.DONT_LOAD)
+    assert self.sy.isfile is os.path.isfile
+
+
+@then('the symbol of sep has a value')
+def the_symbol_of_sep_has_a_value(self):
+    """the symbol of sep has a value."""
+    assert 'sep' in self.sy.__dict__
+    assert self.sy.hasvalue('sep', sd.Rule.DONT_LOAD)
+
+
+@then('the keys are grouped by imported module or top-level name')
+def the_keys_are_grouped_by_imported_module_or_toplevel_name(self):
+    """the keys are grouped by imported module or top-level name."""
+    groups = self.sy.group_by_module()
+    assert list(groups) == ['os.path', 'os', 'spam']
+    assert groups['os.path'] == ['isfile']
+    assert sorted(groups['os']) == ['pathsep', 'sep']
+    assert sorted(groups['spam']) == ['eggs', 'ham']
@@ -0,0 +1,235 @@
+"""Persistent SymbolDict versions feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import random
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/persistent.feature')
+
+
+@scenario('Set returns a new version')
+def test_set_returns_a_new_version():
+    """Set returns a new version."""
+
+
+@scenario('Delete returns a new version')
+def test_delete_returns_a_new_version():
+    """Delete returns a new version."""
+
+
+@scenario('Merge returns a new version')
+def test_merge_returns_a_new_version():
+    """Merge returns a new version."""
+
+
+@scenario('Versions share their unchanged structure')
+def test_versions_share_their_unchanged_structure():
+    """Versions share their unchanged structure."""
+
+
+@scenario('Diff lists the changes between versions')
+def test_diff_lists_the_changes_between_versions():
+    """Diff lists the changes between versions."""
+
+
+@scenario('Versions share the resolved values')
+def test_versions_share_the_resolved_values():
+    """Versions share the resolved values."""
+
+
+@scenario('Persistent symboldict is immutable and strict')
+def test_persistent_symboldict_is_immutable_and_strict():
+    """Persistent symboldict is immutable and strict."""
+
+
+@scenario('Random updates agree with a dict')
+def test_random_updates_agree_with_a_dict():
+    """Random updates agree with a dict."""
+
+
+class Key(object):
+    """A key with a chosen hash value."""
+    def __init__(self, name, h):
+        self.name, self.h = name, h
+
+    def __hash__(self):
+        return self.h
+
+    def __eq__(self, other):
+        return isinstance(other, Key) and other.name == self.name
+
+    def __ne__(self, other):
+        return not self == other
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('a persistent symboldict w 1000 keys')
+def a_persistent_symboldict_w_1000_keys(self):
+    """a persistent symboldict w 1000 keys."""
+    self.old = self.new = sd.PersistentSymbolDict(
+        ('k{}'.format(i), 'spam.ham{}'.format(i)) for i in range(1000))
+
+
+@when('key isfile is set to os.path.isfile')
+def key_isfile_is_set_to_ospathisfile(self):
+    """key isfile is set to os.path.isfile."""
+    self.new = self.new.set('isfile', 'os.path.isfile')
+
+
+@when('key isdir is set to os.path.isdir')
+def key_isdir_is_set_to_ospathisdir(self):
+    """key isdir is set to os.path.isdir."""
+    self.new = self.new.set('isdir', 'os.path.isdir')
+
+
+@when('key k5 is set to os.path.isdir')
+def key_k5_is_set_to_ospathisdir(self):
+    """key k5 is set to os.path.isdir."""
+    self.new = self.new.set('k5', 'os.path.isdir')
+
+
+@when('key k7 is set to os.path.isdir')
+def key_k7_is_set_to_ospathisdir(self):
+    """key k7 is set to os.path.isdir."""
+    self.new = self.new.set('k7', 'os.path.isdir')
+
+
+@when('key k5 is deleted')
+def key_k5_is_deleted(self):
+    """key k5 is deleted."""
+    self.new = self.new.delete('k5')
+
+
+@when('a mapping and keywords are merged')
+def a_mapping_and_keywords_are_merged(self):
+    """a mapping and keywords are merged."""
+    self.new = self.new.merge({'isfile': 'os.path.isfile'}, sep='os.sep')
+
+
+@when('the attribute isfile of the new version is accessed')
+def the_attribute_isfile_of_the_new_version_is_accessed(self):
+    """the attribute isfile of the new version is accessed."""
+    assert self.new.isfile is os.path.isfile
+
+
+@then('the new version has key isfile')
+def the_new_version_has_key_isfile(self):
+    """the new version has key isfile."""
+    assert self.new['isfile'] == Symbol('os.path.isfile')
+    assert len(self.new) == 1001
+
+
+@then('the old version does not have key isfile')
+def the_old_version_does_not_have_key_isfile(self):
+    """the old version does not have key isfile."""
+    assert 'isfile' not in self.old
+    assert len(self.old) == 1000
+
+
+@then('the new version does not have key k5')
+def the_new_version_does_not_have_key_k5(self):
+    """the new version does not have key k5."""
+    assert 'k5' not in self.new
+    assert len(self.new) == 999
+
+
+@then('the old version has key k5')
+def the_old_version_has_key_k5(self):
+    """the old version has key k5."""
+    assert self.old['k5'] == Symbol('spam.ham5')
+
+
+@then('deleting a missing key raises KeyError')
+def deleting_a_missing_key_raises_keyerror(self):
+    """deleting a missing key raises KeyError."""
+    with pytest.raises(KeyError):
+        self.new.delete('k5')
+
+
+@then('the new version has the merged keys')
+def the_new_version_has_the_merged_keys(self):
+    """the new version has the merged keys."""
+    assert self.new['isfile'] == Symbol('os.path.isfile')
+    assert self.new['sep'] == Symbol('os.sep')
+    assert len(self.new) == 1002
+
+
+@then('the root nodes of the versions share all entries but one')
+def the_root_nodes_of_the_versions_share_all_entries_but_one(self):
+    """the root nodes of the versions share all entries but one."""
+    a = self.old._PersistentSymbolDict__root.entries
+    b = self.new._PersistentSymbolDict__root.entries
+    assert len(a) == len(b) == 32
+    assert sum(x is y for x, y in zip(a, b)) == 31
+
+
+@then('the diff between the versions lists these changes')
+def the_diff_between_the_versions_lists_these_changes(self):
+    """the diff between the versions lists these changes."""
+    assert self.old.diff(self.new) == {
+        'k5': (Symbol('spam.ham5'), None),
+        'isfile': (None, Symbol('os.path.isfile')),
+        'k7': (Symbol('spam.ham7'), Symbol('os.path.isdir')),
+    }
+    assert self.new.diff(self.new) == {}
+
+
+@then('the symbol of isfile in the last version has a value')
+def the_symbol_of_isfile_in_the_last_version_has_a_value(self):
+    """the symbol of isfile in the last version has a value."""
+    assert self.new['isfile']().hasvalue(sd.Rule.DONT_LOAD)
+
+
+@then('setting an attribute raises AttributeError')
+def setting_an_attribute_raises_attributeerror(self):
+    """setting an attribute raises AttributeError."""
+    with pytest.raises(AttributeError):
+        self.old.k5 = None
+
+
+@then('setting a reserved key raises TypeError')
+def setting_a_reserved_key_raises_typeerror(self):
+    """setting a reserved key raises TypeError."""
+    for key in ('items', 'merge'):
+        with pytest.raises(TypeError):
+            self.old.set(key, 'os.sep')
+
+
+@then('random updates w colliding hashes agree with a dict')
+def random_updates_w_colliding_hashes_agree_with_a_dict():
+    """random updates w colliding hashes agree with a dict."""
+    rng = random.Random(0)
+    keys = [Key(i, rng.choice([rng.getrandbits(60), rng.randrange(4)]))
+            for i in range(60)]
+    version, expected = sd.PersistentSymbolDict(), {}
+    for step in range(400):
+        key = rng.choice(keys)
+        previous, before = version, dict(expected)
+        if rng.random() < 0.6:
+            symb = Symbol('spam', str(step))
+            version = version.set(key, symb)
+            expected[key] = symb
+        elif key in expected:
+            version = version.delete(key)
+            del expected[key]
+        assert dict(version.items()) == expected
+        assert len(version) == len(expected)
+        changes = previous.diff(version)
+        assert set(changes) == set(
+            k for k in set(before) | set(expected)
+            if before.get(k) is not expected.get(k))
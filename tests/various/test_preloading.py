@@ -0,0 +1,87 @@
+"""Background preloading of SymbolDict entries feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+import sys
+import time
+
+scenario = partial(scenario, '../features/preloading.feature')
+
+
+@scenario('Preload returns futures of the values')
+def test_preload_returns_futures_of_the_values():
+    """Preload returns futures of the values."""
+
+
+@scenario('Foreground access waits for the preloading thread')
+def test_foreground_access_waits_for_the_preloading_thread():
+    """Foreground access waits for the preloading thread."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('sd pointing to existing and non existing symbols')
+def sd_pointing_to_existing_and_non_existing_symbols(self):
+    """sd pointing to existing and non existing symbols."""
+    self.sd = sd.SymbolDict(isfile='os.path.isfile', ham='spam.ham')
+    return self.sd
+
+
+@given('sd pointing to a slow symbol')
+def sd_pointing_to_a_slow_symbol(self, monkeypatch):
+    """sd pointing to a slow symbol."""
+    self.calls = []
+    real = sd._resolve
+    def slow_resolve(path, *args):
+        self.calls.append(path)
+        time.sleep(0.2)
+        return real(path, *args)
+    monkeypatch.setattr(sd, '_resolve', slow_resolve)
+    self.sd = sd.SymbolDict(slow='os.path.isdir')
+    return self.sd
+
+
+@when('all keys are preloaded')
+def all_keys_are_preloaded(self):
+    """all keys are preloaded."""
+    self.futures = self.sd.preload(workers=2)
+
+
+@when('the slow symbol is accessed by attribute')
+def the_slow_symbol_is_accessed_by_attribute(self):
+    """the slow symbol is accessed by attribute."""
+    self.result = self.sd.slow
+
+
+@then('the futures hold the values and errors')
+def the_futures_hold_the_values_and_errors(self):
+    """the futures hold the values and errors."""
+    assert self.futures['isfile'].result() is os.path.isfile
+    assert isinstance(self.futures['ham'].exception(), ImportError)
+
+
+@then('attribute proxies are installed for existing keys')
+def attribute_proxies_are_installed_for_existing_keys(self):
+    """attribute proxies are installed for existing keys."""
+    assert list(self.sd.__dict__) == ['isfile']
+
+
+@then('the slow path was searched once')
+def the_slow_path_was_searched_once(self):
+    """the slow path was searched once."""
+    assert self.result is os.path.isdir
+    assert self.calls == ['os.path.isdir']
@@ -0,0 +1,89 @@
+"""Recording of used symbols feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+
+scenario = partial(scenario, '../features/recording.feature')
+
+
+@scenario('Used symbols are recorded in first use order')
+def test_used_symbols_are_recorded_in_first_use_order():
+    """Used symbols are recorded in first use order."""
+
+
+@scenario('Preloading from manifest loads the recorded symbols only')
+def test_preloading_from_manifest_loads_the_recorded_symbols_only():
+    """Preloading from manifest loads the recorded symbols only."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('recording is started')
+def recording_is_started():
+    """recording is started."""
+    sd.start_recording()
+    yield
+    # the recorder is global, later tests must not record
+    sd.stop_recording()
+
+
+@given('sd pointing to three stdlib symbols')
+def sd_pointing_to_three_stdlib_symbols(self):
+    """sd pointing to three stdlib symbols."""
+    self.items = dict(isfile='os.path.isfile', isdir='os.path.isdir',
+                      sep='os.sep')
+    self.sd = sd.SymbolDict(self.items)
+    return self.sd
+
+
+@when('two symbols are used in reverse order')
+def two_symbols_are_used_in_reverse_order(self):
+    """two symbols are used in reverse order."""
+    self.sd.sep
+    self.sd.getvalue('isfile')
+    self.sd.sep
+
+
+@when('the manifest is written')
+def the_manifest_is_written(self, tmp_path):
+    """the manifest is written."""
+    self.manifest = str(tmp_path / 'manifest.json')
+    sd.write_manifest(self.manifest)
+
+
+@when('a new sd is preloaded from the manifest')
+def a_new_sd_is_preloaded_from_the_manifest(self):
+    """a new sd is preloaded from the manifest."""
+    other = sd.SymbolDict(self.items)
+    self.futures = other.preload_from_manifest(self.manifest)
+    for f in self.futures.values():
+        f.result()
+
+
+@then('the records list these paths in first use order')
+def the_records_list_these_paths_in_first_use_order():
+    """the records list these paths in first use order."""
+    records = sd.stop_recording()
+    assert [r['path'] for r in records] == ['os.sep', 'os.path.isfile']
+    assert [r['order'] for r in records] == [0, 1]
+    assert records[0]['time'] <= records[1]['time']
+
+
+@then('the preloaded keys are the recorded keys in first use order')
+def the_preloaded_keys_are_the_recorded_keys_in_first_use_order(self):
+    """the preloaded keys are the recorded keys in first use order."""
+    assert list(self.futures) == ['sep', 'isfile']
+    assert self.futures['isfile'].result() is os.path.isfile
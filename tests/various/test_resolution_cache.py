@@ -0,0 +1,150 @@
+"""Process-wide resolution cache feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/resolution_cache.feature')
+
+
+@pytest.fixture(autouse=True)
+def restore_resolution_cache():
+    yield
+    sd.resolution_cache.resize(0)
+    sd.resolution_cache.invalidate()
+
+
+@scenario('Symbols with same path share the cached value')
+def test_symbols_with_same_path_share_the_cached_value():
+    """Symbols with same path share the cached value."""
+
+
+@scenario('Symboldict attribute access consults the cache')
+def test_symboldict_attribute_access_consults_the_cache():
+    """Symboldict attribute access consults the cache."""
+
+
+@scenario('Least recently used path is evicted')
+def test_least_recently_used_path_is_evicted():
+    """Least recently used path is evicted."""
+
+
+@scenario('Cache invalidation by module prefix')
+def test_cache_invalidation_by_module_prefix():
+    """Cache invalidation by module prefix."""
+
+
+@scenario('Sibling symbols resume from the cached parent path')
+def test_sibling_symbols_resume_from_the_cached_parent_path():
+    """Sibling symbols resume from the cached parent path."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('empty resolution cache of size 2')
+def empty_resolution_cache_of_size_2():
+    """empty resolution cache of size 2."""
+    cache = sd.resolution_cache
+    cache.invalidate()
+    cache.resize(2)
+    cache.hits = cache.misses = 0
+    return cache
+
+
+@given('symbol w path to isfile and value')
+def symbol_w_path_to_isfile_and_value(self):
+    """symbol w path to isfile and value."""
+    self.symb = Symbol('os.path.isfile')
+    self.symb().getvalue()
+    return self.symb
+
+
+@when('another symbol is created with the same path')
+def another_symbol_is_created_with_the_same_path(self):
+    """another symbol is created with the same path."""
+    self.other = Symbol('os.path.isfile')
+
+
+@when('the value of the other symbol is fetched')
+def the_value_of_the_other_symbol_is_fetched(self):
+    """the value of the other symbol is fetched."""
+    assert self.other().getvalue() is os.path.isfile
+
+
+@when('a symboldict with the same path is accessed by attribute')
+def a_symboldict_with_the_same_path_is_accessed_by_attribute():
+    """a symboldict with the same path is accessed by attribute."""
+    assert sd.SymbolDict(isfile='os.path.isfile').isfile is os.path.isfile
+
+
+@when('3 different paths are fetched')
+def different_paths_are_fetched(self):
+    """3 different paths are fetched."""
+    self.paths = ['sys.platform', 'os.path.isdir', 'os.sep']
+    for p in self.paths:
+        Symbol(p)().getvalue()
+
+
+@when('the cache is invalidated with prefix os')
+def the_cache_is_invalidated_with_prefix_os():
+    """the cache is invalidated with prefix os."""
+    sd.resolution_cache.invalidate(prefix='os')
+
+
+@when('os path is replaced in the cache by a fake module')
+def os_path_is_replaced_in_the_cache_by_a_fake_module(self):
+    """os path is replaced in the cache by a fake module."""
+    assert 'os.path' in sd.resolution_cache
+    self.fake = type(str('Fake'), (object,), {'isdir': object()})
+    sd.resolution_cache.put('os.path', self.fake)
+
+
+@when('a sibling symbol is fetched')
+def a_sibling_symbol_is_fetched(self):
+    """a sibling symbol is fetched."""
+    self.result = Symbol('os.path.isdir')().getvalue()
+
+
+@then('the sibling value is taken from the fake module')
+def the_sibling_value_is_taken_from_the_fake_module(self):
+    """the sibling value is taken from the fake module."""
+    assert self.result is self.fake.isdir
+
+
+@then('the cache reports 1 hit and 1 miss')
+def the_cache_reports_1_hit_and_1_miss():
+    """the cache reports 1 hit and 1 miss."""
+    info = sd.resolution_cache.info()
+    assert (info['hits'], info['misses']) == (1, 1)
+
+
+@then('the first path is not in cache')
+def the_first_path_is_not_in_cache(self):
+    """the first path is not in cache."""
+    assert self.paths[0] not in sd.resolution_cache
+
+
+@then('the cache has size 2')
+def the_cache_has_size_2():
+    """the cache has size 2."""
+    assert len(sd.resolution_cache) == 2
+
+
+@then('no cached path starts with os')
+def no_cached_path_starts_with_os():
+    """no cached path starts with os."""
+    assert 'os.sep' not in sd.resolution_cache
+    assert 'os.path.isdir' not in sd.resolution_cache
@@ -0,0 +1,152 @@
+"""Compiled resolution plans feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+import sys
+
+scenario = partial(scenario, '../features/resolution_plans.feature')
+
+
+@scenario('Resolving a path compiles its plan')
+def test_resolving_a_path_compiles_its_plan():
+    """Resolving a path compiles its plan."""
+
+
+@scenario('Builtin paths have a builtin plan')
+def test_builtin_paths_have_a_builtin_plan():
+    """Builtin paths have a builtin plan."""
+
+
+@scenario('A stale imported plan is recompiled')
+def test_a_stale_imported_plan_is_recompiled():
+    """A stale imported plan is recompiled."""
+
+
+@scenario('A module raising on import is not imported again')
+def test_a_module_raising_on_import_is_not_imported_again():
+    """A module raising on import is not imported again."""
+
+
+@scenario('An invalid plan is rejected')
+def test_an_invalid_plan_is_rejected():
+    """An invalid plan is rejected."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('symbol w path to minidom parseString')
+def symbol_w_path_to_minidom_parsestring(self):
+    """symbol w path to minidom parseString."""
+    self.symb = Symbol('xml.dom.minidom.parseString')
+    return self.symb
+
+
+@given('symbol w path to complex conjugate')
+def symbol_w_path_to_complex_conjugate(self):
+    """symbol w path to complex conjugate."""
+    self.symb = Symbol('complex.conjugate')
+    return self.symb
+
+
+@given('symbol w path to sys platform')
+def symbol_w_path_to_sys_platform(self):
+    """symbol w path to sys platform."""
+    self.symb = Symbol('sys.platform')
+    return self.symb
+
+
+MODNAME = str('symboldict_plans_badmod')
+
+
+@given('a module raising on import')
+def a_module_raising_on_import(tmp_path, monkeypatch):
+    """a module raising on import."""
+    tmp_path.joinpath(MODNAME + '.py').write_text(
+        'import sys\n'
+        'sys.symboldict_plans_runs += 1\n'
+        'raise RuntimeError("broken module")\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, 'symboldict_plans_runs', 0, raising=False)
+    monkeypatch.delitem(sys.modules, MODNAME, raising=False)
+
+
+@given('symbol w path to an attribute of this module')
+def symbol_w_path_to_an_attribute_of_this_module(self):
+    """symbol w path to an attribute of this module."""
+    self.symb = Symbol(MODNAME, 'X')
+    return self.symb
+
+
+@when('the plan ma is imported for this path')
+def the_plan_ma_is_imported_for_this_path(self):
+    """the plan ma is imported for this path."""
+    sd.import_plans({str(self.symb): 'ma'})
+
+
+@then('getvalue raises the error of the module')
+def getvalue_raises_the_error_of_the_module(self):
+    """getvalue raises the error of the module."""
+    with pytest.raises(RuntimeError):
+        self.symb().getvalue()
+
+
+@then('the body of the module ran once')
+def the_body_of_the_module_ran_once():
+    """the body of the module ran once."""
+    assert sys.symboldict_plans_runs == 1
+
+
+@when('getvalue is called with rule force reload')
+def getvalue_is_called_with_rule_force_reload(self):
+    """getvalue is called with rule force reload."""
+    self.result = self.symb().getvalue(sd.Rule.FORCE_RELOAD)
+
+
+@when('the plan mm is imported for this path')
+def the_plan_mm_is_imported_for_this_path(self):
+    """the plan mm is imported for this path."""
+    sd.import_plans({str(self.symb): 'mm'})
+
+
+@then('the result is sys platform')
+def the_result_is_sys_platform(self):
+    """the result is sys platform."""
+    assert self.result is sys.platform
+
+
+@then('the exported plan of this path is mmma')
+def the_exported_plan_of_this_path_is_mmma(self):
+    """the exported plan of this path is mmma."""
+    assert sd.export_plans()[str(self.symb)] == 'mmma'
+
+
+@then('the exported plan of this path is ba')
+def the_exported_plan_of_this_path_is_ba(self):
+    """the exported plan of this path is ba."""
+    assert sd.export_plans()[str(self.symb)] == 'ba'
+
+
+@then('the exported plan of this path is ma')
+def the_exported_plan_of_this_path_is_ma(self):
+    """the exported plan of this path is ma."""
+    assert sd.export_plans()[str(self.symb)] == 'ma'
+
+
+@then('importing the plan b for this path raises valueerror')
+def importing_the_plan_b_for_this_path_raises_valueerror(self):
+    """importing the plan b for this path raises valueerror."""
+    with pytest.raises(ValueError):
+        sd.import_plans({str(self.symb): 'b'})
@@ -0,0 +1,130 @@
+"""Time-to-live and revalidation rules feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    parsers,
+    scenario,
+    then,
+    when,
+)
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+import sys
+import types
+
+scenario = partial(scenario, '../features/revalidation.feature')
+
+MODNAME = str('symboldict_revalidation_module')
+
+
+@scenario('Revalidation keeps the value of an unchanged module')
+def test_revalidation_keeps_the_value_of_an_unchanged_module():
+    """Revalidation keeps the value of an unchanged module."""
+
+
+@scenario('Revalidation sees a rebound attribute')
+def test_revalidation_sees_a_rebound_attribute():
+    """Revalidation sees a rebound attribute."""
+
+
+@scenario('Revalidation sees a replaced module')
+def test_revalidation_sees_a_replaced_module():
+    """Revalidation sees a replaced module."""
+
+
+@scenario('Value is kept before expiry')
+def test_value_is_kept_before_expiry():
+    """Value is kept before expiry."""
+
+
+@scenario('Value is searched again after expiry')
+def test_value_is_searched_again_after_expiry():
+    """Value is searched again after expiry."""
+
+
+@scenario('Revalidation searches again a value loaded by another rule')
+def test_revalidation_searches_again_a_value_loaded_by_another_rule():
+    """Revalidation searches again a value loaded by another rule."""
+
+
+def _module(x):
+    module = types.ModuleType(MODNAME)
+    module.x = x
+    return module
+
+
+@pytest.fixture
+def module(monkeypatch):
+    mod = _module(1)
+    monkeypatch.setitem(sys.modules, MODNAME, mod)
+    return mod
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('a module with attribute x equal to 1')
+def a_module_with_attribute_x_equal_to_1(module):
+    """a module with attribute x equal to 1."""
+
+
+@given('symbol w path to this attribute')
+def symbol_w_path_to_this_attribute(self):
+    """symbol w path to this attribute."""
+    self.symb = Symbol(MODNAME, 'x')
+
+
+@when('getvalue is called with rule revalidate')
+def getvalue_is_called_with_rule_revalidate(self):
+    """getvalue is called with rule revalidate."""
+    assert self.symb().getvalue(sd.Rule.REVALIDATE) == 1
+
+
+@when('getvalue is called with rule try load once')
+def getvalue_is_called_with_rule_try_load_once(self):
+    """getvalue is called with rule try load once."""
+    assert self.symb().getvalue(sd.Rule.TRY_LOAD_ONCE) == 1
+
+
+@when(parsers.parse('getvalue is called with rule expire after {seconds:d} seconds'))
+def getvalue_is_called_with_rule_expire_after(self, seconds):
+    """getvalue is called with rule expire after seconds."""
+    assert self.symb().getvalue(sd.ExpireAfter(seconds)) == 1
+
+
+@when('searching is disabled')
+def searching_is_disabled(monkeypatch):
+    """searching is disabled."""
+    def fail(*args, **kwargs):
+        raise AssertionError('unexpected search')
+    monkeypatch.setattr(sd, '_resolve', fail)
+
+
+@when(parsers.parse('the attribute is rebound to {x:d}'))
+def the_attribute_is_rebound_to(module, x):
+    """the attribute is rebound to x."""
+    module.x = x
+
+
+@when(parsers.parse('the module is replaced by a module with x equal to {x:d}'))
+def the_module_is_replaced_by_a_module_with_x_equal_to(monkeypatch, x):
+    """the module is replaced by a module with x equal to x."""
+    monkeypatch.setitem(sys.modules, MODNAME, _module(x))
+
+
+@then(parsers.parse('getvalue with rule revalidate returns {x:d}'))
+def getvalue_with_rule_revalidate_returns(self, x):
+    """getvalue with rule revalidate returns x."""
+    assert self.symb().getvalue(sd.Rule.REVALIDATE) == x
+
+
+@then(parsers.parse('getvalue with rule expire after {seconds:d} seconds returns {x:d}'))
+def getvalue_with_rule_expire_after_returns(self, seconds, x):
+    """getvalue with rule expire after seconds returns x."""
+    assert self.symb().getvalue(sd.ExpireAfter(seconds)) == x
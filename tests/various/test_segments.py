@@ -0,0 +1,127 @@
+"""Pre-split path segments of Symbol feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+
+scenario = partial(scenario, '../features/segments.feature')
+
+
+@scenario('Symbols built by attribute access inherit their segments')
+def test_symbols_built_by_attribute_access_inherit_their_segments():
+    """Symbols built by attribute access inherit their segments."""
+
+
+@scenario('Attribute access with a dotted name splits it into segments')
+def test_attribute_access_with_a_dotted_name_splits_it_into_segments():
+    """Attribute access with a dotted name splits it into segments."""
+
+
+@scenario('Segments are computed when a symbol is resolved')
+def test_segments_are_computed_when_a_symbol_is_resolved():
+    """Segments are computed when a symbol is resolved."""
+
+
+@scenario('Identical segments are shared by the symbols')
+def test_identical_segments_are_shared_by_the_symbols():
+    """Identical segments are shared by the symbols."""
+
+
+@scenario('Attribute access returns interned symbols')
+def test_attribute_access_returns_interned_symbols():
+    """Attribute access returns interned symbols."""
+
+
+@pytest.fixture
+def interning():
+    old = sd.set_interning(False)
+    yield
+    sd.set_interning(old)
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('interning is enabled')
+def interning_is_enabled(interning):
+    """interning is enabled."""
+    sd.set_interning(True)
+
+
+@when('symbol os.path.isfile is built by attribute access')
+def symbol_ospathisfile_is_built_by_attribute_access(self):
+    """symbol os.path.isfile is built by attribute access."""
+    self.symb = sd.symbol.os.path.isfile
+
+
+@given('symbol os with its segments')
+def symbol_os_with_its_segments(self):
+    """symbol os with its segments."""
+    self.parent = Symbol('os')
+    assert sd._segments(self.parent) == ('os',)
+
+
+@when('symbol os.path.isfile is built by getattr with path.isfile')
+def symbol_ospathisfile_is_built_by_getattr_with_pathisfile(self):
+    """symbol os.path.isfile is built by getattr with path.isfile."""
+    self.symb = getattr(self.parent, 'path.isfile')
+
+
+@given('symbol os.path.isfile built from its path')
+def symbol_ospathisfile_built_from_its_path(self):
+    """symbol os.path.isfile built from its path."""
+    self.symb = Symbol('os.path.isfile')
+
+
+@when('its value is obtained')
+def its_value_is_obtained(self):
+    """its value is obtained."""
+    assert self.symb().getvalue() is os.path.isfile
+
+
+@then('its segments are os, path and isfile')
+def its_segments_are_os_path_and_isfile(self):
+    """its segments are os, path and isfile."""
+    assert sd._readparts(self.symb) == ('os', 'path', 'isfile')
+
+
+@then('its path is os.path.isfile')
+def its_path_is_ospathisfile(self):
+    """its path is os.path.isfile."""
+    assert str(self.symb) == 'os.path.isfile'
+    assert self.symb == Symbol('os.path', 'isfile')
+
+
+@given('it has no segments')
+def it_has_no_segments(self):
+    """it has no segments."""
+    assert sd._readparts(self.symb) is None
+
+
+@then('the segments of two symbols built from different strings are identical')
+def the_segments_of_two_symbols_built_from_different_strings_are_identical():
+    """the segments of two symbols built from different strings are identical."""
+    name = ''.join(['spam', 'ham'])
+    a = sd._segments(Symbol('.'.join(['eggs', name, 'x'])))
+    b = sd._segments(getattr(Symbol('foo'), ''.join(['spam', 'ham'])))
+    assert a[1] == b[1] and a[1] is b[1]
+
+
+@then('attribute access returns the interned symbol')
+def attribute_access_returns_the_interned_symbol():
+    """attribute access returns the interned symbol."""
+    s = Symbol('os.path.isdir')
+    assert sd.symbol.os.path.isdir is s
+    assert Symbol('os.path').isdir is s
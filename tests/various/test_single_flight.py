@@ -0,0 +1,198 @@
+"""Single-flight loading of symbols feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import importlib
+import os
+import pytest
+import sys
+import types
+import symboldict as sd
+Symbol = sd.Symbol
+import threading
+import time
+
+scenario = partial(scenario, '../features/single_flight.feature')
+
+
+@scenario('Many threads accessing a cold attribute load it once')
+def test_many_threads_accessing_a_cold_attribute_load_it_once():
+    """Many threads accessing a cold attribute load it once."""
+
+
+@scenario('Many threads loading a failing symbol share the error')
+def test_many_threads_loading_a_failing_symbol_share_the_error():
+    """Many threads loading a failing symbol share the error."""
+
+
+@scenario('A thread importing a module loads its symbols while another thread waits for the module')
+def test_a_thread_importing_a_module_loads_its_symbols_while_another_thread_waits():
+    """A thread importing a module loads its symbols while another thread waits for the module."""
+
+
+@scenario('Waiting threads search the path when the search is interrupted')
+def test_waiting_threads_search_the_path_when_the_search_is_interrupted():
+    """Waiting threads search the path when the search is interrupted."""
+
+
+MODNAME = 'symboldict_flight_mod'
+MODULE = """
+import sys, time
+from symboldict import Symbol
+X = 1
+sys.modules['symboldict_flight_sync'].started.set()
+time.sleep(0.3) # the other thread starts searching X and waits for this module
+Y = Symbol(__name__ + '.X')().getvalue()
+"""
+
+
+@given('namespace')
+def self(monkeypatch):
+    """namespace."""
+    ns = type(str('Namespace'), (object,), {})()
+    ns.calls = []
+    real = sd._resolve
+    def slow_resolve(path, *args):
+        ns.calls.append(path)
+        time.sleep(0.1)
+        return real(path, *args)
+    monkeypatch.setattr(sd, '_resolve', slow_resolve)
+    return ns
+
+
+@given('sd pointing to a slow symbol')
+def sd_pointing_to_a_slow_symbol(self):
+    """sd pointing to a slow symbol."""
+    self.sd = sd.SymbolDict(slow='os.path.isdir')
+    return self.sd
+
+
+@given('symbol pointing to a slow missing path')
+def symbol_pointing_to_a_slow_missing_path(self):
+    """symbol pointing to a slow missing path."""
+    self.symb = Symbol('os.path.spam')
+    return self.symb
+
+
+@given('a module whose body loads one of its symbols')
+def a_module_whose_body_loads_one_of_its_symbols(self, tmp_path, monkeypatch):
+    """a module whose body loads one of its symbols."""
+    (tmp_path / (MODNAME + '.py')).write_text(MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, MODNAME, raising=False)
+    sync = types.ModuleType(str('symboldict_flight_sync'))
+    sync.started = threading.Event()
+    monkeypatch.setitem(sys.modules, 'symboldict_flight_sync', sync)
+    monkeypatch.setattr(sd, '_flight_timeout', 0.2)
+    self.sync = sync
+
+
+@given('the first search is interrupted by SystemExit')
+def the_first_search_is_interrupted_by_systemexit(self, monkeypatch):
+    """the first search is interrupted by SystemExit."""
+    slow = sd._resolve
+    def interrupted(path, *args):
+        if not self.calls:
+            self.calls.append(path)
+            time.sleep(0.1)
+            raise SystemExit
+        return slow(path, *args)
+    monkeypatch.setattr(sd, '_resolve', interrupted)
+
+
+def run_threads(n, func):
+    barrier = threading.Barrier(n)
+    results = [None] * n
+    def target(i):
+        barrier.wait()
+        results[i] = func()
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+@when('32 threads access the slow symbol by attribute')
+def threads_access_the_slow_symbol_by_attribute(self):
+    """32 threads access the slow symbol by attribute."""
+    self.results = run_threads(32, lambda: self.sd.slow)
+
+
+@when('32 threads call hasvalue w rule try load each')
+def threads_call_hasvalue_w_rule_try_load_each(self):
+    """32 threads call hasvalue w rule try load each."""
+    self.results = run_threads(
+        32, lambda: self.symb().hasvalue(sd.Rule.TRY_LOAD_EACH))
+
+
+@when('a thread imports the module while another thread loads this symbol')
+def a_thread_imports_the_module_while_another_thread_loads_this_symbol(self):
+    """a thread imports the module while another thread loads this symbol."""
+    self.results = {}
+    def load():
+        self.sync.started.wait()
+        self.results['load'] = Symbol(MODNAME + '.X')().getvalue()
+    def imp():
+        self.results['import'] = importlib.import_module(MODNAME).Y
+    threads = [threading.Thread(target=f) for f in (load, imp)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    for t in threads:
+        t.join(10)
+    assert not any(t.is_alive() for t in threads)
+
+
+@when('8 threads access the slow symbol by attribute')
+def threads_access_the_slow_symbol_by_attribute_8(self):
+    """8 threads access the slow symbol by attribute."""
+    def access():
+        try:
+            return self.sd.slow
+        except SystemExit:
+            return 'exit'
+    self.results = run_threads(8, access)
+
+
+@then('both threads obtained the value')
+def both_threads_obtained_the_value(self):
+    """both threads obtained the value."""
+    assert self.results == {'load': 1, 'import': 1}
+
+
+@then('one thread was interrupted')
+def one_thread_was_interrupted(self):
+    """one thread was interrupted."""
+    assert self.results.count('exit') == 1
+
+
+@then('the other threads obtained the value')
+def the_other_threads_obtained_the_value(self):
+    """the other threads obtained the value."""
+    assert [r for r in self.results if r != 'exit'] == [os.path.isdir] * 7
+
+
+@then('the slow path was searched once')
+def the_slow_path_was_searched_once(self):
+    """the slow path was searched once."""
+    assert len(self.calls) == 1
+
+
+@then('every thread obtained the value')
+def every_thread_obtained_the_value(self):
+    """every thread obtained the value."""
+    assert all(r is os.path.isdir for r in self.results)
+
+
+@then('every thread obtained false')
+def every_thread_obtained_false(self):
+    """every thread obtained false."""
+    assert self.results == [False] * 32
@@ -0,0 +1,88 @@
+"""Loading statistics feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    scenario,
+    then,
+    when,
+)
+import pytest
+import symboldict as sd
+
+scenario = partial(scenario, '../features/statistics.feature')
+
+
+@pytest.fixture(autouse=True)
+def restore_stats():
+    old = sd.set_stats(False)
+    sd.stats(reset=True)
+    yield
+    sd.set_stats(old)
+    sd.stats(reset=True)
+
+
+@scenario('Symboldict statistics count calls, loads and failures')
+def test_symboldict_statistics_count_calls_loads_and_failures():
+    """Symboldict statistics count calls, loads and failures."""
+
+
+@scenario('Disabled statistics are not collected')
+def test_disabled_statistics_are_not_collected():
+    """Disabled statistics are not collected."""
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('statistics are enabled')
+def statistics_are_enabled():
+    """statistics are enabled."""
+    sd.set_stats(True)
+
+
+@given('sd pointing to existing and non existing symbols')
+def sd_pointing_to_existing_and_non_existing_symbols(self):
+    """sd pointing to existing and non existing symbols."""
+    self.sd = sd.SymbolDict(isfile='os.path.isfile', ham='spam.ham')
+    return self.sd
+
+
+@when('statistics are disabled')
+def statistics_are_disabled(self):
+    """statistics are disabled."""
+    sd.set_stats(False)
+    self.before = sd.stats()
+
+
+@when('each key is checked twice with hasvalue')
+def each_key_is_checked_twice_with_hasvalue(self):
+    """each key is checked twice with hasvalue."""
+    for key in self.sd:
+        self.sd.hasvalue(key)
+        self.sd.hasvalue(key)
+
+
+@then('the statistics of the existing key show 2 calls and 1 load')
+def the_statistics_of_the_existing_key_show_2_calls_and_1_load(self):
+    """the statistics of the existing key show 2 calls and 1 load."""
+    rec = self.sd.stats()['isfile']
+    assert (rec['calls'], rec['loads'], rec['hits']) == (2, 1, 1)
+    assert rec['total_time'] >= rec['last_time'] > 0
+
+
+@then('the statistics of the non existing key show 1 failure')
+def the_statistics_of_the_non_existing_key_show_1_failure(self):
+    """the statistics of the non existing key show 1 failure."""
+    rec = self.sd.stats()['ham']
+    assert (rec['loads'], rec['failures']) == (1, 1)
+
+
+@then('the module statistics did not change')
+def the_module_statistics_did_not_change(self):
+    """the module statistics did not change."""
+    assert sd.stats() == self.before
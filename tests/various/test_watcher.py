@@ -0,0 +1,173 @@
+"""File-watching hot reload feature tests."""
+from __future__ import (absolute_import, division,
+                        print_function, unicode_literals)
+from functools import partial
+from pytest_bdd import (
+    given,
+    parsers,
+    scenario,
+    then,
+    when,
+)
+import os
+import pytest
+import symboldict as sd
+Symbol = sd.Symbol
+import sys
+import threading
+
+scenario = partial(scenario, '../features/watcher.feature')
+
+PKGNAME = str('symboldict_watched_package')
+
+
+@scenario('Unchanged files are not reloaded')
+def test_unchanged_files_are_not_reloaded():
+    """Unchanged files are not reloaded."""
+
+
+@scenario('Changed module is reloaded and its symbols refreshed')
+def test_changed_module_is_reloaded_and_its_symbols_refreshed():
+    """Changed module is reloaded and its symbols refreshed."""
+
+
+@scenario('Changed modules are reloaded in dependency order')
+def test_changed_modules_are_reloaded_in_dependency_order():
+    """Changed modules are reloaded in dependency order."""
+
+
+@scenario('Watcher thread reloads changed modules')
+def test_watcher_thread_reloads_changed_modules():
+    """Watcher thread reloads changed modules."""
+
+
+def _write(path, text):
+    """Writes a file and moves its modification time forward.
+    
+    The file is replaced at once, so that a polling watcher thread never
+    sees it partly written or with an intermediate modification time.
+    """
+    stamp = os.stat(str(path)).st_mtime + 10 if path.exists() else None
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(text)
+    if stamp is not None:
+        os.utime(str(tmp), (stamp, stamp))
+    os.replace(str(tmp), str(path))
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    pkg = tmp_path / PKGNAME
+    pkg.mkdir()
+    _write(pkg / '__init__.py', 'from .sub import VALUE\n')
+    _write(pkg / 'sub.py', 'VALUE = 1\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+    yield pkg
+    for name in list(sys.modules):
+        if name.startswith(PKGNAME):
+            del sys.modules[name]
+    sd.check_modules()
+
+
+@given('namespace')
+def self():
+    """namespace."""
+    return type(str('Namespace'), (object,), {})()
+
+
+@given('a package whose init imports a value from a submodule')
+def a_package_whose_init_imports_a_value_from_a_submodule(package):
+    """a package whose init imports a value from a submodule."""
+
+
+@given('symboldict w key to the value in the package')
+def symboldict_w_key_to_the_value_in_the_package(self):
+    """symboldict w key to the value in the package."""
+    self.sy = sd.SymbolDict(value=PKGNAME + '.VALUE')
+    assert self.sy.value == 1
+
+
+@given('a watcher having polled once')
+def a_watcher_having_polled_once(self):
+    """a watcher having polled once."""
+    self.reports = []
+    self.event = threading.Event()
+    def on_reload(report):
+        self.reports.append(report)
+        self.event.set()
+    self.watcher = sd.Watcher(interval=0.02, on_reload=on_reload)
+    self.watcher.watch(PKGNAME + '.sub')
+    assert self.watcher.poll() is None
+    yield
+    self.watcher.stop()
+
+
+@when('the watcher polls')
+def the_watcher_polls(self):
+    """the watcher polls."""
+    self.report = self.watcher.poll()
+
+
+@when(parsers.parse('the value is changed to {x:d} in the package init'))
+def the_value_is_changed_in_the_package_init(package, x):
+    """the value is changed in the package init."""
+    _write(package / '__init__.py', 'VALUE = {}\n'.format(x))
+
+
+@when(parsers.parse('the value is changed to {x:d} in the submodule'))
+def the_value_is_changed_in_the_submodule(package, x):
+    """the value is changed in the submodule."""
+    _write(package / 'sub.py', 'VALUE = {}\n'.format(x))
+
+
+@when('the package init is touched')
+def the_package_init_is_touched(package):
+    """the package init is touched."""
+    _write(package / '__init__.py', 'from .sub import VALUE\n')
+
+
+@when('the watcher thread is started')
+def the_watcher_thread_is_started(self):
+    """the watcher thread is started."""
+    self.watcher.start()
+
+
+@then('the report is none')
+def the_report_is_none(self):
+    """the report is none."""
+    assert self.report is None
+
+
+@then('the reloaded modules are the package')
+def the_reloaded_modules_are_the_package(self):
+    """the reloaded modules are the package."""
+    assert self.report['modules'] == [PKGNAME]
+    assert self.report['invalidated'] == [PKGNAME]
+
+
+@then('the reloaded modules are the submodule then the package')
+def the_reloaded_modules_are_the_submodule_then_the_package(self):
+    """the reloaded modules are the submodule then the package."""
+    assert self.report['modules'] == [PKGNAME + '.sub', PKGNAME]
+
+
+@then(parsers.parse('the value in the symboldict is {x:d}'))
+def the_value_in_the_symboldict_is(self, x):
+    """the value in the symboldict is x."""
+    assert self.sy.value == x
+
+
+@then('the report has reload time and latency')
+def the_report_has_reload_time_and_latency(self):
+    """the report has reload time and latency."""
+    assert self.report['errors'] == {}
+    assert self.report['reload_time'] >= 0.0
+    assert self.report['latency'] >= 0.0
+
+
+@then('the on reload callback receives a report')
+def the_on_reload_callback_receives_a_report(self):
+    """the on reload callback receives a report."""
+    assert self.event.wait(5.0)
+    assert self.reports[0]['modules'] == [PKGNAME]